@@ -0,0 +1,59 @@
+"""
+Micro-benchmark comparing child entity id enumeration used by `Entity._children`.
+
+Compares the original list-based duplicate filtering with the set-based
+generator that replaced it, for a collection whose type data is partly
+inherited from a parent collection.  Run with:
+
+    python children_scan.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+def children_list(coll_entity_ids, alt_entity_ids):
+    # Original logic: duplicate filtering using lists
+    parent_entity_ids = []
+    for ids in alt_entity_ids:
+        for eid in ids:
+            if eid not in parent_entity_ids:
+                parent_entity_ids.append(eid)
+    for entity_id in [f for f in parent_entity_ids if f not in coll_entity_ids] + coll_entity_ids:
+        yield entity_id
+    return
+
+def children_set(coll_entity_ids, alt_entity_ids):
+    # Revised logic: duplicate filtering using a set, no intermediate lists
+    seen_entity_ids = set(coll_entity_ids)
+    for ids in alt_entity_ids:
+        for entity_id in ids:
+            if entity_id not in seen_entity_ids:
+                seen_entity_ids.add(entity_id)
+                yield entity_id
+    for entity_id in coll_entity_ids:
+        yield entity_id
+    return
+
+def test_data(n):
+    # Current collection defines n entities, half of which are also defined by
+    # the parent collection; the parent collection also defines n/2 others.
+    coll_entity_ids   = [ "entity%06d"%i for i in range(n) ]
+    parent_entity_ids = [ "entity%06d"%i for i in range(n//2, n+n//2) ]
+    # Alternative entities include the current collection (cf. `get_alt_entities`)
+    return (coll_entity_ids, [coll_entity_ids, parent_entity_ids])
+
+if __name__ == "__main__":
+    for n in (500, 1000, 2000, 5000, 20000):
+        coll_ids, alt_ids = test_data(n)
+        t_set  = min(timeit.repeat(lambda: list(children_set(coll_ids, alt_ids)), number=1, repeat=3))
+        if n <= 5000:
+            # Original logic is too slow to run for larger collections
+            assert list(children_list(coll_ids, alt_ids)) == list(children_set(coll_ids, alt_ids))
+            t_list = min(timeit.repeat(lambda: list(children_list(coll_ids, alt_ids)), number=1, repeat=3))
+            t_list = "%8.4f s"%(t_list,)
+        else:
+            t_list = "%10s"%("(skipped)",)
+        print("%6d entities: list %s, set %8.4f s"%(n, t_list, t_set))
+
+# End.
@@ -0,0 +1,129 @@
+"""
+Benchmark comparing field renderer setup used by `FieldDescription`, which
+is performed for every field of a view or list each time it is displayed.
+
+Compares:
+
+-   the original logic, in which a new `FieldRenderer` object is created for 
+    every field description, looking up a renderer for each render mode and
+    creating a new label renderer class and object for each field.
+-   the revised logic, in which `FieldRenderer` objects and the per-mode
+    renderers they use are shared by all fields with the same render type and
+    value mode.
+
+Also compares creation of base renderers for all render types, with and without
+sharing of compiled wrapper templates.
+
+Field descriptions are created for all fields of the site-defined views, as
+seen from the test collection in the test site.  Run from this directory with:
+
+    python field_renderers.py
+
+NOTE: this replaces the test site data (as the Annalist test suite does), so
+should not be run while the test suite is running.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "annalist_site.settings.runtests")
+
+import django
+django.setup()
+
+from django.template                        import Template
+
+from annalist.identifiers                   import ANNAL
+
+from annalist.views.fields                  import field_description, find_renderers, render_fieldvalue
+from annalist.views.fields.field_renderer   import FieldRenderer
+from annalist.views.fields.find_renderers   import (
+    get_view_renderer, get_edit_renderer, 
+    get_label_view_renderer, get_label_edit_renderer, 
+    get_col_head_renderer, get_col_head_view_renderer, get_col_head_edit_renderer, 
+    get_col_view_renderer, get_col_edit_renderer
+    )
+
+from annalist.tests.init_tests              import (
+    init_annalist_test_site, init_annalist_test_coll
+    )
+
+VIEW_IDS = (
+    [ "Default_view", "Field_view", "Type_view", "List_view", "View_view"
+    , "Field_group_view", "Vocab_view", "User_view", "Collection_view"
+    ])
+
+def get_label_renderer_original(field_render_type, field_value_mode):
+    class _renderer(object):
+        def __init__(self):
+            pass
+        def render(self, context):
+            return context.get('field_label', "@@no 'field_label'@@")
+    return _renderer()
+
+class OriginalFieldRenderer(FieldRenderer):
+    # Original logic: look up renderers for each new field renderer object
+    def __init__(self, field_render_type, field_value_mode):
+        super(OriginalFieldRenderer, self).__init__(field_render_type, field_value_mode)
+        self._value_renderer    = (
+            { 'label':         get_label_renderer_original(field_render_type, field_value_mode)
+            , 'view':          get_view_renderer(         field_render_type, field_value_mode)
+            , 'edit':          get_edit_renderer(         field_render_type, field_value_mode)
+            , 'label_view':    get_label_view_renderer(   field_render_type, field_value_mode)
+            , 'label_edit':    get_label_edit_renderer(   field_render_type, field_value_mode)
+            , 'col_head':      get_col_head_renderer(     field_render_type, field_value_mode)
+            , 'col_head_view': get_col_head_view_renderer(field_render_type, field_value_mode)
+            , 'col_head_edit': get_col_head_edit_renderer(field_render_type, field_value_mode)
+            , 'col_view':      get_col_view_renderer(     field_render_type, field_value_mode)
+            , 'col_edit':      get_col_edit_renderer(     field_render_type, field_value_mode)
+            })
+        return
+    def mode(self):
+        return self._make_mode_renderer()
+
+def describe_view_fields(coll):
+    for view_id in VIEW_IDS:
+        view = coll.get_view(view_id)
+        for f in view[ANNAL.CURIE.view_fields]:
+            fd = field_description.field_description_from_view_field(coll, f, {'view': view})
+            fd['field_renderer'].mode()
+    return
+
+def time_fields(coll, number=10):
+    describe_view_fields(coll)      # Populate caches
+    return min(timeit.repeat(lambda: describe_view_fields(coll), number=number, repeat=3))/number
+
+def create_base_renderers():
+    find_renderers._field_renderers = None
+    find_renderers.init_field_renderers()
+    return
+
+def time_base_renderers(number=20):
+    return min(timeit.repeat(create_base_renderers, number=number, repeat=3))/number
+
+if __name__ == "__main__":
+    init_annalist_test_site()
+    coll = init_annalist_test_coll()
+    get_field_renderer_revised = field_description.get_field_renderer
+    field_description.get_field_renderer = OriginalFieldRenderer
+    t_original = time_fields(coll)
+    field_description.get_field_renderer = get_field_renderer_revised
+    t_revised  = time_fields(coll)
+    get_compiled_template_revised = render_fieldvalue.get_compiled_template
+    render_fieldvalue.get_compiled_template = Template
+    t_base_original = time_base_renderers()
+    render_fieldvalue.get_compiled_template = get_compiled_template_revised
+    t_base_revised  = time_base_renderers()
+    print("Field descriptions for %d views:"%(len(VIEW_IDS),))
+    print("    Original: %8.4f s"%(t_original,))
+    print("    Revised:  %8.4f s"%(t_revised,))
+    print("Base renderers for all render types:")
+    print("    Original (compile each template): %8.4f s"%(t_base_original,))
+    print("    Revised (shared templates):       %8.4f s"%(t_base_revised,))
+
+# End.
@@ -0,0 +1,67 @@
+"""
+Benchmark comparing entity data loading used by `EntityRoot._load_values`.
+
+Compares the original logic, which strips comment lines from every file before
+parsing it, with `util.load_json_data`, for all entity data files in a
+collection directory.  Run from this directory with:
+
+    python json_load.py [<collection directory>]
+
+The default collection directory is the installed site data collection.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+
+from annalist import util
+
+def data_files(coll_dir):
+    for (dirpath, dirnames, filenames) in os.walk(coll_dir):
+        for f in filenames:
+            if f.endswith(".jsonld") and not f.startswith("coll_context"):
+                yield os.path.join(dirpath, f)
+    return
+
+def load_original(paths):
+    for p in paths:
+        with open(p, "rt") as f:
+            json.load(util.strip_comments(f))
+    return
+
+def load_revised(paths):
+    for p in paths:
+        with open(p, "rb") as f:
+            util.load_json_data(f.read())
+    return
+
+if __name__ == "__main__":
+    coll_dir = (
+        sys.argv[1] if len(sys.argv) > 1 else
+        os.path.join(SRC_ROOT, "annalist/data/sitedata")
+        )
+    paths = list(data_files(coll_dir))
+    for p in paths:
+        with open(p, "rt") as f:
+            original = json.load(util.strip_comments(f))
+        with open(p, "rb") as f:
+            assert util.load_json_data(f.read()) == original, p
+    t_original = min(timeit.repeat(lambda: load_original(paths), number=5, repeat=3))/5
+    t_revised  = min(timeit.repeat(lambda: load_revised(paths),  number=5, repeat=3))/5
+    fast_json       = util.fast_json
+    util.fast_json  = None
+    t_revised_std   = min(timeit.repeat(lambda: load_revised(paths), number=5, repeat=3))/5
+    util.fast_json  = fast_json
+    print("%d files in %s"%(len(paths), coll_dir))
+    print("Original:                    %8.4f s"%(t_original,))
+    print("Revised (standard parser):   %8.4f s"%(t_revised_std,))
+    if fast_json:
+        print("Revised (accelerated parser):%8.4f s"%(t_revised,))
+
+# End.
@@ -0,0 +1,72 @@
+"""
+Benchmark comparing collection JSON-LD context generation used by
+`Collection.get_coll_jsonld_context`.
+
+Compares the original logic, which loads each field description referenced by
+a view or field group from storage every time it is referenced, with the
+revised logic that uses the collection field cache and resolves each distinct
+field once per context generated.  Context is generated for the installable
+collections `RDF_schema_defs` and `Bibliography_defs` (which inherits from
+`RDF_schema_defs`), installed in the test site.  Run from this directory with:
+
+    python jsonld_context.py
+
+NOTE: this replaces the test site data (as the Annalist test suite does), so
+should not be run while the test suite is running.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "annalist_site.settings.runtests")
+
+import django
+django.setup()
+
+from annalist.identifiers           import ANNAL
+from annalist.models.site           import Site
+from annalist.models.collection     import Collection
+from annalist.models.recordfield    import RecordField
+
+from annalist.tests.tests           import TestBaseUri, TestBaseDir
+from annalist.tests.init_tests      import (
+    init_annalist_test_site, install_annalist_named_coll
+    )
+
+def get_field_uri_jsonld_context_original(self, fid, get_field_context, field_contexts=None):
+    # Original logic: load field description for every reference
+    f = RecordField.load(self, fid, altscope="all")
+    if f is None:
+        return (None, None, None)
+    field_list = f.get(ANNAL.CURIE.field_fields, None)
+    return (f[ANNAL.CURIE.property_uri], get_field_context(f), field_list)
+
+def time_context(coll_id, number=5):
+    site = Site(TestBaseUri, TestBaseDir)
+    coll = Collection.load(site, coll_id, altscope="all")
+    coll.get_coll_jsonld_context()  # Populate caches
+    return min(timeit.repeat(coll.get_coll_jsonld_context, number=number, repeat=3))/number
+
+if __name__ == "__main__":
+    init_annalist_test_site()
+    for coll_id in ("RDF_schema_defs", "Bibliography_defs"):
+        install_annalist_named_coll(coll_id)
+    get_field_uri_jsonld_context_revised = Collection.get_field_uri_jsonld_context
+    for coll_id in ("RDF_schema_defs", "Bibliography_defs"):
+        Collection.get_field_uri_jsonld_context = get_field_uri_jsonld_context_original
+        t_original = time_context(coll_id)
+        c_original = Collection.load(Site(TestBaseUri, TestBaseDir), coll_id, altscope="all").get_coll_jsonld_context()
+        Collection.get_field_uri_jsonld_context = get_field_uri_jsonld_context_revised
+        t_revised  = time_context(coll_id)
+        c_revised  = Collection.load(Site(TestBaseUri, TestBaseDir), coll_id, altscope="all").get_coll_jsonld_context()
+        assert c_original == c_revised, coll_id
+        print("%s:"%(coll_id,))
+        print("    Original: %8.4f s"%(t_original,))
+        print("    Revised:  %8.4f s"%(t_revised,))
+
+# End.
@@ -0,0 +1,80 @@
+"""
+Benchmark comparing HTML rendering of entity lists, as performed by
+`EntityGenericListView.get`.
+
+Compares the original logic, which renders every row of the list for each
+request, with the revised logic that re-uses previously rendered rows from the
+list row cache (see `annalist.views.rendercache`).  A collection with the 
+indicated numbers of entities is created in the test site, and the default list 
+is displayed for an unauthenticated user.  Run from this directory with:
+
+    python list_rows.py
+
+NOTE: this replaces the test site data (as the Annalist test suite does), so
+should not be run while the test suite is running.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "annalist_site.settings.runtests")
+
+import django
+django.setup()
+
+from django.conf                            import settings
+from django.test                            import RequestFactory
+from django.contrib.auth.models             import AnonymousUser
+from django.contrib.sessions.backends.cache import SessionStore
+
+from annalist.identifiers                   import RDFS
+from annalist.models.recordtypedata         import RecordTypeData
+from annalist.models.entitydata             import EntityData
+from annalist.views.entitylist              import EntityGenericListView
+
+from annalist.tests.tests                   import TestHost, TestBasePath
+from annalist.tests.init_tests              import (
+    init_annalist_test_site, init_annalist_test_coll
+    )
+
+def list_html(list_path):
+    request         = RequestFactory().get(list_path, HTTP_HOST=TestHost)
+    request.user    = AnonymousUser()
+    request.session = SessionStore()
+    response = EntityGenericListView.as_view()(
+        request, coll_id="testcoll", type_id="testtype", list_id="Default_list"
+        )
+    assert response.status_code == 200, response.status_code
+    return response.content
+
+def time_list(list_path, number=3):
+    list_html(list_path)    # Populate caches
+    return min(timeit.repeat(lambda: list_html(list_path), number=number, repeat=3))/number
+
+if __name__ == "__main__":
+    init_annalist_test_site()
+    coll      = init_annalist_test_coll()
+    typedata  = RecordTypeData.load(coll, "testtype")
+    list_path = TestBasePath + "/c/testcoll/l/Default_list/testtype/"
+    n_created = 1
+    for n in (100, 500, 2000):
+        for i in range(n_created, n):
+            EntityData.create(typedata, "entity%06d"%i,
+                { RDFS.CURIE.label:     "Entity %d"%i
+                , RDFS.CURIE.comment:   "Comment for entity %d in benchmark collection"%i
+                })
+        n_created = n
+        settings.LIST_ROW_CACHE_SIZE = 0
+        t_original = time_list(list_path)
+        settings.LIST_ROW_CACHE_SIZE = 64*1024*1024
+        t_revised  = time_list(list_path)
+        print("%5d entities:"%(n,))
+        print("    Original:            %8.4f s"%(t_original,))
+        print("    Revised (cached):    %8.4f s"%(t_revised,))
+
+# End.
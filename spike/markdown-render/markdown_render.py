@@ -0,0 +1,72 @@
+"""
+Benchmark comparing Markdown rendering used by `text_markdown_view_renderer`
+and `AnnalistGenericView.render_html` (for help text).
+
+Compares the original logic, which calls `markdown.markdown` for every value
+rendered, with `rendercache.render_markdown`, which re-uses previously rendered
+HTML.  The Markdown text used is the `rdfs:comment` value of each entity in the
+site data, and the help text files in `annalist/views/help`.  Run from this
+directory with:
+
+    python markdown_render.py
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "annalist_site.settings.runtests")
+
+import django
+django.setup()
+
+import markdown
+
+from annalist                       import util
+from annalist.views.rendercache     import render_markdown
+
+def markdown_texts(data_dir):
+    for (dirpath, dirnames, filenames) in os.walk(data_dir):
+        for f in filenames:
+            if f.endswith(".jsonld") and not f.startswith("coll_context"):
+                with open(os.path.join(dirpath, f), "rb") as data:
+                    comment = util.load_json_data(data.read()).get("rdfs:comment", None)
+                if comment:
+                    yield comment
+    return
+
+def help_texts(help_dir):
+    for f in os.listdir(help_dir):
+        if f.endswith(".md"):
+            with open(os.path.join(help_dir, f), "r") as helpfile:
+                yield helpfile.read()
+    return
+
+def render_original(texts):
+    for t in texts:
+        markdown.markdown(t)
+    return
+
+def render_revised(texts):
+    for t in texts:
+        render_markdown(t)
+    return
+
+if __name__ == "__main__":
+    comments = list(markdown_texts(os.path.join(SRC_ROOT, "annalist/data/sitedata")))
+    helps    = list(help_texts(os.path.join(SRC_ROOT, "annalist/views/help")))
+    for (label, texts) in (("Entity comments", comments), ("Help texts", helps)):
+        for t in texts:
+            assert render_markdown(t) == markdown.markdown(t)
+        t_original = min(timeit.repeat(lambda: render_original(texts), number=5, repeat=3))/5
+        t_revised  = min(timeit.repeat(lambda: render_revised(texts),  number=5, repeat=3))/5
+        print("%s (%d values, %d characters):"%(label, len(texts), sum(map(len, texts))))
+        print("    Original: %8.4f s"%(t_original,))
+        print("    Revised:  %8.4f s"%(t_revised,))
+
+# End.
@@ -0,0 +1,102 @@
+"""
+Benchmark comparing Turtle data generation for entity lists, as used by
+`entityresourceaccess.turtle_resource_file` when a list is requested as Turtle.
+
+Compares:
+
+-   the original logic, in which rdflib reads the collection JSON-LD context
+    referenced by the list data.  Here, the context is read from a file (using
+    a file: base URL); when Annalist is serving data, it is read using an HTTP
+    request to the server, which takes longer.
+-   the revised logic, using the collection context held in memory.
+-   the revised logic, using Turtle data previously generated for the list.
+
+A collection with the indicated numbers of entities is created in the test site.
+Run from this directory with:
+
+    python turtle_list.py
+
+NOTE: this replaces the test site data (as the Annalist test suite does), so
+should not be run while the test suite is running.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import timeit
+
+SRC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../src/annalist_root")
+sys.path.insert(0, SRC_ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "annalist_site.settings.runtests")
+
+import django
+django.setup()
+
+from django.conf                            import settings
+
+from annalist                               import layout
+from annalist.identifiers                   import RDFS, ANNAL
+from annalist.models.recordtypedata         import RecordTypeData
+from annalist.models.entitydata             import EntityData
+from annalist.models.entityresourceaccess   import (
+    turtle_resource_file, jsonld_context_resources
+    )
+
+from annalist.tests.init_tests              import (
+    init_annalist_test_site, init_annalist_test_coll
+    )
+
+def list_data(coll, base_url):
+    # Cf. `EntityGenericListView.assemble_list_data`
+    entity_list = []
+    for e in RecordTypeData.load(coll, "testtype").child_entities(EntityData):
+        entityvals = e.get_values()
+        entityvals.pop('@context', None)
+        entityvals['@id'] = base_url + "testtype/" + e.get_id()
+        entity_list.append(entityvals)
+    return (
+        { '@id':            base_url + "testtype/"
+        , '@context':       [ { "@base": base_url }, base_url + layout.COLL_CONTEXT_FILE ]
+        , ANNAL.CURIE.entity_list:  entity_list
+        })
+
+def time_turtle(list_baseurl, jsondata, resource_info, number=3):
+    return min(timeit.repeat(
+        lambda: turtle_resource_file(list_baseurl, jsondata, resource_info).read(),
+        number=number, repeat=3
+        ))/number
+
+if __name__ == "__main__":
+    settings.TURTLE_DATA_CACHE_SIZE = 256*1024*1024
+    init_annalist_test_site()
+    coll      = init_annalist_test_coll()
+    typedata  = RecordTypeData.load(coll, "testtype")
+    n_created = 1
+    for n in (100, 500, 2000):
+        for i in range(n_created, n):
+            EntityData.create(typedata, "entity%06d"%i,
+                { RDFS.CURIE.label:     "Entity %d"%i
+                , RDFS.CURIE.comment:   "Comment for entity %d in benchmark collection"%i
+                })
+        n_created = n
+        # Original: context read by rdflib using its URL
+        file_baseurl    = "file://" + os.path.join(coll._entitydir, layout.COLL_BASE_REF)
+        jsondata        = list_data(coll, file_baseurl)
+        t_original      = time_turtle(file_baseurl+"testtype/", jsondata, {})
+        # Revised: context held in memory, and Turtle cache
+        coll_baseurl    = "http://test.example.com/testsite/c/testcoll/d/"
+        jsondata        = list_data(coll, coll_baseurl)
+        time.sleep(2)   # Allow for context file modification time resolution
+        resource_info   = { "resource_contexts": jsonld_context_resources(coll, coll_baseurl) }
+        settings.TURTLE_DATA_CACHE_SIZE = 0
+        t_revised       = time_turtle(coll_baseurl+"testtype/", jsondata, resource_info)
+        settings.TURTLE_DATA_CACHE_SIZE = 256*1024*1024
+        t_cached        = time_turtle(coll_baseurl+"testtype/", jsondata, resource_info)
+        print("%5d entities:"%(n,))
+        print("    Original (context from file): %8.4f s"%(t_original,))
+        print("    Revised (context in memory):  %8.4f s"%(t_revised,))
+        print("    Revised (cached Turtle):      %8.4f s"%(t_cached,))
+
+# End.
@@ -43,6 +43,9 @@ class AnnalistConfig(AppConfig):
         log.info("ACCESS_LOG_PATH:   "+settings.ACCESS_LOG_PATH)
         log.info("ERROR_LOG_PATH:    "+settings.ERROR_LOG_PATH)
         log.info("TRACE_FIELD_VALUE: "+str(settings.TRACE_FIELD_VALUE))
+        # Load help text files used when displaying pages
+        from annalist.views.rendercache import load_help_texts
+        log.info("HELP TEXTS:        "+",".join(sorted(load_help_texts())))
         log.info("== AnnalistConfig ready (apps.py)")
         return
 
@@ -260,6 +260,8 @@ ENTITY_DATA_TURTLE      = "entity_data.ttl"
 ENTITY_PROV_FILE        = "entity_prov.jsonld"
 ENTITY_LIST_FILE        = "entity_list.jsonld"  # Entity list as JSON resource
 ENTITY_LIST_TURTLE      = "entity_list.ttl"     # Entity list as Turtle resource
+ENTITY_LIST_NTRIPLES    = "entity_list.nt"      # Entity list as N-Triples resource
+ENTITY_LIST_NDJSON      = "entity_list.ndjson"  # Entity list as newline-delimited JSON-LD
 COLL_BASE_ENTITY_REF    = "%(type_id)s/%(id)s"
 ENTITY_COLL_BASE_REF    = "../../"
 #@@ NOTE: @base ignored when loading external context - is this correct?
@@ -270,6 +272,10 @@ ENTITY_OLD_DATA_FILE    = "entity-data.jsonld"
 # Other symbols
 TASK_TYPEID             = "_task"               # task id
 INITIAL_VALUES_ID       = "_initial_values"     # reserved id used for initial values of new entity
+ENTITY_INDEX_FILE       = ".%(entityfile)s.index"   # child entity index (name is not a valid id)
+COLL_GENERATION_FILE        = ".generation"         # collection update generation
+COLL_CONFIG_GENERATION_FILE = ".config_generation"  # collection configuration generation
+COLL_SEARCH_INDEX_FILE      = ".search_index.sqlite3"   # collection full-text search index
 
 # Lists of directory names for collection migration, etc:
 DATA_DIRS_CURR_PREV = (
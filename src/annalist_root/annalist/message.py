@@ -37,6 +37,8 @@ TURTLE_SERIALIZE_ERROR        = "Problem generating Turtle serialization from da
 TURTLE_SERIALIZE_REASON       = "Internal description of error"
 JSONLD_PARSE_ERROR            = "Problem pasring JSON-LD data (maybe JSON-LD context)"
 JSONLD_PARSE_REASON           = "Internal description of error"
+NTRIPLES_SERIALIZE_ERROR      = "Problem generating N-Triples serialization from data"
+NTRIPLES_SERIALIZE_REASON     = "Internal description of error"
 
 INVALID_OPERATION_ATTEMPTED   = "Attempt to peform invalid operation"
 INVALID_TYPE_CHANGE           = "Change of entity type to or from '_type' is not supported"
@@ -123,6 +125,10 @@ COLL_PARENT_NOT_EXIST         = "Collection %(id)s references non-existent paren
 COLL_RESOURCE_NOT_DEFINED     = "Resource %(ref)s is not recogized for collection %(id)s"
 COLL_RESOURCE_NOT_EXIST       = "Resource %(ref)s for collection %(id)s does not exist"
 COLL_MIGRATE_DIR_FAILED       = "Collection %(id)s migration %(old_path)s -> %(new_path)s failed. (%(exc)s)"
+COLL_IMPORT_NOT_ENTITY        = "Collection %(id)s import item %(item)d is not an entity description"
+COLL_IMPORT_ENTITY_ID         = "Collection %(id)s import item %(item)d has missing or invalid type or entity identifier"
+COLL_IMPORT_ENTITY_TYPE       = "Collection %(id)s import item %(item)d: type %(type_id)s is not defined or cannot be imported"
+COLL_IMPORT_ENTITY_FAILED     = "Collection %(id)s import of %(type_id)s/%(entity_id)s failed. (%(exc)s)"
 
 ANNALIST_USER_ID              = "Problem with user identifier"
 ANNALIST_USER_ID_INVALID      = "The user identifier is missing or not a valid identifier"
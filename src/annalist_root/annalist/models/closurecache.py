@@ -125,12 +125,16 @@ class ClosureCache(object):
 
         v2 in fwd_closure(v1) and v3 in fwd_closure(v2) => v3 in fwd_closure(v1)
     """
-    def __init__(self, coll_id, rel_uri):
+    def __init__(self, coll_id, rel_uri, keep_values=False):
         """
         Initialize.
 
         coll_id     Id of collection with which relation closure is scoped
         rel         URI of relation over which closure is calculated
+        keep_values if True, any relation values previously saved in the object 
+                    cache for this collection and relation (e.g. by another server
+                    process using a shared object cache) are retained.  The caller
+                    is responsible for ensuring that retained values are current.
 
         The parameters are provided for information about the scope of the closure, 
         and are used to access saved cache values, but do not of themselves affect the 
@@ -138,8 +142,8 @@ class ClosureCache(object):
 
         The set of values over which the relation is defined is represented by 
         dictionaries of direct forward and reverse mappings from members of the set.
-        Initializes these to empty dictionaries, corresponding to an empty set of
-        values.
+        Initializes these to empty dictionaries (unless values are kept), 
+        corresponding to an empty set of values.
 
         The invariants are all trivially true for an emty value set.
         """
@@ -148,8 +152,20 @@ class ClosureCache(object):
         self._rel_uri   = rel_uri
         self._key       = make_cache_key("ClosureCache", coll_id, rel_uri)
         self._cache     = get_cache(self._key)
-        self._cache.set("fwd", {})
-        self._cache.set("rev", {})
+        with self._cache.access("fwd", "rev") as rel:
+            if not keep_values:
+                rel.clear()
+            rel.setdefault("fwd", {})
+            rel.setdefault("rev", {})
+        return
+
+    def clear(self):
+        """
+        Reset to an empty relation.
+        """
+        with self._cache.access("fwd", "rev") as rel:
+            rel["fwd"] = {}
+            rel["rev"] = {}
         return
 
     def remove_cache(self):
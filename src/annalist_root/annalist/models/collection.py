@@ -27,6 +27,8 @@ import os.path
 import shutil
 import json
 import datetime
+import threading
+import contextlib
 from collections                    import OrderedDict
 
 from packaging.version              import Version
@@ -49,6 +51,12 @@ from annalist.models.annalistuser           import AnnalistUser
 from annalist.models.collectiontypecache    import CollectionTypeCache
 from annalist.models.collectionfieldcache   import CollectionFieldCache
 from annalist.models.collectionvocabcache   import CollectionVocabCache
+from annalist.models.collectionviewcache    import CollectionViewCache
+from annalist.models.collectionlistcache    import CollectionListCache
+from annalist.models.collectiongeneration   import (
+    update_coll_generation, coll_config_updated
+    )
+from annalist.models.searchindex            import get_search_index
 from annalist.models.recordtype             import RecordType
 from annalist.models.recordview             import RecordView
 from annalist.models.recordlist             import RecordList
@@ -72,6 +80,14 @@ from annalist.models.rendertypeinfo         import (
 type_cache  = CollectionTypeCache()
 field_cache = CollectionFieldCache()
 vocab_cache = CollectionVocabCache()
+view_cache  = CollectionViewCache()
+list_cache  = CollectionListCache()
+
+threadcontexts = threading.local()  # Deferred JSON-LD context regeneration for the 
+                                    # current thread, keyed by collection directory
+
+contextdocslock = threading.Lock()  # Interlocks access to JSON-LD context documents
+contextdocs     = {}                # JSON-LD context documents read, keyed by file path
 
 #   ---------------------------------------------------------------------------
 #
@@ -114,6 +130,7 @@ class Collection(Entity):
             parentsite.site_data_collection()
             )
         super(Collection, self).__init__(parentsite, coll_id, altparent=self._parentcoll)
+        self._alt_entities = {}     # Resolved alternative parent lists, keyed by altscope
         return
 
     def _migrate_values(self, collmetadata):
@@ -129,11 +146,38 @@ class Collection(Entity):
 
     def flush_collection_caches(self):
         """
-        Flush all caches associated with the current collection
+        Flush all caches associated with the current collection, and record 
+        a configuration update so that other server processes also flush their 
+        caches for the collection (see `check_collection_caches`).
+        """
+        self._flush_local_caches()
+        self._update_config_generation()
+        return
+
+    def check_collection_caches(self):
+        """
+        Flush caches associated with the current collection if its configuration, 
+        or that of a collection from which it inherits definitions, has been updated 
+        (e.g. by another server process) since last checked by the current process.
+
+        This is called when processing of a request for the collection is started.
+        """
+        updated = coll_config_updated(self)
+        if updated:
+            self._flush_local_caches()
+            for coll in updated:
+                coll._flush_local_caches()
+        return
+
+    def _flush_local_caches(self):
+        """
+        Flush caches associated with the current collection in the current process.
         """
         type_cache.flush_cache(self)
         field_cache.flush_cache(self)
         vocab_cache.flush_cache(self)
+        view_cache.flush_cache(self)
+        list_cache.flush_cache(self)
         return
 
     @classmethod
@@ -144,8 +188,35 @@ class Collection(Entity):
         type_cache.flush_all()
         field_cache.flush_all()
         vocab_cache.flush_all()
+        view_cache.flush_all()
+        list_cache.flush_all()
         return
 
+    def _update_generation(self):
+        """
+        Record that the current collection has been updated.
+        """
+        update_coll_generation(self)
+        return
+
+    def _update_config_generation(self):
+        """
+        Record that the configuration of the current collection has been updated.
+
+        The collection search index is updated to record that it remains complete 
+        (see `SearchIndex.updating_collection`), as collection entity values are
+        not changed.
+        """
+        with self._child_search_index().updating_collection():
+            update_coll_generation(self, config=True)
+        return
+
+    def _child_search_index(self):
+        """
+        Returns the full-text search index for entities in the current collection.
+        """
+        return get_search_index(self)
+
     # Site
 
     def get_site(self):
@@ -206,6 +277,34 @@ class Collection(Entity):
             self[ANNAL.CURIE.default_view_entity] = altparent.get(ANNAL.CURIE.default_view_entity, None)
         return parents
 
+    def get_alt_entities(self, altscope=None):
+        """
+        Returns a list of alternative collections to the current collection to search 
+        for possible child entities.  See `Entity.get_alt_entities` for details.
+
+        The resolved list for each altscope value is saved with the collection object,
+        and is re-used while the chain of alternative parents (i.e. `annal:inherit_from` 
+        values) from the current collection is unchanged.
+        """
+        chain = self._alt_parent_chain()
+        (alt_chain, alt_parents) = self._alt_entities.get(altscope, (None, None))
+        if alt_chain != chain:
+            alt_parents = super(Collection, self).get_alt_entities(altscope=altscope)
+            self._alt_entities[altscope] = (chain, alt_parents)
+        return list(alt_parents)
+
+    def _alt_parent_chain(self):
+        """
+        Returns a tuple of the alternative parent collections reached by following
+        alternative parent links from the current collection.
+        """
+        chain = []
+        p     = self._altparent
+        while p and (p is not self) and (p not in chain):
+            chain.append(p)
+            p = p._altparent
+        return tuple(chain)
+
     @classmethod
     def create(cls, parent, coll_id, coll_meta):
         """
@@ -426,6 +525,7 @@ class Collection(Entity):
         log.debug("Collection.cache_add_type %s in %s"%(type_entity.get_id(), self.get_id()))
         type_cache.remove_type(self, type_entity.get_id())
         type_cache.set_type(self, type_entity)
+        self._update_config_generation()
         return
 
     def cache_get_type(self, type_id):
@@ -453,6 +553,7 @@ class Collection(Entity):
         Remove type from type cache.
         """
         type_cache.remove_type(self, type_id)
+        self._update_config_generation()
         return
 
     def cache_get_all_type_ids(self, altscope="all"):
@@ -547,11 +648,7 @@ class Collection(Entity):
         """
         Generator enumerates and returns record views that may be stored
         """
-        for f in self._children(RecordView, altscope=altscope):
-            v = self.get_view(f)
-            if v and v.get_id() != layout.INITIAL_VALUES_ID:
-                yield v
-        return
+        return view_cache.get_all_views(self, altscope=altscope)
 
     def add_view(self, view_id, view_meta):
         """
@@ -575,8 +672,7 @@ class Collection(Entity):
 
         returns a RecordView object for the identified view, or None.
         """
-        v = RecordView.load(self, view_id, altscope="all")
-        return v
+        return self.cache_get_view(view_id)
 
     def remove_view(self, view_id):
         """
@@ -589,6 +685,48 @@ class Collection(Entity):
         s = RecordView.remove(self, view_id)
         return s
 
+    def cache_add_view(self, view_entity):
+        """
+        Add or update view information in view cache.
+        """
+        log.debug("Collection.cache_add_view %s in %s"%(view_entity.get_id(), self.get_id()))
+        view_cache.remove_view(self, view_entity.get_id())
+        view_cache.set_view(self, view_entity)
+        self._update_config_generation()
+        return
+
+    def cache_get_view(self, view_id):
+        """
+        Retrieve view from cache.
+
+        Returns view entity if found, otherwise None.
+        """
+        v = view_cache.get_view(self, view_id)
+        # Was it previously created but not cached?
+        if not v and RecordView.exists(self, view_id, altscope="all"):
+            msg = (
+                "Collection.get_view %s present but not cached for collection %s"%
+                (view_id, self.get_id())
+                )
+            log.warning(msg)
+            v = RecordView.load(self, view_id, altscope="all")
+            view_cache.set_view(self, v)
+        return v
+
+    def cache_remove_view(self, view_id):
+        """
+        Remove view from view cache.
+        """
+        view_cache.remove_view(self, view_id)
+        self._update_config_generation()
+        return
+
+    def cache_get_all_view_ids(self, altscope="all"):
+        """
+        Iterator over view ids of views stored in the current collection.
+        """
+        return view_cache.get_all_view_ids(self, altscope=altscope)
+
     def set_default_view(self, view_id, type_id, entity_id):
         """
         Set and save the default list to be displayed for the current collection.
@@ -615,11 +753,7 @@ class Collection(Entity):
         """
         Generator enumerates and returns record lists that may be stored
         """
-        for f in self._children(RecordList, altscope=altscope):
-            l = self.get_list(f)
-            if l and l.get_id() != layout.INITIAL_VALUES_ID:
-                yield l
-        return
+        return list_cache.get_all_lists(self, altscope=altscope)
 
     def add_list(self, list_id, list_meta):
         """
@@ -643,8 +777,7 @@ class Collection(Entity):
 
         returns a RecordList object for the identified list, or None.
         """
-        l = RecordList.load(self, list_id, altscope="all")
-        return l
+        return self.cache_get_list(list_id)
 
     def remove_list(self, list_id):
         """
@@ -657,6 +790,48 @@ class Collection(Entity):
         s = RecordList.remove(self, list_id)
         return s
 
+    def cache_add_list(self, list_entity):
+        """
+        Add or update list information in list cache.
+        """
+        log.debug("Collection.cache_add_list %s in %s"%(list_entity.get_id(), self.get_id()))
+        list_cache.remove_list(self, list_entity.get_id())
+        list_cache.set_list(self, list_entity)
+        self._update_config_generation()
+        return
+
+    def cache_get_list(self, list_id):
+        """
+        Retrieve list from cache.
+
+        Returns list entity if found, otherwise None.
+        """
+        l = list_cache.get_list(self, list_id)
+        # Was it previously created but not cached?
+        if not l and RecordList.exists(self, list_id, altscope="all"):
+            msg = (
+                "Collection.get_list %s present but not cached for collection %s"%
+                (list_id, self.get_id())
+                )
+            log.warning(msg)
+            l = RecordList.load(self, list_id, altscope="all")
+            list_cache.set_list(self, l)
+        return l
+
+    def cache_remove_list(self, list_id):
+        """
+        Remove list from list cache.
+        """
+        list_cache.remove_list(self, list_id)
+        self._update_config_generation()
+        return
+
+    def cache_get_all_list_ids(self, altscope="all"):
+        """
+        Iterator over list ids of lists stored in the current collection.
+        """
+        return list_cache.get_all_list_ids(self, altscope=altscope)
+
     def set_default_list(self, list_id):
         """
         Set and save the default list to be displayed for the current collection.
@@ -673,7 +848,7 @@ class Collection(Entity):
         Return the default list to be displayed for the current collection.
         """
         list_id = self.get(ANNAL.CURIE.default_list, None)
-        if list_id and not RecordList.exists(self, list_id, altscope="all"):
+        if list_id and not self.get_list(list_id):
             log.warning(
                 "Default list %s for collection %s does not exist"%
                 (list_id, self.get_id())
@@ -696,6 +871,7 @@ class Collection(Entity):
         log.debug("Collection.cache_add_field %s in %s"%(field_entity.get_id(), self.get_id()))
         field_cache.remove_field(self, field_entity.get_id())
         field_cache.set_field(self, field_entity)
+        self._update_config_generation()
         return
 
     def cache_get_field(self, field_id):
@@ -721,6 +897,7 @@ class Collection(Entity):
         Remove field from field cache.
         """
         field_cache.remove_field(self, field_id)
+        self._update_config_generation()
         return
 
     def cache_get_all_field_ids(self, altscope="all"):
@@ -822,16 +999,52 @@ class Collection(Entity):
 
     # JSON-LD context data
 
+    @contextlib.contextmanager
+    def deferring_jsonld_context(self):
+        """
+        Context manager used when saving a number of configuration entities (e.g. 
+        views and fields), which defers regeneration of the collection JSON-LD 
+        context until the enclosed block exits, so that it is generated at most 
+        once for all of the updates.  May be nested, in which case the context is
+        generated when the outermost block exits.
+
+            with coll.deferring_jsonld_context():
+                # save configuration entities
+        """
+        deferred = getattr(threadcontexts, "deferred", None)
+        if deferred is None:
+            deferred = {}
+            threadcontexts.deferred = deferred
+        coll_key = os.path.normpath(self._entitydir)
+        if coll_key in deferred:
+            yield
+            return
+        deferred[coll_key] = False
+        try:
+            yield
+        finally:
+            if deferred.pop(coll_key):
+                self.generate_coll_jsonld_context()
+        return
+
     def generate_coll_jsonld_context(self, flags=None):
         """
         (Re)generate JSON-LD context description for the current collection.
 
+        If called while regeneration is deferred (see `deferring_jsonld_context`),
+        the context is generated when the deferring block exits.
+
         Returns list of errors, or empty list.
         """
         errs = []
         if flags and ("nocontext" in flags):
             # Skip processing if "nocontext" flag provided
             return
+        deferred = getattr(threadcontexts, "deferred", None)
+        coll_key = os.path.normpath(self._entitydir)
+        if deferred and (coll_key in deferred):
+            deferred[coll_key] = True
+            return errs
         # log.info("Generating context for collection %s"%(self.get_id()))
         # Build context data
         context      = self.get_coll_jsonld_context()
@@ -868,6 +1081,39 @@ class Collection(Entity):
                 readme_io.write(README_text)
         return errs
 
+    def get_coll_jsonld_context_document(self):
+        """
+        Returns the JSON-LD context document most recently generated for the current
+        collection, as a pair of a stamp value and the document content, or None if 
+        the context document cannot be read.
+
+        The stamp value is a tuple of the modification time (in nanoseconds) and size
+        of the context file.  Documents read are retained in memory, and re-read only
+        if the context file is changed.  The document returned is shared, and must 
+        not be modified by the caller.
+        """
+        (body_dir, body_file) = self._dir_path()
+        context_path = os.path.join(
+            body_dir, layout.META_COLL_BASE_REF, layout.COLL_CONTEXT_FILE
+            )
+        try:
+            st = os.stat(context_path)
+            context_stamp = (st.st_mtime_ns, st.st_size)
+            with contextdocslock:
+                context_doc = contextdocs.get(context_path, None)
+            if (context_doc is None) or (context_doc[0] != context_stamp):
+                with open(context_path, "rt") as context_io:
+                    context_doc = (context_stamp, json.load(context_io))
+                with contextdocslock:
+                    contextdocs[context_path] = context_doc
+        except (OSError, ValueError) as e:
+            # Context file missing, or partially written
+            log.warning(
+                "Collection.get_coll_jsonld_context_document %s: %s"%(context_path, e)
+                )
+            return None
+        return context_doc
+
     def get_coll_jsonld_context(self):
         """
         Return dictionary containing context structure for collection.
@@ -929,13 +1175,14 @@ class Collection(Entity):
                         errs.append(msg)
                     context[vid] = v[ANNAL.CURIE.uri]
         # Scan view fields and generate context data for property URIs used
+        field_contexts = {}     # Field property URIs and contexts, keyed by field id
         for v in self.child_entities(RecordView, altscope="all"):
             view_fields = v.get(ANNAL.CURIE.view_fields, [])
             for fref in view_fields:
                 fid  = extract_entity_id(fref[ANNAL.CURIE.field_id])
                 vuri = fref.get(ANNAL.CURIE.property_uri, None)
                 furi, fcontext, field_list = self.get_field_uri_jsonld_context(
-                    fid, self.get_field_jsonld_context
+                    fid, self.get_field_jsonld_context, field_contexts
                     )
                 if fcontext is not None:
                     fcontext['vid'] = v.get_id()
@@ -949,7 +1196,7 @@ class Collection(Entity):
                         subfid  = extract_entity_id(subfref[ANNAL.CURIE.field_id])
                         subfuri = subfref.get(ANNAL.CURIE.property_uri, None)
                         furi, fcontext, field_list = self.get_field_uri_jsonld_context(
-                            subfid, self.get_field_jsonld_context
+                            subfid, self.get_field_jsonld_context, field_contexts
                             )
                         if fcontext is not None:
                             fcontext['fid']    = fid
@@ -967,7 +1214,7 @@ class Collection(Entity):
                 fid  = extract_entity_id(gref[ANNAL.CURIE.field_id])
                 guri = gref.get(ANNAL.CURIE.property_uri, None)
                 furi, fcontext, field_list = self.get_field_uri_jsonld_context(
-                    fid, self.get_field_jsonld_context
+                    fid, self.get_field_jsonld_context, field_contexts
                     )
                 if fcontext is not None:
                     fcontext['gid'] = g.get_id()
@@ -978,7 +1225,7 @@ class Collection(Entity):
             context['@errs'] = errs
         return context
 
-    def get_field_uri_jsonld_context(self, fid, get_field_context):
+    def get_field_uri_jsonld_context(self, fid, get_field_context, field_contexts=None):
         """
         Access field description, and return field property URI and appropriate 
         property description for JSON-LD context.
@@ -992,12 +1239,29 @@ class Collection(Entity):
         If no context should be generated for the field URI, returns (uri, None, field_list)
 
         The field list returned is 'None' if there is no contained list of fields.
+
+        field_contexts  if supplied, is a dictionary in which results are saved for 
+                        each field id, so that each field description is accessed 
+                        just once when generating the context for a collection.
+                        A new copy of any saved context information is returned.
         """
-        f = RecordField.load(self, fid, altscope="all")
+        if (field_contexts is not None) and (fid in field_contexts):
+            furi, fcontext, field_list = field_contexts[fid]
+            return (furi, None if fcontext is None else dict(fcontext), field_list)
+        f = self.cache_get_field(fid) if valid_id(fid, reserved_ok=True) else None
         if f is None:
-            return (None, None, None)
-        field_list = f.get(ANNAL.CURIE.field_fields, None)
-        return (f[ANNAL.CURIE.property_uri], get_field_context(f), field_list)
+            furi, fcontext, field_list = (None, None, None)
+        else:
+            # Cached values of a field saved by the current process may not have 
+            # format migrations applied (cf. `RecordField.load`)
+            fvals      = f._migrate_values(dict(f.get_values()))
+            furi       = fvals[ANNAL.CURIE.property_uri]
+            fcontext   = get_field_context(fvals)
+            field_list = fvals.get(ANNAL.CURIE.field_fields, None)
+        if field_contexts is not None:
+            field_contexts[fid] = (furi, fcontext, field_list)
+            fcontext = None if fcontext is None else dict(fcontext)
+        return (furi, fcontext, field_list)
 
     def set_field_uri_jsonld_context(self, puri, field_id, fcontext, property_contexts):
         """
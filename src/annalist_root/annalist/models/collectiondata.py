@@ -20,16 +20,20 @@ import datetime
 
 from django.conf import settings
 
+from utils.py3porting               import is_string
+
 from annalist                       import layout
 from annalist                       import message
 from annalist.identifiers           import ANNAL
-from annalist.util                  import replacetree, updatetree
+from annalist.util                  import valid_id, make_type_entity_id, replacetree, updatetree
 from annalist.exceptions            import Annalist_Error
 
 from annalist.models.site           import Site
 from annalist.models.entityfinder   import EntityFinder
 from annalist.models.entitytypeinfo import EntityTypeInfo, TYPE_CLASS_MAP
 from annalist.models.recordtypedata import RecordTypeData
+from annalist.models.searchindex    import get_search_index
+from annalist.models.entityresourceaccess import jsonld_context_resources
 
 def initialize_coll_data(src_data_dir, tgt_coll):
     """
@@ -85,6 +89,149 @@ def copy_coll_data(src_coll, tgt_coll):
         msgs += new_entity._copy_entity_files(e)
     return msgs
 
+def read_entity_values(data_io):
+    """
+    Iterates over entity values read from the supplied text stream, which contains
+    a JSON-LD array of entity descriptions (or a JSON-LD object with a "@graph" list
+    of entity descriptions), or newline-delimited JSON with one entity description
+    on each line.
+
+    Raises ValueError if the stream data cannot be parsed.
+    """
+    lines = iter(data_io)
+    for line in lines:
+        if line.strip():
+            break
+    else:
+        return
+    if line.lstrip().startswith("{"):
+        try:
+            values = json.loads(line)
+        except ValueError:
+            values = None
+        if isinstance(values, dict) and ("@graph" not in values):
+            # Newline-delimited JSON
+            yield values
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+            return
+    data = json.loads(line + "".join(lines))
+    if isinstance(data, dict):
+        data = data.get("@graph", [data])
+    for values in data:
+        yield values
+    return
+
+def import_coll_entities(coll, entities):
+    """
+    Create or update entities in the specified collection using a sequence of 
+    entity descriptions (e.g. from `read_entity_values`).
+
+    Each entity is saved as it is read, but updating collection caches (other than
+    for types, which are needed for importing entities of those types) and the 
+    collection JSON-LD context is deferred until all entities have been saved (or
+    an exception is raised, e.g. by an error reading the entity descriptions), and
+    search index updates are committed in groups (see `SearchIndex.updating_batch`).
+
+    coll        is the collection into which entities are imported.
+    entities    is an iterator over entity descriptions, each of which is a 
+            dictionary of entity values that includes `annal:type_id` and 
+            `annal:id` values identifying the entity to be created or updated.
+
+    returns     a pair (count, errs), where `count` is the number of entities
+            saved, and `errs` is a list of error messages for entity 
+            descriptions that could not be imported.
+    """
+    log.info("Import entities to Annalist collection %s"%(coll.get_id()))
+    count     = 0
+    errs      = []
+    typeinfos = {}      # Type information, and parent directory for each type used
+    index     = get_search_index(coll)
+    with index.updating_batch():
+        try:
+            for item, values in enumerate(entities, start=1):
+                msg_vals = { "id": coll.get_id(), "item": item }
+                if not isinstance(values, dict):
+                    errs.append(message.COLL_IMPORT_NOT_ENTITY%msg_vals)
+                    continue
+                type_id   = values.get(ANNAL.CURIE.type_id, None)
+                entity_id = values.get(ANNAL.CURIE.id,      None)
+                if not ( is_string(type_id)   and valid_id(type_id) and 
+                         is_string(entity_id) and valid_id(entity_id) ):
+                    errs.append(message.COLL_IMPORT_ENTITY_ID%msg_vals)
+                    continue
+                msg_vals.update(type_id=type_id, entity_id=entity_id)
+                if type_id not in typeinfos:
+                    # Create type data directory once for each type used
+                    typeinfos[type_id] = None
+                    if (type_id != layout.COLL_TYPEID) and coll.get_type(type_id):
+                        typeinfos[type_id] = EntityTypeInfo(coll, type_id, create_typedata=True)
+                typeinfo = typeinfos[type_id]
+                if not typeinfo:
+                    errs.append(message.COLL_IMPORT_ENTITY_TYPE%msg_vals)
+                    continue
+                values = dict(values)
+                typeinfo.set_type_uris(values)
+                typeinfo.set_entity_uri(entity_id, values)
+                try:
+                    e = typeinfo.entityclass._child_init(typeinfo.entityparent, entity_id)
+                    e.set_values(values)
+                    if type_id == layout.TYPE_TYPEID:
+                        # Type cache is used for any entities of the new type
+                        e._save(post_update_flags={"nocontext"})
+                        typeinfos.pop(entity_id, None)
+                    else:
+                        e._save(post_update_flags={"nocontext", "nocache"})
+                except (Annalist_Error, ValueError, IOError, OSError) as err:
+                    msg_vals.update(exc=err)
+                    errs.append(message.COLL_IMPORT_ENTITY_FAILED%msg_vals)
+                    continue
+                count += 1
+        finally:
+            if count:
+                coll.flush_collection_caches()
+                coll.generate_coll_jsonld_context()
+    return (count, errs)
+
+def export_coll_entities(coll, coll_baseurl, export_stream):
+    """
+    Iterates over strings containing data for all entities stored in the specified
+    collection (excluding those inherited from other collections), generated by a
+    supplied list resource stream function.
+
+    Entities of each type are read as the data is returned, so the entity data for
+    the complete collection is not held in memory.
+
+    coll            is the collection whose entities are exported.
+    coll_baseurl    is the base URL for collection data, relative to which entity
+                    URLs and the collection JSON-LD context are referenced.
+    export_stream   is a generator function that returns data for a list of 
+                    entities (e.g. `ntriples_resource_stream` or 
+                    `ndjson_resource_stream` from `annalist.models.entityresourceaccess`).
+    """
+    log.info("Export entities from Annalist collection %s"%(coll.get_id()))
+    finder = EntityFinder(coll)
+    def entity_values():
+        for e in finder.get_all_types_entities(
+                finder.get_collection_type_ids(altscope="all"), None, None
+                ):
+            type_id = e.get_type_id()
+            if type_id == layout.COLL_TYPEID:
+                continue
+            entityvals = e.get_values().copy()
+            entityvals.pop("@context", None)
+            entityvals["@id"] = make_type_entity_id(type_id, e.get_id())
+            yield entityvals
+        return
+    jsondata = (
+        { "@id":                    coll_baseurl
+        , "@context":               [ { "@base": coll_baseurl }, layout.COLL_CONTEXT_FILE ]
+        , ANNAL.CURIE.entity_list:  entity_values()
+        })
+    resource_info = { "resource_contexts": jsonld_context_resources(coll, coll_baseurl) }
+    return export_stream(coll_baseurl, jsondata, resource_info)
+
 def migrate_collection_dir(coll, prev_dir, curr_dir):
     """
     Migrate (rename) a single directory belonging to the indicated collection.
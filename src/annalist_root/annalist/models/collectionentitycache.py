@@ -18,6 +18,7 @@ from annalist.exceptions            import Annalist_Error
 from annalist.identifiers           import ANNAL, RDFS
 
 from annalist.models.objectcache    import get_cache, remove_cache # , remove_matching_caches
+from annalist.models.collectiongeneration   import get_coll_config_generations
 
 #   ---------------------------------------------------------------------------
 # 
@@ -28,6 +29,10 @@ from annalist.models.objectcache    import get_cache, remove_cache # , remove_ma
 def make_cache_key(cache_type, entity_type_id, coll_id):
     return (cache_type, entity_type_id, coll_id)
 
+#   Key used in entities_by_id cache to record the collection configuration
+#   generation values when the cache was populated (not a valid entity id)
+LOADED_GENERATION_KEY = "@loaded_generation"
+
 def match_cache_key_unused_(cache_types, entity_cls):
     def match_fn(cachekey):
         return (cachekey[0] in cache_types) and (cachekey[1] == entity_cls._entitytypeid)
@@ -166,15 +171,40 @@ class CollectionEntityCacheObject(object):
             "nosite" - collection-level only: used for listing entities from just
                 collections.  Used when cacheing data, where site data is assumed 
                 to be invariant, hence no need to re-load.
+
+        Cached values may have been saved previously by another cache object
+        (e.g. in another server process, when using a shared object cache), in
+        which case they are used only if the configuration generation of the
+        collection and the collections it inherits from is unchanged since the
+        values were loaded.  A generation value of zero indicates that no updates
+        have been recorded for a collection, and previously cached values are then
+        not used.
         """
         scope_name = "nosite" if self._site_cache else "all"
         if self._entities_by_id is None:
             self._entities_by_id      = get_cache(self._make_cache_key("entities_by_id"))
             self._entity_ids_by_uri   = get_cache(self._make_cache_key("entity_ids_by_uri"))
             self._entity_ids_by_scope = get_cache(self._make_cache_key("entity_ids_by_scope"))
-            for entity_id in coll._children(self._entity_cls, altscope=scope_name):
-                t = self._entity_cls.load(coll, entity_id, altscope=scope_name)
-                self._load_entity(coll, t)
+            generations = get_coll_config_generations(coll)
+            loaded      = self._entities_by_id.get(LOADED_GENERATION_KEY, None)
+            if (0 in generations) or (loaded != generations):
+                self._flush_entities()
+                for entity_id in coll._children(self._entity_cls, altscope=scope_name):
+                    t = self._entity_cls.load(coll, entity_id, altscope=scope_name)
+                    self._load_entity(coll, t)
+                self._entities_by_id.set(LOADED_GENERATION_KEY, generations)
+        return
+
+    def _flush_entities(self):
+        """
+        Discard all cached entity values.
+
+        Subclasses that cache additional values derived from entities should
+        override this method to also discard those values.
+        """
+        self._entities_by_id.flush()
+        self._entity_ids_by_uri.flush()
+        self._entity_ids_by_scope.flush()
         return
 
     def _drop_entity(self, coll, entity_id):
@@ -43,7 +43,9 @@ class CollectionFieldCacheObject(CollectionEntityCacheObject):
         coll_id         Collection id with which the field cache is associated.
         """
         super(CollectionFieldCacheObject, self).__init__(coll_id, entity_cls)
-        self._superproperty_closure = ClosureCache(coll_id, ANNAL.CURIE.superproperty_uri)
+        self._superproperty_closure = ClosureCache(
+            coll_id, ANNAL.CURIE.superproperty_uri, keep_values=True
+            )
         return
 
     def _load_entity(self, coll, field_entity):
@@ -134,6 +136,15 @@ class CollectionFieldCacheObject(CollectionEntityCacheObject):
                 yield st
         return
 
+    def _flush_entities(self):
+        """
+        Override method that discards cached entity values, to also discard
+        the superproperty closure.
+        """
+        super(CollectionFieldCacheObject, self)._flush_entities()
+        self._superproperty_closure.clear()
+        return
+
     def remove_cache(self):
         """
         Close down and release all collection field cache data
@@ -0,0 +1,174 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module keeps track of "generation" values for each collection, which are
+recorded in files in the collection directory so that they are shared by all
+server processes that access the same site data.
+
+Two generation values are maintained for each collection:
+
+-   the collection generation changes whenever any entity in the collection is
+    created, updated or removed.  It is used to construct validators for responses
+    whose content depends on collection data or configuration (e.g. rendered entity
+    views or Turtle data, whose interpretation depends on the collection JSON-LD
+    context).
+
+-   the configuration generation changes whenever the collection data held in
+    per-process caches (types, fields and vocabulary namespaces) is updated, or
+    when the caches are explicitly flushed.  Each server process checks this value
+    when it starts processing a request for a collection, and flushes its own cached
+    values if the configuration has been updated by some other process (see
+    `Collection.check_collection_caches`).
+
+A generation value is the time (in nanoseconds) when a collection was last
+updated, and is greater than the value it replaces.  The most recent update to
+any of a set of collections (e.g. a collection and those from which it inherits
+definitions) is indicated by the largest of their generation values.  A collection
+with no recorded updates has generation value zero.
+
+Each new value is written to a temporary file that then replaces the previous
+generation file, so that a reader never sees a partially written value.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import os.path
+import time
+import threading
+
+from annalist           import layout
+
+#   ===================================================================
+#
+#   Generation file access
+#
+#   ===================================================================
+
+def _generation_path(coll, gen_file):
+    return os.path.join(os.path.normpath(coll._entitydir), gen_file)
+
+def _read_generation(coll, gen_file):
+    """
+    Returns generation value read from indicated file, or zero.
+    """
+    try:
+        with open(_generation_path(coll, gen_file), "r") as gen_io:
+            return int(gen_io.read().strip() or 0)
+    except (IOError, OSError, ValueError):
+        pass
+    return 0
+
+def _write_generation(coll, gen_file):
+    """
+    Allocates and saves a new generation value in the indicated file.
+
+    Returns the new generation value.
+    """
+    generation = max(time.time_ns(), _read_generation(coll, gen_file)+1)
+    gen_path   = _generation_path(coll, gen_file)
+    if os.path.isdir(os.path.dirname(gen_path)):
+        tmp_path = "%s.%d.%d"%(gen_path, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp_path, "w") as gen_io:
+                gen_io.write("%d\n"%(generation,))
+            os.replace(tmp_path, gen_path)
+        except (IOError, OSError) as e:
+            log.warning("Failed to save collection generation %s (%s)"%(gen_path, e))
+    return generation
+
+#   ===================================================================
+#
+#   Generation values
+#
+#   ===================================================================
+
+def get_coll_generation(coll):
+    """
+    Returns the generation value for a collection, which is the time (in
+    nanoseconds) when any of its entities was last updated, or zero.
+    """
+    return _read_generation(coll, layout.COLL_GENERATION_FILE)
+
+def get_coll_generation_inherited(coll):
+    """
+    Returns the most recent generation value for a collection and the collections
+    from which it inherits definitions.
+    """
+    return max(
+        get_coll_generation(c) for c in coll.get_alt_entities(altscope="all")
+        )
+
+def get_coll_generations(coll):
+    """
+    Returns a tuple of generation values for a collection and the collections
+    from which it inherits definitions.
+    """
+    return tuple(
+        get_coll_generation(c) for c in coll.get_alt_entities(altscope="all")
+        )
+
+def get_coll_config_generation(coll):
+    """
+    Returns the configuration generation value for a collection, which is the
+    time (in nanoseconds) when its cached configuration data was last updated,
+    or zero.
+    """
+    return _read_generation(coll, layout.COLL_CONFIG_GENERATION_FILE)
+
+def get_coll_config_generations(coll):
+    """
+    Returns a tuple of configuration generation values for a collection and the
+    collections from which it inherits definitions.
+    """
+    return tuple(
+        get_coll_config_generation(c) for c in coll.get_alt_entities(altscope="all")
+        )
+
+def update_coll_generation(coll, config=False):
+    """
+    Allocates a new generation value for a collection that has been updated.
+
+    config      if True, the configuration generation value is also updated.
+
+    Returns the new generation value.
+    """
+    if config:
+        _write_generation(coll, layout.COLL_CONFIG_GENERATION_FILE)
+    return _write_generation(coll, layout.COLL_GENERATION_FILE)
+
+#   ===================================================================
+#
+#   Configuration update detection
+#
+#   ===================================================================
+
+collconfiglock = threading.Lock()   # Interlocks access to recorded configuration values
+collconfig_seen = {}                # Configuration generation values last seen, keyed
+                                    # by (collection dir, inherited collection dir)
+
+def coll_config_updated(coll):
+    """
+    Returns a list of those collections, from the supplied collection and the
+    collections from which it inherits definitions, whose configuration generation
+    has changed since this function was last called for the supplied collection by
+    the current process.  When first called for a collection, all are returned.
+    """
+    coll_key = os.path.normpath(coll._entitydir)
+    updated  = []
+    for c in coll.get_alt_entities(altscope="all"):
+        seen_key   = (coll_key, os.path.normpath(c._entitydir))
+        generation = get_coll_config_generation(c)
+        with collconfiglock:
+            if collconfig_seen.get(seen_key, None) != generation:
+                collconfig_seen[seen_key] = generation
+                updated.append(c)
+    return updated
+
+# End.
@@ -0,0 +1,84 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module is used to cache per-collection list definitions.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                       import layout
+from annalist.exceptions            import Annalist_Error
+from annalist.identifiers           import ANNAL, RDFS
+
+from annalist.models.collectionentitycache  import (
+    Cache_Error, CollectionEntityCacheObject, CollectionEntityCache
+    )
+from annalist.models.recordlist             import RecordList
+
+#   ---------------------------------------------------------------------------
+# 
+#   Collection list cache class
+# 
+#   ---------------------------------------------------------------------------
+
+class CollectionListCache(CollectionEntityCache):
+    """
+    This class manages and accesses list definition cache objects for multiple
+    collections.
+
+    Per-collection cacheing is implemented by CollectionEntityCacheObject.
+    """
+    def __init__(self):
+        """
+        Initialize.
+
+        Initializes a list cache cache with no per-collection data.
+        """
+        super(CollectionListCache, self).__init__(CollectionEntityCacheObject, RecordList)
+        return
+
+    # Collection list cache alllocation and access methods
+
+    def set_list(self, coll, list_entity):
+        """
+        Save a new or updated list definition
+        """
+        return self.set_entity(coll, list_entity)
+
+    def remove_list(self, coll, list_id):
+        """
+        Remove list from collection list cache.
+
+        Returns the list entity removed if found, or None if not defined.
+        """
+        return self.remove_entity(coll, list_id)
+
+    def get_list(self, coll, list_id):
+        """
+        Retrieve a list description for a given list Id.
+
+        Returns a list object for the specified collection and list Id.
+        """
+        return self.get_entity(coll, list_id)
+
+    def get_all_list_ids(self, coll, altscope=None):
+        """
+        Returns all lists currently available for a collection in the indicated scope.
+        Default scope is lists defined directly in the indicated collection.
+        """
+        return self.get_all_entity_ids(coll, altscope=altscope)
+
+    def get_all_lists(self, coll, altscope=None):
+        """
+        Returns all lists currently available for a collection in the indicated scope.
+        Default scope is lists defined directly in the indicated collection.
+        """
+        return self.get_all_entities(coll, altscope=altscope)
+
+# End.
@@ -43,7 +43,9 @@ class CollectionTypeCacheObject(CollectionEntityCacheObject):
         coll_id         Collection id with which the type cache is associated.
         """
         super(CollectionTypeCacheObject, self).__init__(coll_id, entity_cls)
-        self._supertype_closure_cache = ClosureCache(coll_id, ANNAL.CURIE.supertype_uri)
+        self._supertype_closure_cache = ClosureCache(
+            coll_id, ANNAL.CURIE.supertype_uri, keep_values=True
+            )
         return
 
     def _gsupertype_cache(self):
@@ -133,6 +135,15 @@ class CollectionTypeCacheObject(CollectionEntityCacheObject):
                 yield st
         return
 
+    def _flush_entities(self):
+        """
+        Override method that discards cached entity values, to also discard
+        the supertype closure.
+        """
+        super(CollectionTypeCacheObject, self)._flush_entities()
+        self._supertype_closure_cache.clear()
+        return
+
     def remove_cache(self):
         """
         Close down and release all type cache data
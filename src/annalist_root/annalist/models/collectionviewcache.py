@@ -0,0 +1,84 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module is used to cache per-collection view definitions.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                       import layout
+from annalist.exceptions            import Annalist_Error
+from annalist.identifiers           import ANNAL, RDFS
+
+from annalist.models.collectionentitycache  import (
+    Cache_Error, CollectionEntityCacheObject, CollectionEntityCache
+    )
+from annalist.models.recordview             import RecordView
+
+#   ---------------------------------------------------------------------------
+# 
+#   Collection view cache class
+# 
+#   ---------------------------------------------------------------------------
+
+class CollectionViewCache(CollectionEntityCache):
+    """
+    This class manages and accesses view definition cache objects for multiple
+    collections.
+
+    Per-collection cacheing is implemented by CollectionEntityCacheObject.
+    """
+    def __init__(self):
+        """
+        Initialize.
+
+        Initializes a view cache cache with no per-collection data.
+        """
+        super(CollectionViewCache, self).__init__(CollectionEntityCacheObject, RecordView)
+        return
+
+    # Collection view cache alllocation and access methods
+
+    def set_view(self, coll, view_entity):
+        """
+        Save a new or updated view definition
+        """
+        return self.set_entity(coll, view_entity)
+
+    def remove_view(self, coll, view_id):
+        """
+        Remove view from collection view cache.
+
+        Returns the view entity removed if found, or None if not defined.
+        """
+        return self.remove_entity(coll, view_id)
+
+    def get_view(self, coll, view_id):
+        """
+        Retrieve a view description for a given view Id.
+
+        Returns a view object for the specified collection and view Id.
+        """
+        return self.get_entity(coll, view_id)
+
+    def get_all_view_ids(self, coll, altscope=None):
+        """
+        Returns all views currently available for a collection in the indicated scope.
+        Default scope is views defined directly in the indicated collection.
+        """
+        return self.get_all_entity_ids(coll, altscope=altscope)
+
+    def get_all_views(self, coll, altscope=None):
+        """
+        Returns all views currently available for a collection in the indicated scope.
+        Default scope is views defined directly in the indicated collection.
+        """
+        return self.get_all_entities(coll, altscope=altscope)
+
+# End.
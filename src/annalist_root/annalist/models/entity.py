@@ -36,7 +36,8 @@ from annalist                   import message
 from annalist.exceptions        import Annalist_Error
 from annalist.identifiers       import ANNAL
 
-from annalist.models.entityroot import EntityRoot
+from annalist.models.entityroot  import EntityRoot
+from annalist.models.entityindex import get_entity_index
 
 #   -------------------------------------------------------------------------------------------
 #
@@ -530,6 +531,35 @@ class Entity(EntityRoot):
 
     # I/O helper functions (copied from or overriding EntityRoot)
 
+    def _entity_index(self):
+        """
+        Returns the index of entities in the directory that contains the current entity.
+        """
+        return get_entity_index(
+            os.path.dirname(os.path.normpath(self._entitydir)), 
+            os.path.join(self._entitybase or "", self._entityfile)
+            )
+
+    def _update_generation(self):
+        """
+        Record that the collection to which the current entity belongs has been updated.
+        """
+        self._parent._update_generation()
+        return
+
+    def _search_index(self):
+        """
+        Returns the full-text search index that records the current entity.
+        """
+        return self._parent._child_search_index()
+
+    def _child_search_index(self):
+        """
+        Returns the full-text search index that records entities descended from
+        the current entity.
+        """
+        return self._parent._child_search_index()
+
     def _children(self, cls, altscope=None):
         """
         Iterates over candidate child identifiers that are possible instances of an 
@@ -549,25 +579,35 @@ class Entity(EntityRoot):
         """
         # log.info("@@ Entity._children: parent %s, altscope %s"%(self.get_id(), altscope))
         coll_entity_ids = list(super(Entity, self)._children(cls, altscope=None))
-        alt_parents     = self.get_alt_entities(altscope=altscope)
-        # parent_entity_ids = list(itertools.chain.from_iterable(
-        #     ( super(Entity, alt)._children(cls, altscope=altscope) 
-        #       for alt in alt_parents # self.get_alt_entities(altscope=altscope)
-        #     )))     # See https://docs.python.org/2/library/itertools.html#itertools.chain
-        parent_entity_ids = []
-        for alt in alt_parents:
-            for eid in super(Entity, alt)._children(cls, altscope=altscope):
-                # Filter out duplicates
-                if eid not in parent_entity_ids:
-                    parent_entity_ids.append(eid)
-        # log.info("@@ Entity._children: coll_entity_ids %r, parent_entity_ids %r"%(coll_entity_ids, parent_entity_ids))
-        # if altscope == "all" and self._altparent:
-        #     parent_entity_ids = self._altparent._children(cls, altscope=altscope)
-        for entity_id in [f for f in parent_entity_ids if f not in coll_entity_ids] + coll_entity_ids:
+        seen_entity_ids = set(coll_entity_ids)
+        for alt in self.get_alt_entities(altscope=altscope):
+            for entity_id in super(Entity, alt)._children(cls, altscope=altscope):
+                # Filter out duplicates and values defined in the current entity
+                if entity_id not in seen_entity_ids:
+                    seen_entity_ids.add(entity_id)
+                    if util.valid_id(entity_id, reserved_ok=True):
+                        yield entity_id
+        for entity_id in coll_entity_ids:
             if util.valid_id(entity_id, reserved_ok=True):
                 yield entity_id
         return
 
+    def child_entity_stamp(self, cls, altscope=None):
+        """
+        Returns a value that changes whenever a child entity of an indicated class
+        is saved or removed by Annalist, in the current entity or any alternative 
+        parent in the indicated scope, or None if no such value can be determined.
+
+        cls         is a subclass of Entity indicating the type of children.
+        altscope    if supplied, indicates a scope other than the current entity to
+                    search for children.  See `_find_alt_parents` for more details.
+        """
+        stamps = tuple(
+            super(Entity, alt).child_entity_stamp(cls) 
+            for alt in self.get_alt_entities(altscope=altscope)
+            )
+        return None if None in stamps else stamps
+
     def resource_file(self, resource_ref):
         """
         Returns a file object value for a resource associated with the current
@@ -724,6 +764,28 @@ class Entity(EntityRoot):
             )
         return v
 
+    @classmethod
+    def stat(cls, parent, entityid, resource_ref=None, altscope=None):
+        """
+        Method returns file status information (as returned by `os.stat`) for the 
+        data file of an identified entity, or for a resource associated with it, 
+        without loading the entity values.
+
+        cls         is the class of the entity to be tested
+        parent      is the parent from which the entity is descended.
+        entityid    is the local identifier (slug) for the entity.
+        resource_ref if supplied, is the name of a resource associated with the entity.
+        altscope    if supplied, indicates a scope other than the current entity to
+                    search for children.  See `_find_alt_parents` for more details.
+
+        Returns file status information, or None if the entity or resource is not present.
+        """
+        (e, v) = cls.try_alt_parentage(
+            parent, entityid, (lambda e: e._stat(resource_ref)), 
+            altscope=altscope
+            )
+        return v
+
     @classmethod
     def fileobj(cls, parent, entityid, filename, filetypeuri, mimetype, mode, altscope=None):
         """
@@ -23,6 +23,7 @@ from annalist.exceptions        import Annalist_Error
 from annalist.identifiers       import ANNAL
 from annalist                   import util
 from annalist.models.entity     import Entity
+from annalist.models.entitydatacache    import get_entitydata_cache
 
 class EntityData(Entity):
 
@@ -62,6 +63,55 @@ class EntityData(Entity):
         # log.debug("EntityData: _entityviewuri %s"%(self._entityviewuri))
         return
 
+    def _load_values(self):
+        """
+        Read current entity from Annalist storage, and return entity body.
+
+        If cacheing of entity data is enabled, values are returned from the cache
+        when the entity data file is unchanged since the values were cached.
+        The cache is keyed by the entity data file path, which identifies the
+        collection, type and entity id of the data.
+        """
+        cache = get_entitydata_cache()
+        if cache is None:
+            return super(EntityData, self)._load_values()
+        (body_dir, body_file) = self._dir_path()
+        try:
+            s = os.stat(body_file)
+        except OSError:
+            # Not present, or may need filename migration
+            return super(EntityData, self)._load_values()
+        stamp      = (s.st_mtime_ns, s.st_size)
+        entitydata = cache.get(body_file, stamp)
+        if entitydata is not None:
+            entitydata[ANNAL.CURIE.url] = self.get_view_url_path()
+            return entitydata
+        entitydata = super(EntityData, self)._load_values()
+        if entitydata and ("@error" not in entitydata):
+            cache.set(body_file, stamp, entitydata)
+        return entitydata
+
+    def _post_update_processing(self, entitydata, post_update_flags):
+        """
+        Discard any cached values for an entity that has been updated.
+        """
+        self._remove_cached_values()
+        return super(EntityData, self)._post_update_processing(entitydata, post_update_flags)
+
+    def _post_remove_processing(self, post_update_flags):
+        """
+        Discard any cached values for an entity that has been removed.
+        """
+        self._remove_cached_values()
+        return super(EntityData, self)._post_remove_processing(post_update_flags)
+
+    def _remove_cached_values(self):
+        cache = get_entitydata_cache()
+        if cache is not None:
+            (body_dir, body_file) = self._dir_path()
+            cache.remove(body_file)
+        return
+
     def _migrate_filenames(self):
         """
         Return filename migration list for entity data
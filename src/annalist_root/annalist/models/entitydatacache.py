@@ -0,0 +1,98 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module provides a size-bounded in-memory cache of entity data values
+loaded from Annalist storage, so that data files for entities that are
+accessed repeatedly (e.g. when displaying lists) are not re-read and
+re-parsed for every request.
+
+Values are held in pickled form, which allows the memory used to be measured,
+and ensures that each value retrieved is a new copy that the caller may modify.
+Each value is saved with the modification time and size of the file from which
+it was loaded, and is used only if these are unchanged.  When the cache size
+limit is exceeded, the least recently used values are discarded.
+
+The cache is not used unless enabled by setting `ENTITY_DATA_CACHE_SIZE` to
+the maximum number of bytes to be used.
+
+Cache storage and interlocking are provided by `annalist.models.sizedcache`.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import time
+import pickle
+
+from annalist.models.entityindex    import INDEX_MTIME_RESOLUTION
+from annalist.models.sizedcache     import SizedCache, get_sized_cache
+
+#   ===================================================================
+#
+#   Cache creation and discovery
+#
+#   ===================================================================
+
+def get_entitydata_cache():
+    """
+    Returns the entity data cache, or None if cacheing of entity data is not enabled.
+
+    The cache is created when first used, and is re-created if the configured
+    size is changed.
+    """
+    return get_sized_cache("ENTITY_DATA_CACHE_SIZE", EntityDataCache)
+
+#   ===================================================================
+#
+#   Entity data cache class
+#
+#   ===================================================================
+
+class EntityDataCache(SizedCache):
+    """
+    Least-recently-used cache of entity data values, bounded by total size in bytes.
+    """
+
+    def get(self, key, stamp):
+        """
+        Returns a copy of cached entity values, or None.
+
+        key         is a key that identifies the entity data (e.g. the data file path).
+        stamp       is a value (e.g. data file modification time and size) that must
+                    match the value saved with the cached data for it to be used.
+        """
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                return None
+            (cache_stamp, data) = entry
+            if cache_stamp != stamp:
+                self._remove(key)
+                return None
+        return pickle.loads(data)
+
+    def set(self, key, stamp, values):
+        """
+        Save copy of entity values in the cache.
+
+        Values are not saved if they are larger than the cache, or if the supplied
+        stamp indicates a file modified too recently for a subsequent change to be
+        reliably detected.
+
+        key         is a key that identifies the entity data (e.g. the data file path).
+        stamp       is a tuple of the modification time (in nanoseconds) and size of
+                    the file from which the entity data was loaded.
+        values      is a dictionary of entity values.
+        """
+        if (time.time_ns() - stamp[0]) < INDEX_MTIME_RESOLUTION:
+            return
+        data = pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+        self._set(key, (stamp, data), len(data))
+        return
+
+# End.
@@ -14,14 +14,25 @@ import logging
 log = logging.getLogger(__name__)
 
 import re
+import bisect
+import functools
+import threading
 from pyparsing import Word, QuotedString, Literal, Group, Empty, StringEnd, ParseException
 from pyparsing import alphas, alphanums
 
+from django.conf                    import settings
+
 from utils.py3porting               import is_string, to_unicode
 
 from annalist                       import layout
-from annalist.util                  import valid_id, extract_entity_id
+from annalist.identifiers           import ANNAL
+from annalist.util                  import (
+    valid_id, extract_entity_id, make_type_entity_id, split_type_entity_id
+    )
 
+from annalist.models.objectcache    import get_cache
+from annalist.models.collectiongeneration   import get_coll_generations
+from annalist.models.searchindex    import get_search_index, SEARCH_INDEX_MIN_TERM
 from annalist.models.recordtype     import RecordType
 from annalist.models.recordtypedata import RecordTypeData
 from annalist.models.entitytypeinfo import EntityTypeInfo
@@ -38,17 +49,61 @@ def order_entity_key(entity):
 
         sorted(entities, order_entity_key)
     """
-    type_id   = entity.get_type_id() 
-    entity_id = entity.get_id()
+    return order_id_key(entity.get_type_id(), entity.get_id())
+
+def order_id_key(type_id, entity_id):
+    """
+    Function returns sort key for ordering entities by type and entity id,
+    given the type and entity identifiers.
+
+    >>> order_id_key("_type", "Default_type") < order_id_key("testtype", "_entity")
+    True
+    >>> order_id_key("testtype", "_entity") < order_id_key("testtype", "entity")
+    True
+    """
     key = ( 0 if type_id.startswith('_')   else 1, type_id, 
             0 if entity_id.startswith('_') else 1, entity_id
           )
     return key
 
+def make_list_cursor(type_id, entity_id):
+    """
+    Returns a list cursor string that refers to a position in a sorted list of 
+    entities, following the indicated entity.
+    """
+    return make_type_entity_id(type_id, entity_id)
+
+def order_cursor_key(cursor):
+    """
+    Returns a sort key for the entity referenced by a list cursor value, or
+    None if the supplied value is not a valid cursor.
+
+    >>> order_cursor_key("testtype/entity1") == (1, 'testtype', 1, 'entity1')
+    True
+    >>> order_cursor_key("entity1") is None
+    True
+    """
+    if not is_string(cursor):
+        return None
+    (type_id, entity_id) = split_type_entity_id(cursor)
+    if not (type_id and entity_id):
+        return None
+    return order_id_key(type_id, entity_id)
+
+def make_type_uri_cache_key(coll_id):
+    """
+    Returns key for object cache of `@type` values recorded for entities of 
+    each type in a collection (see `EntityFinder.get_recorded_type_uris`).
+    """
+    return ("EntityFinder.recorded_type_uris", coll_id)
+
 #   -------------------------------------------------------------------
 #   EntityFinder
 #   -------------------------------------------------------------------
 
+searchrebuildlock = threading.Lock()    # Interlocks access to `searchrebuilds`
+searchrebuilds    = set()               # Search indexes being rebuilt in background
+
 class EntityFinder(object):
     """
     Logic for enumerating entities matching a supplied type, selector and/or search string.
@@ -190,7 +245,19 @@ class EntityFinder(object):
         """
         Iterates over entities of the specified type, matching search term and visible to 
         supplied user permissions.
+
+        If the selector provides an index plan (see `EntitySelector.index_plan`), or a 
+        search term is supplied, only candidate entities identified by the plan or the
+        collection search index are read, and the selector and search term are applied
+        as a residual check to these.
         """
+        if self._selector.index_plan(context) or search:
+            entity_refs = self.get_entity_refs(
+                type_id, user_permissions, altscope, context, search=search
+                )
+            return (
+                e for (ref, e) in self._select_entity_refs(entity_refs, context, search)
+                )
         entities = self._selector.filter(
             self.get_base_entities(type_id, user_permissions, altscope), context=context
             )
@@ -215,6 +282,288 @@ class EntityFinder(object):
         #@@
         return sorted(entities, key=order_entity_key)
 
+    def iter_entities_sorted(self, 
+        user_permissions=None, type_id=None, altscope=None, context={}, search=None
+        ):
+        """
+        Iterate over entities of the specified type, matching search term and visible 
+        to supplied user permissions, in the same order as `get_entities_sorted`.
+
+        Entity data is read as each entity is returned, so the entity data for the
+        complete list is not held in memory.
+        """
+        entity_refs = self.get_entity_refs_sorted(
+            type_id, user_permissions, altscope, context, search=search
+            )
+        for (ref, e) in self._select_entity_refs(entity_refs, context, search):
+            yield e
+        return
+
+    def get_entity_refs(self, 
+        type_id=None, user_permissions=None, altscope=None, context={}, search=None
+        ):
+        """
+        Iterate over references to candidate entities, of the specified type if a 
+        type_id is supplied.  If the selector provides an index plan for the supplied 
+        context (see `EntitySelector.index_plan`), only entities that may satisfy 
+        the plan are included.  If a search term is supplied and the collection search
+        index can be used, only entities that may contain the search term are included.
+
+        Each reference is a tuple (key, typeinfo, entity_id), where `key` is the 
+        entity sort key (see `order_id_key`).  The entity identifiers are obtained
+        without reading any entity data.
+        """
+        plan       = self._selector.index_plan(context)
+        candidates = self.get_search_candidates(search)
+        if type_id:
+            type_ids = self.get_collection_subtype_ids(type_id, "all")
+        else:
+            type_ids = self.get_collection_type_ids(altscope="all")
+        for t in type_ids:
+            typeinfo = EntityTypeInfo(self._coll, t)
+            if not self.plan_type_candidate(plan, typeinfo):
+                continue
+            for eid in self.plan_entity_ids(plan, typeinfo, user_permissions, altscope):
+                if ( (eid != layout.INITIAL_VALUES_ID) and
+                     self.search_candidate(candidates, search, typeinfo, eid) ):
+                    yield (order_id_key(t, eid), typeinfo, eid)
+        return
+
+    def get_entity_refs_sorted(self, 
+        type_id=None, user_permissions=None, altscope=None, context={}, search=None
+        ):
+        """
+        Returns a list of references to candidate entities (see `get_entity_refs`),
+        sorted by type and entity id.
+        """
+        entity_refs = {}
+        for ref in self.get_entity_refs(type_id, user_permissions, altscope, context, search):
+            entity_refs[ref[0]] = ref
+        return [ entity_refs[k] for k in sorted(entity_refs) ]
+
+    def plan_type_candidate(self, plan, typeinfo):
+        """
+        Returns True if entities of the type described by `typeinfo` may satisfy 
+        the supplied index plan (or if no plan is supplied).
+
+        Entities of a type usually have `@type` values recorded from the type
+        definition (see `EntityTypeInfo.set_type_uris`) and the entity class type
+        URI.  Other values are found by `get_recorded_type_uris`.
+        """
+        if plan is None:
+            return True
+        (field_id, values) = plan
+        if field_id == ANNAL.CURIE.type_id:
+            return typeinfo.type_id in values
+        if field_id == "@type":
+            type_uris = set(typeinfo.get_all_type_uris() or [])
+            type_uris.add(typeinfo.entityclass._entitytype)
+            if any( v in type_uris for v in values ):
+                return True
+            # Entity data may also record other type URIs
+            type_uris = self.get_recorded_type_uris(typeinfo)
+            return any( v in type_uris for v in values )
+        return True
+
+    def get_recorded_type_uris(self, typeinfo):
+        """
+        Returns the set of all `@type` values recorded in the data of entities of 
+        the type described by `typeinfo`.
+
+        This is used to find entities whose recorded `@type` values include values
+        other than the URIs defined for their type (e.g. data saved before a change
+        to the type definition).  Values are saved in an object cache, and re-used 
+        until data in the collection, or a collection from which it inherits, is 
+        updated.
+        """
+        generations = get_coll_generations(self._coll)
+        type_cache  = get_cache(make_type_uri_cache_key(self._coll.get_id()))
+        cached      = type_cache.get(typeinfo.type_id, None)
+        if cached and any(generations) and (cached[0] == generations):
+            return cached[1]
+        type_uris = set()
+        for eid in typeinfo.enum_entity_ids(altscope="all"):
+            e = typeinfo.get_entity(eid)
+            if e:
+                entity_types = e.get("@type", [])
+                if is_string(entity_types):
+                    entity_types = [entity_types]
+                type_uris.update(entity_types)
+        type_cache.set(typeinfo.type_id, (generations, type_uris))
+        return type_uris
+
+    def plan_entity_ids(self, plan, typeinfo, user_permissions, altscope):
+        """
+        Iterate over identifiers of entities of the type described by `typeinfo`
+        that may satisfy the supplied index plan (or all, if no plan is supplied).
+        """
+        entity_ids = typeinfo.enum_entity_ids(altscope=altscope, user_perms=user_permissions)
+        if plan and (plan[0] == ANNAL.CURIE.id):
+            plan_ids   = set(plan[1])
+            entity_ids = ( eid for eid in entity_ids if eid in plan_ids )
+        return entity_ids
+
+    def get_search_candidates(self, search):
+        """
+        Returns a set of (type_id, entity_id) pairs for entities in the current 
+        collection, or any collection from which it inherits, whose stored values 
+        may contain the supplied search term, or None if the collection search 
+        indexes cannot be used for the search.
+
+        Search indexes that are not up to date are not used, but are rebuilt in the
+        background (see `rebuild_search_index_background`), so that the search does
+        not wait for every entity in the collection to be read.
+        """
+        if not search or len(search) < SEARCH_INDEX_MIN_TERM:
+            return None
+        candidates = set()
+        for coll in self._coll.get_alt_entities(altscope="all"):
+            found = get_search_index(coll).find(search)
+            if found is None:
+                EntityFinder(coll).rebuild_search_index_background()
+                return None
+            candidates.update(found)
+        return candidates
+
+    def search_candidate(self, candidates, search, typeinfo, entity_id):
+        """
+        Returns True if the indicated entity may contain the supplied search term,
+        given candidates returned by `get_search_candidates`.
+
+        Values of `annal:url` are not indexed, as they depend on the collection 
+        through which an entity is accessed, so these are tested separately.  
+        Collection entities are not stored in a collection, so are not indexed.
+        """
+        if (candidates is None) or (typeinfo.type_id == layout.COLL_TYPEID):
+            return True
+        if (typeinfo.type_id, entity_id) in candidates:
+            return True
+        entity = typeinfo.entityclass(typeinfo.entityparent, entity_id)
+        return search in entity.get_view_url_path()
+
+    def get_coll_entity_values(self):
+        """
+        Iterate over (type_id, entity_id, values) for all entities stored in the 
+        current collection (excluding those inherited from other collections).
+        """
+        for type_id in self.get_collection_type_ids(altscope="all"):
+            if type_id == layout.COLL_TYPEID:
+                continue
+            typeinfo = EntityTypeInfo(self._coll, type_id)
+            for eid in typeinfo.enum_entity_ids(altscope=None):
+                e = typeinfo.get_entity(eid)
+                if e is not None:
+                    yield (type_id, eid, e.get_values())
+        return
+
+    def rebuild_search_index(self):
+        """
+        Rebuild the search index for entities stored in the current collection
+        (see `annalist.models.searchindex`).
+
+        Returns True if the index has been rebuilt, otherwise False.
+        """
+        return get_search_index(self._coll).rebuild(self.get_coll_entity_values())
+
+    def rebuild_search_index_background(self):
+        """
+        Start a thread to rebuild the search index for entities stored in the 
+        current collection, unless the index is already being rebuilt by the 
+        current process, or background rebuilding is disabled by the 
+        `SEARCH_INDEX_BACKGROUND_REBUILD` setting.
+
+        Returns the thread started, or None.
+        """
+        if not getattr(settings, "SEARCH_INDEX_BACKGROUND_REBUILD", False):
+            return None
+        index_path = repr(get_search_index(self._coll))
+        with searchrebuildlock:
+            if index_path in searchrebuilds:
+                return None
+            searchrebuilds.add(index_path)
+        def rebuild():
+            try:
+                if not self.rebuild_search_index():
+                    log.warning("Failed to rebuild search index %s"%(index_path,))
+            except Exception as e:
+                log.error("Failed to rebuild search index %s (%s)"%(index_path, e))
+            finally:
+                with searchrebuildlock:
+                    searchrebuilds.discard(index_path)
+            return
+        rebuild_thread = threading.Thread(
+            target=rebuild, name="rebuild_search_index", daemon=True
+            )
+        rebuild_thread.start()
+        return rebuild_thread
+
+    def get_entities_page(self, 
+        user_permissions=None, type_id=None, altscope=None, context={}, search=None,
+        page_size=None, cursor=None
+        ):
+        """
+        Get a page of the sorted list of entities of the specified type, matching search 
+        term and visible to supplied user permissions.
+
+        page_size   is the maximum number of entities to be returned.
+        cursor      if supplied, is a cursor value (see `make_list_cursor`) for the 
+                    entity that precedes the requested page; otherwise the first page 
+                    is returned.
+
+        Returns a tuple (entities, prev_cursor, next_cursor), where `prev_cursor` is 
+        the cursor for the previous page ("" if it is the first page), or None if there 
+        is no previous page, and `next_cursor` is the cursor for the next page, or None 
+        if there is no next page.
+
+        Entity data is read only as far as needed to fill the requested page and 
+        determine if there are adjacent pages, rather than for all entities listed.
+        """
+        entity_refs = self.get_entity_refs_sorted(
+            type_id, user_permissions, altscope, context, search=search
+            )
+        start       = 0
+        cursor_key  = order_cursor_key(cursor)
+        if cursor_key:
+            start = bisect.bisect_right([ r[0] for r in entity_refs ], cursor_key)
+        entities    = []
+        next_cursor = None
+        last_ref    = None
+        for (ref, e) in self._select_entity_refs(entity_refs[start:], context, search):
+            if len(entities) >= page_size:
+                next_cursor = make_list_cursor(last_ref[1].type_id, last_ref[2])
+                break
+            entities.append(e)
+            last_ref = ref
+        prev_cursor = None
+        prev_count  = 0
+        for (ref, e) in self._select_entity_refs(reversed(entity_refs[:start]), context, search):
+            if prev_count >= page_size:
+                prev_cursor = make_list_cursor(ref[1].type_id, ref[2])
+                break
+            prev_count += 1
+            prev_cursor = ""
+        return (entities, prev_cursor, next_cursor)
+
+    def _select_entity_refs(self, entity_refs, context, search):
+        """
+        Iterate over entities loaded from the supplied entity references that are
+        selected by the current selector and match the supplied search term.
+
+        Returns pairs (ref, entity), where `ref` is the entity reference from which
+        `entity` was loaded.
+        """
+        for ref in entity_refs:
+            (key, typeinfo, eid) = ref
+            e = typeinfo.get_entity(eid)
+            if e is None:
+                continue
+            if typeinfo.recordtype:
+                e = typeinfo.get_entity_implied_values(e)
+            if ( self._selector.select_entity(e, context) and 
+                 self.entity_contains(e, search) ):
+                yield (ref, e)
+        return
+
     @classmethod
     def entity_contains(cls, e, search):
         """
@@ -271,6 +620,14 @@ class EntityFinder(object):
 #   EntitySelector
 #   -------------------------------------------------------------------
 
+#   Properties for which candidate entities can be found without reading entity
+#   data, mapped to True for list-valued properties (see `EntitySelector.index_plan`)
+INDEXED_PROPERTIES = (
+    { ANNAL.CURIE.id:       False
+    , ANNAL.CURIE.type_id:  False
+    , "@type":              True
+    })
+
 class EntitySelector(object):
     """
     This class implements a selector filter.  It is initialized with a selector
@@ -320,6 +677,10 @@ class EntitySelector(object):
         self._fieldcomp = fieldcomp
         # Returns None if no filter is applied, otherwise a predcicate function
         self._selector  = self.compile_selector_filter(selector)
+        # Returns None if no index can be used, otherwise an index plan function
+        self._planner   = self.compile_index_plan(selector)
+        # List of (name, field_id) for context values referenced by the selector
+        self._ctxrefs   = self.selector_context_refs(selector)
         return
 
     def filter(self, entities, context=None):
@@ -354,7 +715,92 @@ class EntitySelector(object):
             return self._selector(entity, context)
         return True
 
+    def index_plan(self, context={}):
+        """
+        Returns an index plan for the selector, which describes candidate entities in 
+        terms of the values of an indexed property, or None if the selector does not 
+        restrict the values of an indexed property.
+
+        The index plan is a pair (field_id, values), indicating that only entities 
+        for which the value of property `field_id` is (or, for a list-valued property 
+        such as `@type`, contains) one of `values` can be selected.  All entities 
+        must still be tested by the selector, which is applied as a residual check 
+        to the candidate entities.
+
+        Indexed properties are those whose values are determined by the location of
+        an entity, or by the definition of its type (see `INDEXED_PROPERTIES`), so
+        candidate entities can be found without reading any entity data.
+
+        >>> c  = { 'view': { 'v:a': '1', 'v:b': ['2', '3'] } }
+        >>> EntitySelector("'annal:Type' in [@type]").index_plan(c)
+        ('@type', ['annal:Type'])
+        >>> EntitySelector("[annal:type_id] == 'Default_type'").index_plan(c)
+        ('annal:type_id', ['Default_type'])
+        >>> EntitySelector("'Default_type' == [annal:id]").index_plan(c)
+        ('annal:id', ['Default_type'])
+        >>> EntitySelector("[annal:id] in view[v:b]").index_plan(c)
+        ('annal:id', ['2', '3'])
+        >>> EntitySelector("view[v:a] in [annal:type_id]").index_plan(c)
+        ('annal:type_id', ['1'])
+        >>> EntitySelector("view[v:c] in [annal:type_id]").index_plan(c) is None
+        True
+        >>> EntitySelector("[annal:id] == view[v:c]").index_plan(c)
+        ('annal:id', [None])
+        >>> EntitySelector("[annal:id] == view[v:b]").index_plan(c) is None
+        True
+        >>> EntitySelector("view[v:b] in [@type]").index_plan(c) is None
+        True
+        >>> EntitySelector("[@type] == 'annal:Type'").index_plan(c) is None
+        True
+        >>> EntitySelector("'1' == [p:a]").index_plan(c) is None
+        True
+        >>> EntitySelector("ALL").index_plan(c) is None
+        True
+        """
+        if self._planner:
+            return self._planner(context or {})
+        return None
+
+    def context_values(self, context={}):
+        """
+        Returns a tuple of the context values referenced by the selector.  Entities
+        selected from any given set of entities depend only on these values.
+
+        >>> c  = { 'view': { 'v:a': '1', 'v:b': ['2', '3'] } }
+        >>> EntitySelector("[annal:id] in view[v:b]").context_values(c)
+        (['2', '3'],)
+        >>> EntitySelector("view[v:a] subtype list[v:c]").context_values(c)
+        ('1', None)
+        >>> EntitySelector("'annal:Type' in [@type]").context_values(c)
+        ()
+        """
+        context = context or {}
+        def get_context_value(name, field_id):
+            if name in context and context[name]:
+                return context[name].get(field_id, None)
+            return None
+        return tuple( get_context_value(name, field_id) for (name, field_id) in self._ctxrefs )
+
+    @classmethod
+    def selector_context_refs(cls, selector):
+        """
+        Returns a list of (name, field_id) for context values referenced by a 
+        supplied selector.
+
+        Selector formats: see `parse_selector` below.
+        """
+        if selector in {None, "", "ALL"}:
+            return []
+        sel = cls.parse_selector(selector)
+        if not sel:
+            return []
+        return (
+            [ (v['name'], v['field_id']) for v in (sel['val1'], sel['val2']) 
+                if v['type'] == "context"
+            ])
+
     @classmethod  #@@ @staticmethod, no cls?
+    @functools.lru_cache(maxsize=256)
     def parse_selector(cls, selector):
         """
         Parse a selector and return list of tokens
@@ -385,6 +831,9 @@ class EntitySelector(object):
                          / "*" / "+" / "," / ";" / "="
 
         Parser uses pyparsing combinators (cf. http://pyparsing.wikispaces.com).
+
+        Results are memoized for each selector string, so the value returned must 
+        not be modified.
         """
         def get_value(val_list):
             if len(val_list) == 1:
@@ -496,6 +945,100 @@ class EntitySelector(object):
         msg = "Unrecognized entity selector (%s)"%selector
         raise ValueError(msg)
 
+    def compile_index_plan(self, selector):
+        """
+        Return index plan function for a supplied selector, or None if the selector
+        does not restrict the values of an indexed property.
+
+        The returned function is applied to a context value, and returns an index 
+        plan (see `index_plan`) or None.
+
+        Selector formats: see `parse_selector` above.  Index plans are provided for
+        the following forms, where <val> is a literal or context value:
+
+            [<field-id>] == <val>   (or <val> == [<field-id>])
+            <val> in [<field-id>]
+            [<field-id>] in <val>   (single-valued properties only)
+        """
+        def hashable(v):
+            try:
+                hash(v)
+            except TypeError:
+                return False
+            return True
+        #
+        def get_values_f(selval, as_list):
+            """
+            Get function that returns list of values for literal or context value,
+            or None if any value cannot be used in an index plan (e.g. a list value
+            compared with a single-valued property).
+            """
+            if selval['type'] == "literal":
+                value = selval['value']
+                def get_literal_f(c):
+                    return value
+                val_f = get_literal_f
+            else:
+                name     = selval['name']
+                field_id = selval['field_id']
+                def get_context_f(c):
+                    if name in c and c[name]:
+                        return c[name].get(field_id, None)
+                    return None
+                val_f = get_context_f
+            def values_f(c):
+                v = val_f(c)
+                values = v if (as_list and isinstance(v, list)) else [v]
+                if not all(hashable(v) for v in values):
+                    return None
+                return values
+            return values_f
+        #
+        def plan_eq(field_id, values_f):
+            def plan_eq_f(c):
+                values = values_f(c)
+                if values is None:
+                    return None
+                return (field_id, values)
+            return plan_eq_f
+        #
+        def plan_in(field_id, values_f):
+            def plan_in_f(c):
+                values = values_f(c)
+                if values is None:
+                    return None
+                if not values[0]:
+                    return None     # Selects all entities: see `match_in`
+                return (field_id, values)
+            return plan_in_f
+        #
+        if selector in {None, "", "ALL"}:
+            return None
+        sel = self.parse_selector(selector)
+        if not sel:
+            return None
+        v1 = sel['val1']
+        v2 = sel['val2']
+        def indexed(selval):
+            return (
+                (selval['type'] == "entity") and 
+                (selval['field_id'] in INDEXED_PROPERTIES)
+                )
+        def value(selval):
+            return selval['type'] in {"literal", "context"}
+        if sel['comp'] == "==":
+            # Equality with list-valued property is not used in selectors
+            if indexed(v1) and value(v2) and not INDEXED_PROPERTIES[v1['field_id']]:
+                return plan_eq(v1['field_id'], get_values_f(v2, False))
+            if value(v1) and indexed(v2) and not INDEXED_PROPERTIES[v2['field_id']]:
+                return plan_eq(v2['field_id'], get_values_f(v1, False))
+        if sel['comp'] == "in":
+            if value(v1) and indexed(v2):
+                return plan_in(v2['field_id'], get_values_f(v1, False))
+            if indexed(v1) and value(v2) and not INDEXED_PROPERTIES[v1['field_id']]:
+                return plan_eq(v1['field_id'], get_values_f(v2, True))
+        return None
+
 #   -------------------------------------------------------------------
 #   FieldComparison
 #   -------------------------------------------------------------------
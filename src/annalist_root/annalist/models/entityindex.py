@@ -0,0 +1,420 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module maintains a persistent index of the child entities stored in a
+directory, so that enumerating entities does not require a directory scan
+and a test for the presence of every entity's data file on each request.
+
+An index is maintained for each combination of parent directory and child
+entity data file (e.g. `c/coll/d/type_id/` and `entity_data.jsonld`), and is
+stored in a file in the parent directory whose name is not a valid entity id,
+so that it is never itself seen as a child entity.  The index file is appended
+to as entities are saved and removed, and is occasionally re-written to
+discard superseded entries.  Each line has one of the following forms:
+
+    +<id>                   entity <id> is present
+    -<id>                   entity <id> has been removed
+    @<mtime> <time>         the preceding entries are complete for the
+                            parent directory modification time <mtime>,
+                            as recorded at <time> (both in nanoseconds).
+
+The index is used only if its final line is a marker whose modification time
+matches that of the parent directory.  Otherwise (e.g. if there is no index,
+or if entities have been added, removed or copied other than by Annalist) the
+directory is re-scanned and the index is re-written.  A marker recorded too
+soon after the directory was modified is not relied upon, as a further change
+within the resolution of filesystem timestamps would not be detectable, so
+the next access re-scans the directory (cf. the "racy git" problem).
+
+A new marker is also appended when an existing entity is updated, so that the
+modification time and size of the index file change whenever an entity in the
+directory is saved or removed by Annalist.  These are used, with the directory
+modification time, as a stamp value (see `EntityIndex.stamp`) for validating
+cached values that depend on the entities in a directory.
+
+Each index file has its own lock, which is held only while the index is read
+or written: it is not held while entity data is saved or removed, or while a
+directory is scanned.
+
+NOTE: removing an entity data file without removing the directory that
+contains it is not detected.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import os.path
+import io
+import time
+import threading
+import contextlib
+from collections        import OrderedDict
+
+from annalist           import layout
+from annalist           import util
+
+#   ===================================================================
+#
+#   Parameters
+#
+#   ===================================================================
+
+#   Directory modification times that are closer than this to the time
+#   they were recorded are treated as unreliable.  The value allows for
+#   filesystems with coarse timestamps (e.g. FAT uses 2 second resolution).
+INDEX_MTIME_RESOLUTION  = 2*1000*1000*1000  # nanoseconds
+
+#   Number of superseded lines allowed in an index file before it is re-written.
+INDEX_COMPACT_SLACK     = 100
+
+#   ===================================================================
+#
+#   Index creation and discovery
+#
+#   ===================================================================
+
+entityindexlock  = threading.Lock()  # Interlocks creation of entity indexes and locks
+entityindex_dict = {}                # Entity indexes, keyed by (directory, entity path)
+entityindex_locks = {}               # Locks for index access, keyed by index file path
+
+def get_entity_index(parent_dir, entity_path):
+    """
+    This function locates or creates an entity index.
+
+    parent_dir  is the directory that contains child entity directories.
+    entity_path is the path of an entity data file relative to the
+                corresponding child entity directory.
+
+    Returns the requested entity index object.
+    """
+    indexkey = (os.path.normpath(parent_dir), os.path.normpath(entity_path))
+    with entityindexlock:
+        if indexkey not in entityindex_dict:
+            entityindex_dict[indexkey] = EntityIndex(*indexkey)
+        entityindex = entityindex_dict[indexkey]
+    return entityindex
+
+#   ===================================================================
+#
+#   Entity index class
+#
+#   ===================================================================
+
+class EntityIndex(object):
+    """
+    Index of the child entities stored in a directory.
+    """
+
+    def __init__(self, parent_dir, entity_path):
+        """
+        Initialize a new entity index object.  Index data is read when first used.
+
+        parent_dir  is the directory that contains child entity directories.
+        entity_path is the path of an entity data file relative to the
+                    corresponding child entity directory.
+        """
+        super(EntityIndex, self).__init__()
+        index_name          = (
+            layout.ENTITY_INDEX_FILE%{'entityfile': os.path.basename(entity_path)}
+            )
+        self._parent_dir    = parent_dir
+        self._entity_path   = entity_path
+        self._index_file    = os.path.join(parent_dir, index_name)
+        self._ids           = None      # OrderedDict of entity ids, or None
+        self._mtime         = None      # Directory mtime for which _ids is complete
+        self._marktime      = None      # Time at which _mtime was recorded
+        self._lines         = 0         # Number of lines in index file
+        self._updates       = 0         # Number of updates in progress
+        self._update_mtime  = None      # Directory mtime when updates started, if
+                                        # the index was then up to date, or None
+        # Called by `get_entity_index` with `entityindexlock` held
+        if self._index_file not in entityindex_locks:
+            entityindex_locks[self._index_file] = threading.Lock()
+        self._lock          = entityindex_locks[self._index_file]
+        return
+
+    def __repr__(self):
+        return "EntityIndex(%r, %r)"%(self._parent_dir, self._entity_path)
+
+    def entity_ids(self, check_entity=None):
+        """
+        Returns a list of identifiers of child entities whose data is present.
+
+        check_entity    if supplied, is a function that is called with a child
+                        identifier when the directory is scanned and the entity
+                        data file is not found at the expected location, and
+                        returns True if the child entity is present (e.g. to
+                        allow for data files with names used by older software).
+        """
+        with self._lock:
+            mtime = self._dir_mtime()
+            if mtime is None:
+                return []
+            if not self._is_current(mtime):
+                self._read_index()
+            if self._is_current(mtime) and self._is_reliable():
+                return list(self._ids)
+            self._create_index_file()
+        return list(self._scan_dir(check_entity))
+
+    def stamp(self):
+        """
+        Returns a value that changes whenever a child entity is saved or removed
+        by Annalist, or the parent directory is modified.  If there is no index
+        file, an empty one is created (cf. `_scan_dir`) so that subsequent updates 
+        are detected.  Returns None if no such value can be determined.
+        """
+        with self._lock:
+            if self._dir_mtime() is None:
+                return (None, None, None)
+            self._create_index_file()
+            mtime = self._dir_mtime()
+            try:
+                index_stat = os.stat(self._index_file)
+            except OSError:
+                return None
+            return (mtime, index_stat.st_mtime_ns, index_stat.st_size)
+
+    @contextlib.contextmanager
+    def updating(self, entity_id, present):
+        """
+        Context manager used to record the result of saving or removing an
+        entity.  The index is updated if it is up to date on entry and the
+        enclosed block completes normally.  An index that is not up to date
+        is left for a subsequent directory scan to rebuild.
+
+            with index.updating(entity_id, True):
+                # create entity data
+
+        The index is not locked while the enclosed block runs.  If other updates
+        to the same directory are in progress in the current process, the index
+        entry is recorded without a marker, and the marker is recorded when the
+        last of these updates completes.
+
+        entity_id   is the identifier of the child entity being updated.
+        present     is True if the entity is being saved, or False if it
+                    is being removed.
+        """
+        with self._lock:
+            mtime = self._dir_mtime()
+            if not self._is_current(mtime):
+                self._read_index()
+            if self._updates == 0:
+                self._update_mtime = mtime if self._is_current(mtime) else None
+            elif not self._is_current(self._update_mtime):
+                self._update_mtime = None
+            self._updates += 1
+        try:
+            yield
+        except:
+            with self._lock:
+                self._updates -= 1
+                self._ids = None
+            raise
+        with self._lock:
+            self._updates -= 1
+            if self._is_current(self._update_mtime):
+                self._record_update(entity_id, present, complete=(self._updates == 0))
+            else:
+                self._record_change(entity_id, present)
+        return
+
+    # Local helpers
+
+    def _dir_mtime(self):
+        """
+        Returns the modification time of the parent directory in nanoseconds,
+        or None if the directory does not exist.
+        """
+        try:
+            return os.stat(self._parent_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _is_current(self, mtime):
+        """
+        Returns True if the in-memory index reflects the supplied directory
+        modification time.
+        """
+        return (mtime is not None) and (self._ids is not None) and (self._mtime == mtime)
+
+    def _is_reliable(self):
+        """
+        Returns True if the index marker was recorded long enough after the
+        directory was modified that any subsequent change is detectable.
+        """
+        return (self._marktime - self._mtime) >= INDEX_MTIME_RESOLUTION
+
+    def _read_index(self):
+        """
+        Read index file into memory.  If the file does not end with a complete
+        marker, the directory modification time is left as None so that the
+        index is not used.
+        """
+        ids      = OrderedDict()
+        mtime    = None
+        marktime = None
+        lines    = 0
+        try:
+            with io.open(self._index_file, "rt", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    if not line.endswith("\n"):
+                        mtime = None            # Incomplete write
+                        break
+                    line = line.rstrip("\n")
+                    if line.startswith("+"):
+                        ids[line[1:]] = True
+                        mtime = None
+                    elif line.startswith("-"):
+                        ids.pop(line[1:], None)
+                        mtime = None
+                    elif line.startswith("@"):
+                        try:
+                            mtime, marktime = [ int(t) for t in line[1:].split() ]
+                        except ValueError:
+                            mtime = None
+        except (IOError, OSError):
+            ids = None
+        self._ids      = ids
+        self._mtime    = mtime
+        self._marktime = marktime
+        self._lines    = lines
+        return
+
+    def _scan_dir(self, check_entity):
+        """
+        Scan parent directory for child entity directories that contain entity
+        data, and save the resulting index if it can be relied upon.  The index
+        file is created before the scan (see `entity_ids`), as doing so changes 
+        the directory modification time.
+
+        The index is not locked while the directory is scanned, but only while
+        the resulting index is saved.
+
+        Returns the OrderedDict of child entity ids found.
+        """
+        ids = OrderedDict()
+        mtime = self._dir_mtime()
+        try:
+            # Entity data is always in a child directory: the type of each directory
+            # entry is usually known from the directory scan without a further stat.
+            with os.scandir(self._parent_dir) as child_entries:
+                child_names = (
+                    [ d.name for d in child_entries 
+                        if util.valid_id(d.name, reserved_ok=True) and d.is_dir()
+                    ])
+        except OSError:
+            child_names = []
+        for f in child_names:
+            p = os.path.join(self._parent_dir, f, self._entity_path)
+            if os.path.isfile(p) or (check_entity and check_entity(f)):
+                ids[f] = True
+        with self._lock:
+            # Index is not saved if the directory has changed, or while updates are 
+            # in progress (which may not be reflected by the scan)
+            marktime = time.time_ns()
+            if ( (mtime is not None) and (self._dir_mtime() == mtime) and
+                 (marktime - mtime) >= INDEX_MTIME_RESOLUTION and 
+                 (self._updates == 0) ):
+                self._write_index(ids, mtime, marktime)
+            elif self._updates == 0:
+                self._ids = None
+        return ids
+
+    def _create_index_file(self):
+        """
+        Create an empty index file if none exists.
+        """
+        if not os.path.exists(self._index_file):
+            try:
+                io.open(self._index_file, "at", encoding="utf-8").close()
+            except (IOError, OSError) as e:
+                log.debug("EntityIndex._create_index_file: cannot create %s (%s)"%(self._index_file, e))
+        return
+
+    def _write_index(self, ids, mtime, marktime):
+        """
+        Write complete index to the index file, which is truncated rather than
+        replaced so that the directory modification time is not changed.
+        """
+        try:
+            with io.open(self._index_file, "wt", encoding="utf-8") as f:
+                for i in ids:
+                    f.write("+%s\n"%(i,))
+                f.write("@%d %d\n"%(mtime, marktime))
+        except (IOError, OSError) as e:
+            log.warning("EntityIndex._write_index: cannot write %s (%s)"%(self._index_file, e))
+            self._ids = None
+            return
+        self._ids      = ids
+        self._mtime    = mtime
+        self._marktime = marktime
+        self._lines    = len(ids) + 1
+        return
+
+    def _record_update(self, entity_id, present, complete=True):
+        """
+        Record saved or removed entity in the index.  If the set of entities is 
+        unchanged (e.g. an existing entity has been updated), just a new marker 
+        is recorded.
+
+        complete    is True if no other updates are in progress, in which case a
+                    marker is recorded to indicate that the index is complete for
+                    the current directory modification time.  Otherwise, just the
+                    entity entry (if any) is recorded.
+        """
+        mtime   = self._dir_mtime()
+        changed = (mtime != self._mtime) or ((entity_id in self._ids) != present)
+        if present:
+            self._ids[entity_id] = True
+        else:
+            self._ids.pop(entity_id, None)
+        if mtime is None:
+            self._ids = None
+            return
+        marktime = time.time_ns()
+        if complete and (self._lines > 2*len(self._ids) + INDEX_COMPACT_SLACK):
+            self._write_index(self._ids, mtime, marktime)
+            return
+        lines = [ "@%d %d\n"%(mtime, marktime) ] if complete else []
+        if changed:
+            lines.insert(0, "%s%s\n"%(("+" if present else "-"), entity_id))
+        if not lines:
+            return
+        try:
+            with io.open(self._index_file, "at", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except (IOError, OSError) as e:
+            log.warning("EntityIndex._record_update: cannot write %s (%s)"%(self._index_file, e))
+            self._ids = None
+            return
+        if complete:
+            self._mtime     = mtime
+            self._marktime  = marktime
+        self._lines    += len(lines)
+        return
+
+    def _record_change(self, entity_id, present):
+        """
+        Record saved or removed entity in an index file that is not up to date,
+        so that the index file is changed (see `stamp`).  The entry recorded is 
+        not followed by a marker, so the index is not used until the directory 
+        has been re-scanned.
+        """
+        if os.path.isfile(self._index_file):
+            try:
+                with io.open(self._index_file, "at", encoding="utf-8") as f:
+                    f.write("%s%s\n"%(("+" if present else "-"), entity_id))
+            except (IOError, OSError) as e:
+                log.warning("EntityIndex._record_change: cannot write %s (%s)"%(self._index_file, e))
+        self._ids = None
+        return
+
+# End.
@@ -22,17 +22,27 @@ import sys
 import os
 import json
 import io
+import hashlib
 
 from rdflib                             import Graph, URIRef, Literal
 
+from utils.py3porting                   import urljoin
+
 # Used by `json_resource_file` below.
 # See: https://stackoverflow.com/questions/51981089
-from utils.py3porting import write_bytes
+from utils.py3porting import write_bytes, is_string
 
 from annalist                           import message
 from annalist                           import layout
+from annalist.identifiers               import ANNAL
 
 from annalist.models.entitytypeinfo     import EntityTypeInfo
+from annalist.models.entitydatacache    import EntityDataCache
+from annalist.models.sizedcache         import get_sized_cache
+
+# Number of entities converted to RDF together when generating N-Triples data
+
+NTRIPLES_BATCH_SIZE = 100
 
 # Resource info data for built-in entity data
 
@@ -101,17 +111,6 @@ entity_fixed_json_resources = (
                                                     "resource_type": "application/ld+json" }
     ])
 
-entity_list_json_resources = (
-    # [ { "resource_name": layout.COLL_META_FILE,     "resource_dir": layout.COLL_BASE_DIR, 
-    #                                                 "resource_type": "application/ld+json" }
-    # , { "resource_name": layout.COLL_PROV_FILE,     "resource_dir": layout.COLL_BASE_DIR, 
-    #                                                 "resource_type": "application/ld+json" }
-    # , { "resource_name": layout.COLL_CONTEXT_FILE,  "resource_dir": layout.COLL_BASE_DIR, 
-    #                                                 "resource_type": "application/ld+json" }
-    [ { "resource_name": layout.ENTITY_LIST_FILE,   "resource_dir": ".", 
-                                                    "resource_type": "application/ld+json" }
-    ])
-
 # Resource access functions
 
 def entity_resource_file(entity, resource_info):
@@ -135,6 +134,122 @@ def json_resource_file(baseurl, jsondata, resource_info):
     response_file.seek(0)
     return response_file
 
+def json_resource_stream(baseurl, jsondata, resource_info, list_key=ANNAL.CURIE.entity_list):
+    """
+    Generator returns a JSON version of the supplied data as a sequence of strings,
+    with the same content as the file returned by `json_resource_file`.  
+    
+    The value of the indicated list key may be any iterable (e.g. a generator of 
+    entity values), which is read one member at a time as the JSON data is returned, 
+    so the complete list does not need to be held in memory.
+
+    baseurl         base URL for resolving relative URI references.
+                    (Unused except for diagnostic purposes.)
+    jsondata        is the data to be formatted and returned.
+    resource_info   is a dictionary of values about the resource to be serialized.
+                    (Unused except for diagnostic purposes.)
+    list_key        is the key of the list value in `jsondata` that is returned 
+                    incrementally.
+    """
+    def dump_value(val, indent):
+        val_str = json.dumps(val, indent=2, separators=(',', ': '), sort_keys=True)
+        return val_str.replace("\n", "\n"+indent)
+    key_sep = "{"
+    for key in sorted(jsondata):
+        yield key_sep + "\n  " + json.dumps(key) + ": "
+        key_sep = ","
+        if key == list_key:
+            val_sep = "["
+            for val in jsondata[key]:
+                yield val_sep + "\n    " + dump_value(val, "    ")
+                val_sep = ","
+            yield "[]" if val_sep == "[" else "\n  ]"
+        else:
+            yield dump_value(jsondata[key], "  ")
+    yield "{}" if key_sep == "{" else "\n}"
+    return
+
+def ndjson_resource_stream(baseurl, jsondata, resource_info, list_key=ANNAL.CURIE.entity_list):
+    """
+    Generator returns newline-delimited JSON-LD for the entities in the supplied
+    list data, as a sequence of strings, each of which is a single line containing
+    a JSON-LD object for one entity.
+
+    Each entity object includes the JSON-LD context of the list data, with relative
+    references resolved against the supplied base URL, so that it can be processed 
+    independently of the other entities.  The value of the indicated list key may be 
+    any iterable (e.g. a generator of entity values), which is read one member at a
+    time.
+
+    baseurl         base URL for resolving relative URI references.
+    jsondata        is list data containing the entities to be returned.
+    resource_info   is a dictionary of values about the resource to be serialized.
+                    (Unused except for diagnostic purposes.)
+    list_key        is the key of the list value in `jsondata`.
+
+    >>> jsondata = (
+    ...     { "@context": [{"@base": "/c/coll/d/"}, "/c/coll/d/coll_context.jsonld"]
+    ...     , "annal:entity_list": iter([{"@id": "type/entity1"}, {"@id": "type/entity2"}])
+    ...     })
+    >>> for line in ndjson_resource_stream("http://example.org/c/coll/d/", jsondata, {}):
+    ...     print(line, end="")
+    {"@context": [{"@base": "http://example.org/c/coll/d/"}, "http://example.org/c/coll/d/coll_context.jsonld"], "@id": "type/entity1"}
+    {"@context": [{"@base": "http://example.org/c/coll/d/"}, "http://example.org/c/coll/d/coll_context.jsonld"], "@id": "type/entity2"}
+    """
+    context = jsonld_context_absolute(baseurl, jsondata.get("@context", []))
+    for val in jsondata[list_key]:
+        yield json.dumps(dict(val, **{"@context": context}), sort_keys=True) + "\n"
+    return
+
+def ntriples_resource_stream(baseurl, jsondata, resource_info, list_key=ANNAL.CURIE.entity_list):
+    """
+    Generator returns N-Triples data for the entities in the supplied list data,
+    as a sequence of strings.
+
+    Entities are read from the indicated list value (which may be any iterable, 
+    e.g. a generator of entity values) and converted to RDF in batches of 
+    `NTRIPLES_BATCH_SIZE`, so the data for the complete list is not held in memory.
+    Any error is reported as a comment in the data returned.
+
+    baseurl         base URL for resolving relative URI references.
+    jsondata        is list data containing the entities to be returned.
+    resource_info   is a dictionary of values about the resource to be serialized.
+                    If it contains a `resource_contexts` value (see 
+                    `jsonld_context_resources`), JSON-LD context documents referenced
+                    by the data are used from there rather than being read from 
+                    their URLs.
+    list_key        is the key of the list value in `jsondata`.
+    """
+    contexts = resource_info.get("resource_contexts", None) or {}
+    context  = jsondata.get("@context", [])
+    def batch_ntriples(batch):
+        batchdata = jsonld_context_data(
+            baseurl, { "@context": context, "@graph": batch }, contexts
+            )
+        g = Graph()
+        try:
+            g.parse(data=json.dumps(batchdata), publicID=baseurl, format="json-ld")
+            return g.serialize(format="nt")
+        except Exception as e:
+            reason = str(e)
+            log.warning(message.NTRIPLES_SERIALIZE_ERROR)
+            log.info(reason)
+            log.info("baseurl %s, resourceinfo %r"%(baseurl, resource_info))
+            return (
+                "\n# ***** ERROR ****\n# %s\n# %s:\n# %s\n\n"%
+                ( message.NTRIPLES_SERIALIZE_ERROR, message.NTRIPLES_SERIALIZE_REASON
+                , reason.replace("\n", "\n# ")
+                ))
+    batch = []
+    for val in jsondata[list_key]:
+        batch.append(val)
+        if len(batch) >= NTRIPLES_BATCH_SIZE:
+            yield batch_ntriples(batch)
+            batch = []
+    if batch:
+        yield batch_ntriples(batch)
+    return
+
 def turtle_resource_file(baseurl, jsondata, resource_info):
     """
     Return a file object that reads out a Turtle version of the supplied 
@@ -142,10 +257,16 @@ def turtle_resource_file(baseurl, jsondata, resource_info):
     what rdflib expects.
 
     baseurl         base URL for resolving relative URI references.
-                    (Unused except for diagnostic purposes.)
     jsondata        is the data to be formatted and returned.
     resource_info   is a dictionary of values about the resource to be serialized.
-                    (Unused except for diagnostic purposes.)
+                    If it contains a `resource_contexts` value (see 
+                    `jsonld_context_resources`), JSON-LD context documents referenced
+                    by the data are used from there rather than being read from 
+                    their URLs, and the Turtle data returned may be saved for re-use.
+
+    Turtle data is cached if enabled by setting `TURTLE_DATA_CACHE_SIZE`, using a key
+    that is a hash of the JSON-LD data and base URL, and is re-used only while the
+    JSON-LD context files used are unchanged (see `jsonld_context_stamp`).
     """
     # NOTE:   under Python 2, "BytesIO" is implemented by "StringIO", which does
     #         not handle well a combination of str and unicode values, and may 
@@ -160,7 +281,24 @@ def turtle_resource_file(baseurl, jsondata, resource_info):
     #
     #         The fix here is to encode everything as bytes before writing.
     jsondata_file = json_resource_file(baseurl, jsondata, resource_info)
+    contexts      = resource_info.get("resource_contexts", None)
+    turtle_cache  = None
+    if contexts:
+        turtle_cache = get_sized_cache("TURTLE_DATA_CACHE_SIZE", EntityDataCache)
+    if turtle_cache:
+        cache_key   = hashlib.sha1(
+            (baseurl + "\n" + jsondata_file.getvalue()).encode("utf-8")
+            ).hexdigest()
+        cache_stamp = jsonld_context_stamp(contexts)
+        turtle_data = turtle_cache.get(cache_key, cache_stamp)
+        if turtle_data is not None:
+            return io.BytesIO(turtle_data)
+    if contexts:
+        jsondata_file = json_resource_file(
+            baseurl, jsonld_context_data(baseurl, jsondata, contexts), resource_info
+            )
     response_file = io.BytesIO()
+    response_ok   = True
     g = Graph()
     try:
         g = g.parse(source=jsondata_file, publicID=baseurl, format="json-ld")
@@ -174,6 +312,7 @@ def turtle_resource_file(baseurl, jsondata, resource_info):
         write_bytes(response_file, "\n%s:\n"%message.JSONLD_PARSE_REASON)
         write_bytes(response_file, reason)
         write_bytes(response_file, "\n\n")
+        response_ok = False
     try:
         g.serialize(destination=response_file, format='turtle', indent=4)
     except Exception as e:
@@ -185,9 +324,90 @@ def turtle_resource_file(baseurl, jsondata, resource_info):
         write_bytes(response_file, "\n%s:\n"%message.TURTLE_SERIALIZE_REASON)
         write_bytes(response_file, reason)
         write_bytes(response_file, "\n\n")
+        response_ok = False
+    if turtle_cache and response_ok:
+        turtle_cache.set(cache_key, cache_stamp, response_file.getvalue())
     response_file.seek(0)
     return response_file
 
+def jsonld_context_resources(coll, coll_baseurl):
+    """
+    Returns a dictionary of JSON-LD context documents that may be referenced by 
+    data in the indicated collection, keyed by URL, for use as the `resource_contexts`
+    value of resource information used to generate Turtle data.  Each value is a 
+    pair of a stamp and a context document, as returned by 
+    `Collection.get_coll_jsonld_context_document`.
+
+    coll            is the collection whose context is returned.
+    coll_baseurl    is the base URL for collection data, including the host name,
+                    relative to which the collection context file is referenced.
+    """
+    context_doc = coll.get_coll_jsonld_context_document()
+    if context_doc is None:
+        return {}
+    return { urljoin(coll_baseurl, layout.COLL_CONTEXT_FILE): context_doc }
+
+def jsonld_context_data(baseurl, jsondata, contexts):
+    """
+    Returns a copy of the supplied JSON-LD data in which references to context 
+    documents in the supplied dictionary (see `jsonld_context_resources`) are 
+    replaced by the document content.
+
+    >>> contexts = {"http://example.org/coll/d/coll_context.jsonld": ((1, 2), {"@context": {"a": "test:a"}})}
+    >>> jsondata = {"@context": [{"@base": "../../"}, "../../coll_context.jsonld"], "a": "b"}
+    >>> jsonld_context_data("http://example.org/coll/d/type/entity/", jsondata, contexts) == (
+    ...     {"@context": [{"@base": "../../"}, {"@context": {"a": "test:a"}}], "a": "b"})
+    True
+    >>> jsonld_context_data("http://example.org/coll/d/type/entity/", {"a": "b"}, contexts)
+    {'a': 'b'}
+    """
+    def context_item(c):
+        if is_string(c):
+            context_doc = contexts.get(urljoin(baseurl, c), None)
+            if context_doc is not None:
+                return context_doc[1]
+        return c
+    if "@context" not in jsondata:
+        return jsondata
+    context = jsondata["@context"]
+    if isinstance(context, list):
+        context = [ context_item(c) for c in context ]
+    else:
+        context = context_item(context)
+    return dict(jsondata, **{"@context": context})
+
+def jsonld_context_absolute(baseurl, context):
+    """
+    Returns a copy of the supplied JSON-LD context value in which references to
+    context documents and `@base` values are resolved against the supplied base URL.
+
+    >>> jsonld_context_absolute("http://example.org/c/coll/d/", [{"@base": "../"}, "/c/coll/d/coll_context.jsonld"])
+    [{'@base': 'http://example.org/c/coll/'}, 'http://example.org/c/coll/d/coll_context.jsonld']
+    >>> jsonld_context_absolute("http://example.org/c/coll/d/", {"a": "test:a"})
+    {'a': 'test:a'}
+    """
+    def context_item(c):
+        if is_string(c):
+            return urljoin(baseurl, c)
+        if isinstance(c, dict) and is_string(c.get("@base", None)):
+            return dict(c, **{"@base": urljoin(baseurl, c["@base"])})
+        return c
+    if isinstance(context, list):
+        return [ context_item(c) for c in context ]
+    return context_item(context)
+
+def jsonld_context_stamp(contexts):
+    """
+    Returns a stamp value for the supplied dictionary of context documents, which
+    is a tuple whose first element is the most recent modification time of the 
+    context files used.
+
+    >>> jsonld_context_stamp({"http://a": ((3, 20), {}), "http://b": ((4, 10), {})})
+    (4, (('http://a', (3, 20)), ('http://b', (4, 10))))
+    """
+    stamps = tuple(sorted( (url, contexts[url][0]) for url in contexts ))
+    return (max( stamp[0] for (url, stamp) in stamps ), stamps)
+
 def make_turtle_resource_info(json_resource):
     """
     Return Turtle resource description for fixed JSON resource
@@ -200,6 +420,29 @@ def make_turtle_resource_info(json_resource):
         })
     return turtle_resource
 
+# Resource info data for entity lists
+#
+# "resource_stream", if present, is a generator function used in place of the
+# resource access function to return the resource data incrementally.
+
+entity_list_json_resources = (
+    # [ { "resource_name": layout.COLL_META_FILE,     "resource_dir": layout.COLL_BASE_DIR, 
+    #                                                 "resource_type": "application/ld+json" }
+    # , { "resource_name": layout.COLL_PROV_FILE,     "resource_dir": layout.COLL_BASE_DIR, 
+    #                                                 "resource_type": "application/ld+json" }
+    # , { "resource_name": layout.COLL_CONTEXT_FILE,  "resource_dir": layout.COLL_BASE_DIR, 
+    #                                                 "resource_type": "application/ld+json" }
+    [ { "resource_name": layout.ENTITY_LIST_FILE,   "resource_dir": ".", 
+                                                    "resource_type": "application/ld+json",
+                                                    "resource_stream": json_resource_stream }
+    , { "resource_name": layout.ENTITY_LIST_NTRIPLES, "resource_dir": ".", 
+                                                    "resource_type": "application/n-triples",
+                                                    "resource_stream": ntriples_resource_stream }
+    , { "resource_name": layout.ENTITY_LIST_NDJSON, "resource_dir": ".", 
+                                                    "resource_type": "application/x-ndjson",
+                                                    "resource_stream": ndjson_resource_stream }
+    ])
+
 def find_fixed_resource(fixed_json_resources, resource_ref):
     """
     Return a description for the indicated fixed (built-in) resource from 
@@ -223,6 +466,8 @@ def find_fixed_resource(fixed_json_resources, resource_ref):
         if fj["resource_name"] == resource_ref:
             fr = dict(fj, resource_path=os.path.join(fj["resource_dir"]+"/", resource_ref))
             return fr
+        if not fj["resource_name"].endswith(".jsonld"):
+            continue
         ft = make_turtle_resource_info(fj)
         if ft["resource_name"] == resource_ref:
             fr = dict(ft, resource_path=os.path.join(ft["resource_dir"]+"/", resource_ref))
@@ -21,9 +21,11 @@ log = logging.getLogger(__name__)
 
 import os
 import os.path
+import stat
 import shutil
 import json
 import errno
+import contextlib
 
 from django.conf import settings
 
@@ -37,6 +39,8 @@ from annalist.identifiers   import ANNAL, RDF, RDFS
 from annalist.resourcetypes import file_extension, file_extension_for_content_type
 from annalist.util          import valid_id, make_type_entity_id, make_entity_base_url
 
+from annalist.models.entityindex    import get_entity_index
+
 #   -------------------------------------------------------------------------------------------
 #
 #   EntityRoot
@@ -280,6 +284,25 @@ class EntityRoot(object):
                 return open(file_name, "rb")
         return None
 
+    def _stat(self, resource_ref=None):
+        """
+        Returns file status information (as returned by `os.stat`) for a resource 
+        associated with an entity, or for the entity data file if no resource is 
+        specified, or None if the entity or resource is not present.
+
+        The entity values are not loaded.
+        """
+        body_file = self._exists_path()
+        if not body_file:
+            return None
+        if resource_ref is not None:
+            body_file = os.path.join(self._entitydir, resource_ref)
+        try:
+            file_stat = os.stat(body_file)
+        except OSError:
+            return None
+        return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
     def get_field(self, path):
         """
         Returns a field value corresponding to a path returned by enum_fields.
@@ -300,14 +323,34 @@ class EntityRoot(object):
                     iterate over.
         altscope    if supplied, indicates a scope other than the current entity to
                     search for children.  See method `get_alt_entities` for more details.
+
+        NOTE: identifiers returned by `_children` are those found in the entity index
+        for each directory searched, which contains only entities whose data is present,
+        so there is no need to test separately for existence of each entity.  (An 
+        entity whose data file has been removed other than by Annalist may still be
+        indexed if its directory remains:  such entities cannot be loaded, and are 
+        skipped by `EntityTypeInfo.enum_entities`.)
         """
         if altscope == "select":
             altscope = "all"
         for i in self._children(cls, altscope=altscope):
-            if cls.exists(self, i, altscope=altscope):
-                yield i
+            yield i
         return
 
+    def child_entity_stamp(self, cls, altscope=None):
+        """
+        Returns a value that changes whenever a child entity of an indicated class
+        is saved or removed by Annalist (see `EntityIndex.stamp`), or None if no
+        such value can be determined.
+
+        cls         is a subclass of Entity indicating the type of children.
+        altscope    if supplied, indicates a scope other than the current entity to
+                    search for children.
+
+        NOTE: `Entity` class overrides this.
+        """
+        return self._base_children_stamp(cls)
+
     # I/O helper functions
 
     def _dir_path(self):
@@ -424,11 +467,14 @@ class EntityRoot(object):
             log.error(msg)
             raise ValueError(msg)
         # Create directory (if needed) and save data
-        util.ensure_dir(body_dir)
         values = self.get_save_values()
-        with open(fullpath, "wt") as entity_io:
-            json.dump(values, entity_io, indent=2, separators=(',', ': '), sort_keys=True)
+        with self._entity_index_updating(True):
+            util.ensure_dir(body_dir)
+            with open(fullpath, "wt") as entity_io:
+                json.dump(values, entity_io, indent=2, separators=(',', ': '), sort_keys=True)
         self._post_update_processing(values, post_update_flags)
+        with self._search_index_updating(values):
+            self._update_generation()
         return
 
     def _remove(self, type_uri, post_remove_flags=None):
@@ -439,12 +485,15 @@ class EntityRoot(object):
         d = self._entitydir
         # Extra check to guard against accidentally deleting wrong thing
         if type_uri in self._values['@type'] and d.startswith(self._entitybasedir):
-            shutil.rmtree(d)
+            with self._entity_index_updating(False):
+                shutil.rmtree(d)
+            self._post_remove_processing(post_remove_flags)
+            with self._search_index_updating(None):
+                self._update_generation()
         else:
             log.error("Expected type_uri: %r, got %r"%(type_uri, e[ANNAL.CURIE.type]))
             log.error("Expected dirbase:  %r, got %r"%(parent._entitydir, d))
             raise Annalist_Error("Entity %s unexpected type %s or path %s"%(entityid, e[ANNAL.CURIE.type_id], d))
-        self._post_remove_processing(post_remove_flags)
         return
 
     def _load_values(self):
@@ -459,8 +508,8 @@ class EntityRoot(object):
             # log.debug("EntityRoot._load_values body_file %r"%(body_file,))
             try:
                 # @@TODO: rework name access to support different underlays
-                with self._read_stream() as f:
-                    entitydata = json.load(util.strip_comments(f))
+                with self._read_stream(mode="rb") as f:
+                    entitydata = util.load_json_data(f.read())
                     # log.debug("EntityRoot._load_values: url_path %s"%(self.get_view_url_path()))
                     entitydata[ANNAL.CURIE.url] = self.get_view_url_path()
                     return entitydata
@@ -624,6 +673,13 @@ class EntityRoot(object):
         Individual entity classes may provide their own override methods for this.  
         (e.g. to trigger regeneration of context data when groups, views, fields or 
         vocabulary descriptions are updated.)
+
+        post_update_flags   if supplied, is a set of flags that suppress some post-update
+                            processing: "nocontext" suppresses regeneration of the 
+                            collection JSON-LD context, and "nocache" suppresses updates 
+                            to collection caches.  (These are used when saving a batch of
+                            entities, after which caches are flushed and the context is 
+                            regenerated.)
         """
         return entitydata
 
@@ -637,17 +693,97 @@ class EntityRoot(object):
         """
         return
 
+    def _update_generation(self):
+        """
+        Called when the current entity has been saved or removed, to record that 
+        the collection to which it belongs has been updated.
+
+        NOTE: `Entity` and `Collection` classes override this.
+        """
+        return
+
+    def _entity_index(self):
+        """
+        Returns the index of entities in the directory that contains the current
+        entity, or None if the current entity is not indexed (e.g. a root entity).
+
+        NOTE: `Entity` class overrides this.
+        """
+        return None
+
+    def _entity_index_updating(self, present):
+        """
+        Returns a context manager used when saving or removing the current entity, 
+        which records the change in the index of the directory that contains it.
+
+        present     is True if the entity is being saved, or False if it is being removed.
+        """
+        index = self._entity_index()
+        if index is None:
+            return contextlib.nullcontext()
+        return index.updating(self._entityid, present)
+
+    def _search_index(self):
+        """
+        Returns the full-text search index that records the current entity, or None
+        if the current entity is not indexed (e.g. a root entity).
+
+        NOTE: `Entity` class overrides this.
+        """
+        return None
+
+    def _child_search_index(self):
+        """
+        Returns the full-text search index that records entities descended from the
+        current entity, or None if they are not indexed.
+
+        NOTE: `Entity` and `Collection` classes override this.
+        """
+        return None
+
+    def _search_index_updating(self, values):
+        """
+        Returns a context manager used when saving or removing the current entity, 
+        which records the change in the full-text search index of the collection 
+        that contains it.
+
+        values      are the entity values being saved, or None if the entity is
+                    being removed.
+        """
+        index = self._search_index()
+        if index is None:
+            return contextlib.nullcontext()
+        return index.updating(self.get_type_id(), self._entityid, values)
+
+    def _base_children_stamp(self, cls):
+        """
+        Returns the entity index stamp for the subdirectory containing children
+        that are instances of an indicated class, or None if they are not indexed.
+        """
+        if not cls._entityfile:
+            return None
+        parent_dir = os.path.dirname(os.path.join(self._entitydir, cls._entityroot or ""))
+        return get_entity_index(
+            parent_dir, os.path.join(cls._entitybase or "", cls._entityfile)
+            ).stamp()
+
     def _base_children(self, cls):
         """
-        Iterates over candidate child identifiers that are possible instances of an 
-        indicated class.  The supplied class is used to determine a subdirectory to 
-        be scanned.
+        Iterates over child identifiers that are instances of an indicated class.
+        The supplied class is used to determine a subdirectory whose index is used.
 
         cls         is a subclass of Entity indicating the type of children to
                     iterate over.
         """
         parent_dir = os.path.dirname(os.path.join(self._entitydir, cls._entityroot or ""))
         assert "%" not in parent_dir, "_entityroot template variable interpolation may be in filename part only"
+        if cls._entityfile:
+            index = get_entity_index(
+                parent_dir, os.path.join(cls._entitybase or "", cls._entityfile)
+                )
+            for eid in index.entity_ids(check_entity=(lambda i: cls.exists(self, i))):
+                yield eid
+            return
         child_files = []
         if os.path.isdir(parent_dir):
             child_files = os.listdir(parent_dir)
@@ -817,10 +953,13 @@ class EntityRoot(object):
         # log.debug("entityroot._metaobj: filename %s"%(filename,))
         return open(filename, mode)
 
-    def _read_stream(self):
+    def _read_stream(self, mode="rt"):
         """
         Opens a (file-like) stream to read entity data.
 
+        mode        is the mode used to open the stream: "rt" (the default) for 
+                    reading text, or "rb" for reading bytes.
+
         Returns the stream object, which implements the context protocol to
         close the stream on exit from a containing with block; e.g.
 
@@ -834,7 +973,7 @@ class EntityRoot(object):
         body_file = self._exists_path()
         if body_file:
             try:
-                f_stream = open(body_file, "rt")
+                f_stream = open(body_file, mode)
             except IOError as e:
                 if e.errno != errno.ENOENT:
                     raise
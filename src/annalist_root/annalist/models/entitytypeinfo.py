@@ -602,9 +602,10 @@ class EntityTypeInfo(object):
                 entity = self._new_entity(entity_id)
                 entity_initial_values = self.get_initial_entity_values(entity_id)
                 entity.set_values(entity_initial_values)
-            elif self.entityclass.exists(self.entityparent, entity_id, altscope="all"):
-                entity = self.entityclass.load(self.entityparent, entity_id, altscope="all")
             else:
+                # `load` returns None if the entity does not exist
+                entity = self.entityclass.load(self.entityparent, entity_id, altscope="all")
+            if entity is None:
                 log.debug(
                     "EntityTypeInfo.get_entity %s/%s at %s not found"%
                     (self.type_id, entity_id, self.entityparent._entitydir)
@@ -687,10 +688,16 @@ class EntityTypeInfo(object):
                 )
         return
 
-    def enum_entity_ids(self, altscope=None):
+    def enum_entity_ids(self, altscope=None, user_perms=None):
         """
         Iterate over entity identifiers in collection with current type.
+
+        If user_perms is supplied and not None, checks that they contain permission to
+        list values of the appropriate type. 
         """
+        if ( user_perms and
+             self.permissions_map['list'] not in user_perms[ANNAL.CURIE.user_permission] ):
+            return
         if self.entityparent:
             for eid in self.entityparent.child_entity_ids(
                     self.entityclass, 
@@ -700,9 +707,22 @@ class EntityTypeInfo(object):
             log.warning("EntityTypeInfo.enum_entity_ids: missing entityparent; type_id %s"%(self.type_id))
         return
 
+    def enum_entities_stamp(self, altscope=None):
+        """
+        Returns a value that changes whenever an entity of the current type is 
+        saved or removed by Annalist, or None if no such value can be determined
+        (see `Entity.child_entity_stamp`).
+        """
+        if not self.entityparent:
+            return None
+        return self.entityparent.child_entity_stamp(self.entityclass, altscope=altscope)
+
     def enum_entities(self, user_perms=None, altscope=None):
         """
         Iterate over entities in collection with current type.
+
+        Entities that cannot be loaded are skipped (e.g. if an entity data file has
+        been removed other than by Annalist, but the entity is still indexed).
         """
         if (not user_perms or 
             self.permissions_map['list'] in user_perms[ANNAL.CURIE.user_permission]):
@@ -712,7 +732,9 @@ class EntityTypeInfo(object):
                 for eid in self.entityparent.child_entity_ids(
                         self.entityclass, 
                         altscope=altscope):
-                    yield self.get_entity(eid)
+                    e = self.get_entity(eid)
+                    if e is not None:
+                        yield e
         return
 
     def enum_entities_with_implied_values(self, user_perms=None, altscope=None):
@@ -745,7 +767,9 @@ class EntityTypeInfo(object):
                 for eid in self.entityparent.child_entity_ids(
                         self.entityclass, 
                         altscope=altscope):
-                    yield self.get_entity(eid)
+                    e = self.get_entity(eid)
+                    if e is not None:
+                        yield e
             else:
                 #@@
                 # log.info(
@@ -756,7 +780,9 @@ class EntityTypeInfo(object):
                 for eid in self.entityparent.child_entity_ids(
                         self.entityclass, 
                         altscope=altscope):
-                    yield self.get_entity_implied_values(self.get_entity(eid))
+                    e = self.get_entity(eid)
+                    if e is not None:
+                        yield self.get_entity_implied_values(e)
         return
 
     def get_initial_entity_values(self, entity_id, copy_entity_id=layout.INITIAL_VALUES_ID):
@@ -6,8 +6,13 @@ This module provides an object cacheing framework for arbitrary Python values.
 The intent is that all cacghe logic can be isolated, and may be re-implemented
 using a network cache faclity such as MemCache or Redis.
 
-The present implementation assumes a single-process, multi-threaded environment
-and interlocks cache accesses to avoid possible cache-related race conditions.
+The class used to implement object caches is selected by the setting
+`OBJECT_CACHE_BACKEND`, which is the full dotted name of a class with the same
+interface as `ObjectCache`.  The default implementation (`ObjectCache`) assumes
+a single-process, multi-threaded environment and interlocks cache accesses to
+avoid possible cache-related race conditions.  See also module
+`annalist.models.sqliteobjectcache`, which provides an implementation whose
+cached values are shared by multiple server processes.
 """
 
 __author__      = "Graham Klyne (GK@ACM.ORG)"
@@ -22,6 +27,9 @@ import traceback
 import threading
 import contextlib
 
+from django.conf                    import settings
+from django.utils.module_loading    import import_string
+
 from annalist.exceptions            import Annalist_Error
 
 #   ===================================================================
@@ -48,6 +56,18 @@ globalcachelock  = threading.Lock() # Used to interlock creation/deletion of cac
 objectcache_dict = {}               # Initial empty set of object caches
 objectcache_tb   = {}
 
+DEFAULT_OBJECT_CACHE_BACKEND = "annalist.models.objectcache.ObjectCache"
+
+def get_cache_class():
+    """
+    Returns the object cache implementation class selected by settings.
+    """
+    backend = getattr(settings, "OBJECT_CACHE_BACKEND", None) or DEFAULT_OBJECT_CACHE_BACKEND
+    try:
+        return import_string(backend)
+    except ImportError as e:
+        raise Cache_Error(value=backend, msg="Object cache backend not found (%s)"%(e,))
+
 def get_cache(cachekey):
     """
     This function locates or creates an object cache.
@@ -59,7 +79,7 @@ def get_cache(cachekey):
     """
     with globalcachelock:
         if cachekey not in objectcache_dict:
-            objectcache_dict[cachekey] = ObjectCache(cachekey)
+            objectcache_dict[cachekey] = get_cache_class()(cachekey)
         objectcache = objectcache_dict[cachekey]    # Copy value while lock acquired
     return objectcache
 
@@ -67,6 +87,9 @@ def remove_cache(cachekey):
     """
     This function removes a cache from the set of object  caches
 
+    Values held by a cache implementation that is shared with other processes
+    are not necessarily discarded (see `ObjectCache.close`).
+
     cachekey    is a hashable value that uniquely identifies the required cache
                 (e.g. a string or URI).
     """
@@ -94,6 +117,9 @@ class ObjectCache(object):
 
     The cache is identified by is cache key value that is used to distinguish 
     a particular object cache from all others (see also `getCache`)
+
+    Alternative cache implementations provide the same methods as this class,
+    and are constructed with the cache key as the only parameter.
     """
 
     def __init__(self, cachekey):
@@ -124,6 +150,9 @@ class ObjectCache(object):
     def close(self):
         """
         Close down this cache object.  Once closed, it cannot be used again.
+
+        This implementation also removes all cached values.  Implementations that
+        share cached values with other processes may retain them.
         """
         # log.debug("ObjectCache.close: cachekey %r"%(self._cachekey,))
         self.flush()
@@ -221,7 +221,9 @@ class RecordField(EntityData):
         It invokes the containing collection method to regenerate the JSON LD context 
         for the collection to which the field belongs.
         """
-        self._parent.cache_add_field(self)
+        entitydata = super(RecordField, self)._post_update_processing(entitydata, post_update_flags)
+        if not (post_update_flags and ("nocache" in post_update_flags)):
+            self._parent.cache_add_field(self)
         self._parent.generate_coll_jsonld_context(flags=post_update_flags)
         return entitydata
 
@@ -231,6 +233,7 @@ class RecordField(EntityData):
 
         This method is called when a RecordField entity has been removed.  
         """
+        super(RecordField, self)._post_remove_processing(post_update_flags)
         self._parent.cache_remove_field(self.get_id())
         return
 
@@ -108,6 +108,7 @@ class RecordGroup(EntityData):
         It invokes the containing collection method to regenerate the JSON LD context 
         for the collection to which the group belongs.
         """
+        entitydata = super(RecordGroup, self)._post_update_processing(entitydata, post_update_flags)
         self._parent.generate_coll_jsonld_context(flags=post_update_flags)
         return entitydata
 
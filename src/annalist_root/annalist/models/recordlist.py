@@ -96,4 +96,25 @@ class RecordList(EntityData):
         # Return result
         return entitydata
 
+    def _post_update_processing(self, entitydata, post_update_flags):
+        """
+        Post-update processing.
+
+        This method is called when a RecordList entity has been created or updated.
+        """
+        entitydata = super(RecordList, self)._post_update_processing(entitydata, post_update_flags)
+        if not (post_update_flags and ("nocache" in post_update_flags)):
+            self._parent.cache_add_list(self)
+        return entitydata
+
+    def _post_remove_processing(self, post_update_flags):
+        """
+        Post-remove processing.
+
+        This method is called when a RecordList entity has been removed.  
+        """
+        super(RecordList, self)._post_remove_processing(post_update_flags)
+        self._parent.cache_remove_list(self.get_id())
+        return
+
 # End.
@@ -90,7 +90,9 @@ class RecordType(EntityData):
 
         This method is called when an entity has been created or updated.
         """
-        self._parent.cache_add_type(self)
+        entitydata = super(RecordType, self)._post_update_processing(entitydata, post_update_flags)
+        if not (post_update_flags and ("nocache" in post_update_flags)):
+            self._parent.cache_add_type(self)
         return entitydata
 
     def _post_remove_processing(self, post_update_flags):
@@ -99,6 +101,7 @@ class RecordType(EntityData):
 
         This method is called when an entity has been removed.  
         """
+        super(RecordType, self)._post_remove_processing(post_update_flags)
         self._parent.cache_remove_type(self.get_id())
         return
 
@@ -93,7 +93,20 @@ class RecordView(EntityData):
         It invokes the containing collection method to regenerate the JSON LD context 
         for the collection to which the entity belongs.
         """
+        entitydata = super(RecordView, self)._post_update_processing(entitydata, post_update_flags)
+        if not (post_update_flags and ("nocache" in post_update_flags)):
+            self._parent.cache_add_view(self)
         self._parent.generate_coll_jsonld_context(flags=post_update_flags)
         return entitydata
 
+    def _post_remove_processing(self, post_update_flags):
+        """
+        Post-remove processing.
+
+        This method is called when a RecordView entity has been removed.  
+        """
+        super(RecordView, self)._post_remove_processing(post_update_flags)
+        self._parent.cache_remove_view(self.get_id())
+        return
+
 # End.
@@ -104,7 +104,9 @@ class RecordVocab(EntityData):
         It invokes the containing collection method to regenerate the JSON LD context 
         for the collection to which the entity belongs.
         """
-        self._parent.flush_collection_caches()
+        entitydata = super(RecordVocab, self)._post_update_processing(entitydata, post_update_flags)
+        if not (post_update_flags and ("nocache" in post_update_flags)):
+            self._parent.flush_collection_caches()
         self._parent.generate_coll_jsonld_context(flags=post_update_flags)
         return entitydata
 
@@ -114,6 +116,7 @@ class RecordVocab(EntityData):
 
         This method is called when an entity has been removed.  
         """
+        super(RecordVocab, self)._post_remove_processing(post_update_flags)
         self._parent.flush_collection_caches()
         return
 
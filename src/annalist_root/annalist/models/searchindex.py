@@ -0,0 +1,478 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module maintains a full-text index of the values of entities stored in a
+collection, which is used to find entities that may contain a list search term
+without reading the data of every entity in the collection.
+
+The index for each collection is an SQLite FTS5 table, using the trigram
+tokenizer so that case-sensitive substring searches (as performed by
+`EntityFinder.entity_contains`) can be answered from the index.  It is stored in
+a file in the collection directory whose name is not a valid entity id.  Search
+terms shorter than a trigram cannot be answered from the index, so entities are
+scanned for these.
+
+The index records the collection generation value (see
+`annalist.models.collectiongeneration`) for which it is complete.  It is updated
+as entities are saved or removed, provided that it is complete on entry to the
+update, and is used only if the recorded generation matches that of the
+collection.  Otherwise (e.g. if the collection has been updated by software that
+does not maintain the index) the index is not used, and is rebuilt from the 
+collection data by a background thread (see 
+`EntityFinder.rebuild_search_index_background`) when a search is next performed.
+Changes to collection data files made other than by Annalist do not update the
+collection generation: after such changes, the index should be rebuilt using the
+`annalist-manager rebuildsearchindex` command.
+
+NOTE: `annal:url` values depend on the collection through which an entity is
+accessed, so they are not indexed (see `EntityFinder.get_entity_refs`).
+
+NOTE: entities are identified in the index by type and entity id, and the index
+is used only to select candidate entities, each of which is still checked for
+the search term.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import os.path
+import sqlite3
+import threading
+import contextlib
+
+from utils.py3porting                       import is_string
+
+from annalist                               import layout
+from annalist.identifiers                   import ANNAL
+
+from annalist.models.collectiongeneration   import (
+    get_coll_generation, update_coll_generation
+    )
+
+#   ===================================================================
+#
+#   Parameters
+#
+#   ===================================================================
+
+#   Shortest search term that can be found using the index
+SEARCH_INDEX_MIN_TERM   = 3
+
+#   Time (seconds) to wait for access to an index locked by another process
+SEARCH_INDEX_TIMEOUT    = 30.0
+
+#   Number of updates in a batch that are committed together
+SEARCH_INDEX_BATCH_SIZE = 100
+
+SEARCH_INDEX_SCHEMA = (
+    [ "CREATE TABLE IF NOT EXISTS entities "
+      "(rowid INTEGER PRIMARY KEY, type_id TEXT, entity_id TEXT, UNIQUE (type_id, entity_id))"
+    , "CREATE VIRTUAL TABLE IF NOT EXISTS entity_text "
+      "USING fts5(body, tokenize='trigram case_sensitive 1')"
+    , "CREATE TABLE IF NOT EXISTS index_state (name TEXT PRIMARY KEY, value INTEGER)"
+    ])
+
+#   ===================================================================
+#
+#   Helper functions
+#
+#   ===================================================================
+
+def get_search_index(coll):
+    """
+    Returns the search index object for the supplied collection.
+    """
+    return SearchIndex(coll)
+
+def entity_text(values):
+    """
+    Returns the indexed text for the supplied entity values, which consists of
+    all string values (but not keys) found in the entity data, one per line.
+
+    >>> entity_text({'annal:id': 'e1', 'p:a': ['l1', {'p:b': 'd1', 'p:c': 1}]})
+    'e1\\nl1\\nd1'
+    >>> entity_text({'annal:id': 'e1', 'annal:url': '/c/coll/d/t/e1/'})
+    'e1'
+    """
+    strings = []
+    def add_strings(val):
+        if isinstance(val, dict):
+            for k in val:
+                add_strings(val[k])
+        elif isinstance(val, list):
+            for v in val:
+                add_strings(v)
+        elif is_string(val):
+            strings.append(val)
+        return
+    for k in values:
+        if k != ANNAL.CURIE.url:
+            add_strings(values[k])
+    return "\n".join(strings)
+
+def search_phrase(search):
+    """
+    Returns an FTS5 query that matches text containing the supplied search term.
+
+    >>> search_phrase('a "b" c')
+    '"a ""b"" c"'
+    """
+    return '"' + search.replace('"', '""') + '"'
+
+#   ===================================================================
+#
+#   Database connections
+#
+#   ===================================================================
+
+class _ConnectionInfo(object):
+    """
+    Database connection used by a thread, with the current transaction nesting depth
+    and the state of any batch of updates being processed.
+    """
+    def __init__(self, index_path):
+        self.conn    = sqlite3.connect(
+            index_path, timeout=SEARCH_INDEX_TIMEOUT, isolation_level=None
+            )
+        self.depth   = 0
+        self.batch   = False    # Processing a batch of updates?
+        self.updates = 0        # Batch updates not yet committed
+        self.failed  = False    # Index update failed: changes are discarded
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        for stmt in SEARCH_INDEX_SCHEMA:
+            self.conn.execute(stmt)
+        return
+
+threadconnections = threading.local()   # Connections used by the current thread
+
+#   ===================================================================
+#
+#   Search index class
+#
+#   ===================================================================
+
+class SearchIndex(object):
+    """
+    Full-text index of the entities stored in a collection.
+    """
+
+    def __init__(self, coll):
+        """
+        Initialize a search index object for the supplied collection.
+        Index data is accessed when used.
+        """
+        super(SearchIndex, self).__init__()
+        self._coll          = coll
+        self._index_path    = os.path.join(coll._entitydir, layout.COLL_SEARCH_INDEX_FILE)
+        return
+
+    def __repr__(self):
+        return "SearchIndex(%r)"%(self._index_path,)
+
+    def exists(self):
+        """
+        Returns True if the index file exists.
+        """
+        return os.path.isfile(self._index_path)
+
+    def find(self, search):
+        """
+        Returns a set of (type_id, entity_id) pairs for entities in the collection
+        whose indexed values may contain the supplied search term, or None if the
+        index cannot be used (e.g. if it is not complete, or the term is too short).
+        """
+        if len(search) < SEARCH_INDEX_MIN_TERM or not self.exists():
+            return None
+        try:
+            with self._transaction("BEGIN") as conn:
+                if not self._is_complete(conn):
+                    return None
+                rows = conn.execute(
+                    "SELECT e.type_id, e.entity_id FROM entity_text "
+                    "JOIN entities AS e ON e.rowid = entity_text.rowid "
+                    "WHERE entity_text MATCH ?",
+                    (search_phrase(search),)
+                    ).fetchall()
+        except sqlite3.Error as e:
+            log.warning("SearchIndex.find: %s (%s)"%(self._index_path, e))
+            return None
+        return { (t, i) for (t, i) in rows }
+
+    def rebuild(self, entities):
+        """
+        Replace the index content with data from the supplied entities, and record
+        that it is complete for the collection generation on entry.
+
+        entities    is an iterator over (type_id, entity_id, values) for all entities
+                    in the collection.
+
+        Returns True if the index has been rebuilt, otherwise False.
+        """
+        generation  = get_coll_generation(self._coll) or update_coll_generation(self._coll)
+        entity_rows = [ (t, i, entity_text(v)) for (t, i, v) in entities ]
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM entity_text")
+                conn.execute("DELETE FROM entities")
+                for (type_id, entity_id, text) in entity_rows:
+                    self._write_entity(conn, type_id, entity_id, text)
+                self._set_generation(conn, generation)
+        except sqlite3.Error as e:
+            log.warning("SearchIndex.rebuild: %s (%s)"%(self._index_path, e))
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def updating(self, type_id, entity_id, values):
+        """
+        Context manager used to record the result of saving or removing an entity.
+        The index is locked while the enclosed block runs, and is updated if it is
+        complete on entry and the enclosed block completes normally.  An index that
+        is not complete is left to be rebuilt.
+
+            with index.updating(type_id, entity_id, values):
+                # update collection generation
+
+        The entity data is saved or removed, and any associated processing that 
+        may take some time (e.g. updating the collection JSON-LD context) is 
+        performed, before the index is locked, so that other updates to the 
+        collection are not held up.  The indexed text is also obtained before the 
+        index is locked.
+
+        type_id     is the type identifier of the entity being updated.
+        entity_id   is the identifier of the entity being updated.
+        values      are the entity values saved, or None if the entity is being removed.
+        """
+        text = None if values is None else entity_text(values)
+        with self._updating() as ci:
+            yield
+            if ci:
+                self._write_update("SearchIndex.updating", ci, (type_id, entity_id, text))
+        return
+
+    @contextlib.contextmanager
+    def updating_collection(self):
+        """
+        Context manager used to record a collection update that does not change
+        entity values (e.g. flushing collection caches).  The index is locked while
+        the enclosed block runs, and an index that is complete on entry is recorded
+        as complete for the collection generation on exit.
+
+            with index.updating_collection():
+                # update collection generation
+        """
+        with self._updating() as ci:
+            yield
+            if ci:
+                self._write_update("SearchIndex.updating_collection", ci, None)
+        return
+
+    @contextlib.contextmanager
+    def updating_batch(self):
+        """
+        Context manager used when saving or removing a batch of entities, so that
+        the index updates for the batch are committed together, in groups of
+        `SEARCH_INDEX_BATCH_SIZE` updates.  The index is locked while each group
+        is processed, but not between groups, so that other updates are not locked
+        out for the duration of a large batch.
+
+            with index.updating_batch():
+                # save entities, using `updating` and `updating_collection`
+
+        The index is recorded as complete only by the updates made within the
+        block, so if the collection is updated other than by these (e.g. by
+        another process that cannot access the index) the index is rebuilt when
+        it is next used.  Changes to the index made by the current group of
+        updates are discarded if the block raises an exception.
+        """
+        with self._updating() as ci:
+            if ci:
+                ci.batch = True
+            yield
+        return
+
+    # Local helpers
+
+    @contextlib.contextmanager
+    def _updating(self):
+        """
+        Context manager for index updates that accompany changes to collection
+        data.  The index is locked while the enclosed block runs, which is passed
+        the connection information to use for updating the index, or None if the
+        index is not to be updated (i.e. it does not exist, cannot be accessed, 
+        or is not complete on entry).  Changes are discarded if the enclosed block
+        raises an exception, or if an earlier update has failed.
+        """
+        ci = None
+        if self.exists():
+            try:
+                ci = self._begin()
+                if ci.failed or not self._is_complete(ci.conn):
+                    self._end(ci, commit=False)
+                    ci = None
+            except sqlite3.Error as e:
+                log.warning("SearchIndex._updating: %s (%s)"%(self._index_path, e))
+                if ci:
+                    self._end(ci, commit=False)
+                ci = None
+        try:
+            yield ci
+        except:
+            if ci:
+                self._end(ci, commit=False)
+            raise
+        if ci:
+            try:
+                self._end(ci, commit=True)
+                if ci.batch and (ci.depth == 1) and not ci.failed:
+                    self._batch_update(ci)
+            except sqlite3.Error as e:
+                log.warning("SearchIndex._updating: %s (%s)"%(self._index_path, e))
+                ci.failed = True
+        return
+
+    def _write_update(self, caller, ci, entity):
+        """
+        Write index changes for an update, and record that the index is complete
+        for the resulting collection generation.  If the index cannot be written,
+        the error is logged and changes to the index are discarded, so that it is
+        rebuilt when next used.
+
+        caller      is a name used to identify the update in logged messages.
+        ci          is the connection information for the update.
+        entity      is a tuple (type_id, entity_id, text) for an entity whose indexed 
+                    text is updated (see `_write_entity`), or None.
+        """
+        try:
+            if entity is not None:
+                self._write_entity(ci.conn, *entity)
+            self._set_generation(ci.conn, get_coll_generation(self._coll))
+        except sqlite3.Error as e:
+            log.warning("%s: %s (%s)"%(caller, self._index_path, e))
+            ci.failed = True
+        return
+
+    def _batch_update(self, ci):
+        """
+        Count an update made while processing a batch, and commit the updates
+        made so far when `SEARCH_INDEX_BATCH_SIZE` is reached.  This releases the
+        index lock until the next update in the batch starts a new transaction
+        (see `_begin`).
+        """
+        ci.updates += 1
+        if ci.updates >= SEARCH_INDEX_BATCH_SIZE:
+            ci.updates = 0
+            ci.conn.execute("COMMIT")
+        return
+
+    @contextlib.contextmanager
+    def _transaction(self, begin="BEGIN IMMEDIATE"):
+        """
+        Context manager for an interlocked sequence of database operations,
+        which may be nested.  Changes are committed on exit from the outermost
+        transaction, or discarded if an exception is raised.
+        """
+        ci = self._begin(begin)
+        try:
+            yield ci.conn
+        except:
+            self._end(ci, commit=False)
+            raise
+        self._end(ci, commit=True)
+        return
+
+    def _begin(self, begin="BEGIN IMMEDIATE"):
+        """
+        Start a (possibly nested) transaction, and return the connection
+        information used.
+        """
+        conns = getattr(threadconnections, "conns", None)
+        if conns is None:
+            conns = {}
+            threadconnections.conns = conns
+        ci = conns.get(self._index_path, None)
+        if ci is None:
+            ci = _ConnectionInfo(self._index_path)
+            conns[self._index_path] = ci
+        if (ci.depth == 0) or not ci.conn.in_transaction:
+            # New transaction, or next group of updates in a batch
+            try:
+                ci.conn.execute(begin)
+            except:
+                if ci.depth == 0:
+                    self._close(conns, ci)
+                raise
+        ci.depth += 1
+        return ci
+
+    def _end(self, ci, commit):
+        """
+        End a transaction started by `_begin`.  Changes are committed or discarded 
+        on exit from the outermost transaction, and the database connection is closed.
+        """
+        ci.depth -= 1
+        if ci.depth == 0:
+            try:
+                if ci.conn.in_transaction:
+                    ci.conn.execute("COMMIT" if (commit and not ci.failed) else "ROLLBACK")
+            finally:
+                self._close(threadconnections.conns, ci)
+        return
+
+    def _close(self, conns, ci):
+        del conns[self._index_path]
+        ci.conn.close()
+        return
+
+    def _is_complete(self, conn):
+        """
+        Returns True if the index is complete for the current collection generation.
+        """
+        row = conn.execute(
+            "SELECT value FROM index_state WHERE name = 'generation'"
+            ).fetchone()
+        return (row is not None) and (row[0] != 0) and (row[0] == get_coll_generation(self._coll))
+
+    def _set_generation(self, conn, generation):
+        conn.execute(
+            "INSERT OR REPLACE INTO index_state (name, value) VALUES ('generation', ?)",
+            (generation,)
+            )
+        return
+
+    def _write_entity(self, conn, type_id, entity_id, text):
+        """
+        Write indexed text for an entity, or remove it from the index if `text` is None.
+        """
+        row = conn.execute(
+            "SELECT rowid FROM entities WHERE type_id = ? AND entity_id = ?",
+            (type_id, entity_id)
+            ).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM entity_text WHERE rowid = ?", row)
+        if text is None:
+            conn.execute("DELETE FROM entities WHERE type_id = ? AND entity_id = ?",
+                (type_id, entity_id)
+                )
+            return
+        if row is None:
+            row = (
+                conn.execute(
+                    "INSERT INTO entities (type_id, entity_id) VALUES (?, ?)",
+                    (type_id, entity_id)
+                    ).lastrowid,
+                )
+        conn.execute("INSERT INTO entity_text (rowid, body) VALUES (?, ?)", (row[0], text))
+        return
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+# End.
@@ -39,6 +39,7 @@ from annalist.models.annalistuser   import AnnalistUser
 from annalist.models.entityroot     import EntityRoot
 from annalist.models.sitedata       import SiteData
 from annalist.models.collection     import Collection
+from annalist.models.collectiongeneration   import update_coll_generation
 from annalist.models.recordvocab    import RecordVocab
 from annalist.models.recordview     import RecordView
 from annalist.models.recordfield    import RecordField
@@ -444,6 +445,8 @@ class Site(EntityRoot):
         d = os.path.join(site_data_tgt, sdir)
         if os.path.isdir(s):
             replacetree(s, d)
+            # Cached values derived from replaced data are no longer valid
+            update_coll_generation(sitedata, config=True)
         return
 
     @staticmethod
@@ -457,6 +460,8 @@ class Site(EntityRoot):
         d = os.path.join(site_data_tgt, sdir)
         if os.path.isdir(s):
             updatetree(s, d)
+            # Cached values derived from replaced data are no longer valid
+            update_coll_generation(sitedata, config=True)
         return
 
     @staticmethod
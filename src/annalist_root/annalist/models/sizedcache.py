@@ -0,0 +1,165 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module provides a size-bounded in-memory least-recently-used cache, which
+is the basis for caches of entity data and rendered text, and a function that
+creates and returns the cache whose size is given by a named configuration
+setting.
+
+Each cache is not used unless enabled by setting its configuration value to the
+maximum total size of the values to be saved.
+
+The present implementation assumes a single-process, multi-threaded environment
+and interlocks cache accesses to avoid possible cache-related race conditions.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import threading
+from collections                    import OrderedDict
+
+from django.conf                    import settings
+
+#   ===================================================================
+#
+#   Cache creation and discovery
+#
+#   ===================================================================
+
+sizedcachelock  = threading.Lock()  # Interlocks creation of caches
+sized_caches    = {}                # Caches, keyed by size setting name, created when first used
+
+def get_sized_cache(setting_name, cache_class):
+    """
+    Returns the cache whose maximum size is given by the named setting, or None
+    if the setting is not defined or zero.
+
+    The cache is created when first used, and is re-created if the configured
+    size is changed.
+
+    setting_name    is the name of the setting that gives the maximum size of the cache.
+    cache_class     is the class of cache to be created (`SizedCache` or a subclass).
+    """
+    max_size = getattr(settings, setting_name, 0)
+    if not max_size:
+        return None
+    with sizedcachelock:
+        cache = sized_caches.get(setting_name, None)
+        if ( (cache is None) or
+             (cache.max_size() != max_size) or
+             (cache.__class__ is not cache_class) ):
+            cache = cache_class(max_size)
+            sized_caches[setting_name] = cache
+    return cache
+
+#   ===================================================================
+#
+#   Size-bounded cache class
+#
+#   ===================================================================
+
+class SizedCache(object):
+    """
+    Least-recently-used cache of values, bounded by total size.
+
+    Values saved using `set` are sized by their length (e.g. the number of
+    characters in a string), and are returned without copying, so they should
+    not be modified by the caller.  Subclasses may save other values using `_set`.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initialize a new cache.
+
+        max_size    is the maximum total size of cached values.
+        """
+        super(SizedCache, self).__init__()
+        self._max_size  = max_size
+        self._size      = 0
+        self._values    = OrderedDict()     # key -> (size, value)
+        self._lock      = threading.Lock()
+        return
+
+    def __repr__(self):
+        return "%s(max_size %d, size %d, entries %d)"%(
+            self.__class__.__name__, self._max_size, self._size, len(self._values)
+            )
+
+    def max_size(self):
+        return self._max_size
+
+    def size(self):
+        """
+        Returns total size of cached values.
+        """
+        return self._size
+
+    def get(self, key):
+        """
+        Returns cached value, or None.
+        """
+        with self._lock:
+            return self._get(key)
+
+    def set(self, key, value):
+        """
+        Save value in the cache.  Values larger than the cache are not saved.
+        """
+        self._set(key, value, len(value))
+        return
+
+    def remove(self, key):
+        """
+        Remove value from the cache, if present.
+        """
+        with self._lock:
+            self._remove(key)
+        return
+
+    def flush(self):
+        """
+        Remove all values from the cache.
+        """
+        with self._lock:
+            self._values.clear()
+            self._size = 0
+        return
+
+    def _get(self, key):
+        """
+        Returns cached value, or None, and marks it as most recently used.
+        Must be called with the cache lock acquired.
+        """
+        if key not in self._values:
+            return None
+        self._values.move_to_end(key)
+        return self._values[key][1]
+
+    def _set(self, key, value, size):
+        """
+        Save value of the indicated size in the cache, discarding least recently
+        used values as needed.
+        """
+        if size > self._max_size:
+            return
+        with self._lock:
+            self._remove(key)
+            self._values[key] = (size, value)
+            self._size += size
+            while self._size > self._max_size:
+                self._remove(next(iter(self._values)))
+        return
+
+    def _remove(self, key):
+        if key in self._values:
+            (size, value) = self._values.pop(key)
+            self._size -= size
+        return
+
+# End.
@@ -0,0 +1,263 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module provides an object cache implementation (see `annalist.models.objectcache`)
+that keeps cached values in an SQLite database file, so that they are shared by all
+server processes that use the same file, and are retained when a server process is
+restarted.  No separate cache service is needed.
+
+To use this implementation, use these settings:
+
+    OBJECT_CACHE_BACKEND = "annalist.models.sqliteobjectcache.SqliteObjectCache"
+    OBJECT_CACHE_PATH    = <database file name>
+
+If `OBJECT_CACHE_PATH` is not specified, file "objectcache.sqlite3" in the site
+base directory is used.
+
+Values are saved in pickled form, so each value retrieved is a new copy: updates
+to a value are saved only when it is stored using `set`, or when it is updated
+using the `access` context manager, which is interlocked across all processes
+using a database transaction.
+
+Closing a cache object, or removing it from the set of object caches, does not
+discard the cached values, which may still be used by other processes; these are
+discarded by `flush`.  Code that uses cached values must ensure that they remain
+consistent with the data from which they are derived (e.g. see
+`annalist.models.collectionentitycache`).  Deleting the database file (while no
+server process is running) discards all cached values.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import os.path
+import pickle
+import sqlite3
+import threading
+import traceback
+import contextlib
+
+from django.conf                    import settings
+
+from annalist.models.objectcache    import Cache_Error
+
+#   Default cache database file name, in the site base directory
+OBJECT_CACHE_FILE = "objectcache.sqlite3"
+
+#   Time (seconds) to wait for access to the database locked by another process
+OBJECT_CACHE_TIMEOUT = 30.0
+
+#   ===================================================================
+#
+#   Database connections
+#
+#   ===================================================================
+
+def get_cache_path():
+    """
+    Returns the name of the configured cache database file.
+    """
+    return (
+        getattr(settings, "OBJECT_CACHE_PATH", None) or
+        os.path.join(settings.BASE_SITE_DIR, OBJECT_CACHE_FILE)
+        )
+
+class _ConnectionInfo(object):
+    """
+    Database connection used by a thread, with the current transaction nesting depth.
+    """
+    def __init__(self, db_path):
+        self.conn  = sqlite3.connect(
+            db_path, timeout=OBJECT_CACHE_TIMEOUT, isolation_level=None
+            )
+        self.depth = 0
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS objectcache "
+            "(cachekey TEXT, key TEXT, value BLOB, PRIMARY KEY (cachekey, key))"
+            )
+        return
+
+threadconnections = threading.local()   # Connections used by the current thread
+
+def _get_connection_info(db_path):
+    """
+    Returns connection information for the current thread and indicated database file.
+
+    Connections are not shared between threads, nor with a forked process.
+    """
+    pid   = os.getpid()
+    conns = getattr(threadconnections, "conns", None)
+    if (conns is None) or (threadconnections.pid != pid):
+        conns = {}
+        threadconnections.conns = conns
+        threadconnections.pid   = pid
+    if db_path not in conns:
+        conns[db_path] = _ConnectionInfo(db_path)
+    return conns[db_path]
+
+#   ===================================================================
+#
+#   Object cache class
+#
+#   ===================================================================
+
+class SqliteObjectCache(object):
+    """
+    A class for caching objects of some type, with values held in a database
+    file that is shared between processes.
+
+    The cache is identified by is cache key value that is used to distinguish
+    a particular object cache from all others (see also `getCache`).  Values that
+    identify caches and cached objects must have a `repr` that uniquely identifies
+    them (e.g. strings, or tuples of strings).
+    """
+
+    def __init__(self, cachekey):
+        self._cachekey  = cachekey
+        self._dbkey     = repr(cachekey)
+        self._db_path   = get_cache_path()
+        self._opened    = traceback.extract_stack()
+        self._closed    = None
+        return
+
+    def _check_open(self, key):
+        if self._closed is not None:
+            msg = "Access after cache closed (%r, %s)"%(self._cachekey, key)
+            log.error(msg)
+            log.debug("---- closed at:")
+            log.debug("".join(traceback.format_list(self._closed)))
+            log.debug("----")
+            raise Cache_Error(value=self._cachekey, msg=msg)
+        return
+
+    def _connection_info(self):
+        try:
+            return _get_connection_info(self._db_path)
+        except sqlite3.Error as e:
+            msg = "Cannot open object cache %s (%s)"%(self._db_path, e)
+            log.error(msg)
+            raise Cache_Error(value=self._db_path, msg=msg)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """
+        Context manager for an interlocked sequence of database operations,
+        which may be nested.  Changes are committed on exit from the outermost
+        transaction, or discarded if an exception is raised.
+        """
+        ci = self._connection_info()
+        if ci.depth == 0:
+            ci.conn.execute("BEGIN IMMEDIATE")
+        ci.depth += 1
+        try:
+            yield ci.conn
+        except:
+            ci.depth -= 1
+            if ci.depth == 0:
+                ci.conn.execute("ROLLBACK")
+            raise
+        ci.depth -= 1
+        if ci.depth == 0:
+            ci.conn.execute("COMMIT")
+        return
+
+    def _read(self, conn, key):
+        row = conn.execute(
+            "SELECT value FROM objectcache WHERE cachekey = ? AND key = ?",
+            (self._dbkey, repr(key))
+            ).fetchone()
+        return None if row is None else (pickle.loads(row[0]),)
+
+    def _write(self, conn, key, value):
+        conn.execute(
+            "INSERT OR REPLACE INTO objectcache (cachekey, key, value) VALUES (?, ?, ?)",
+            (self._dbkey, repr(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            )
+        return
+
+    def _delete(self, conn, key):
+        conn.execute(
+            "DELETE FROM objectcache WHERE cachekey = ? AND key = ?",
+            (self._dbkey, repr(key))
+            )
+        return
+
+    def cache_key(self):
+        """
+        Return cache key (e.g. for use with 'remove_cache')
+        """
+        return self._cachekey
+
+    def flush(self):
+        """
+        Remove all objects from cache, for all processes.
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM objectcache WHERE cachekey = ?", (self._dbkey,))
+        return self
+
+    def close(self):
+        """
+        Close down this cache object.  Once closed, it cannot be used again.
+        Cached values are retained for use by other cache objects.
+        """
+        self._closed = traceback.extract_stack()
+        return
+
+    def set(self, key, value):
+        """
+        Save object value in cache (overwriting any existing value for the key).
+        """
+        self._check_open(key)
+        with self._transaction() as conn:
+            self._write(conn, key, value)
+        return value
+
+    def get(self, key, default=None):
+        """
+        Retrieve object value from cache, or return default value
+        """
+        self._check_open(key)
+        # A single read does not need to lock out other processes
+        found = self._read(self._connection_info().conn, key)
+        return default if found is None else found[0]
+
+    def pop(self, key, default=None):
+        """
+        Remove object value from cache, return that or default value
+        """
+        self._check_open(key)
+        with self._transaction() as conn:
+            found = self._read(conn, key)
+            if found is not None:
+                self._delete(conn, key)
+        return default if found is None else found[0]
+
+    @contextlib.contextmanager
+    def access(self, *keys):
+        """
+        A context manager for interlocked access to a cached value.
+
+        See `ObjectCache.access`: the access is interlocked with all processes
+        using the cache database.
+        """
+        self._check_open(keys)
+        with self._transaction() as conn:
+            value_dict = {}
+            for key in keys:
+                found = self._read(conn, key)
+                if found is not None:
+                    value_dict[key] = found[0]
+            yield value_dict
+            for key in value_dict:
+                self._write(conn, key, value_dict[key])
+        return
+
+# End.
@@ -38,6 +38,8 @@ from annalist.models.recordtypedata import RecordTypeData
 from annalist.models.entitydata     import EntityData
 from annalist.models.collectiondata import initialize_coll_data, copy_coll_data, migrate_coll_data
 
+from annalist.views.rendercache     import flush_listrow_cache
+
 from .entity_testutils              import collection_create_values
 from .entity_testtypedata           import recordtype_create_values
 from .tests import (
@@ -92,8 +94,8 @@ def copySitedata(src, sitedatasrc, tgt):
         dt = os.path.join(tgt, "c")
         # Update collections, not site data; first remove old collections
         for coll_id in os.listdir(dt):
-            if coll_id != layout.SITEDATA_ID:
-                d = os.path.join(dt, coll_id)
+            d = os.path.join(dt, coll_id)
+            if coll_id != layout.SITEDATA_ID and os.path.isdir(d):
                 removetree(d)
         for coll_id in os.listdir(ds):
             if coll_id != layout.SITEDATA_ID:
@@ -115,6 +117,7 @@ def init_annalist_test_site():
     testsite = Site(TestBaseUri, TestBaseDir)
     testsite.generate_site_jsonld_context()
     Collection.flush_all_caches()
+    flush_listrow_cache()
     # Reset id generator counters
     EntityData._last_id   = 0
     RecordType._last_id   = 0
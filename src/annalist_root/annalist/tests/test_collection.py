@@ -32,6 +32,10 @@ from annalist.models.site           import Site
 from annalist.models.collection     import Collection
 from annalist.models.annalistuser   import AnnalistUser
 from annalist.models.recordtype     import RecordType
+from annalist.models.recordvocab    import RecordVocab
+from annalist.models.collectiongeneration   import (
+    get_coll_generation, get_coll_config_generation
+    )
 
 from annalist.views.collection      import CollectionEditView
 
@@ -398,6 +402,85 @@ class CollectionTest(AnnalistTestCase):
                 parents   = self.testcoll.set_alt_entities(altcoll1)
         return
 
+    def test_get_alt_entities_cached(self):
+        altcoll1  = Collection(self.testsite, "altcoll1")
+        parents   = self.testcoll.get_alt_entities(altscope="all")
+        self.assertEqual([ p.get_id() for p in parents ], ["testcoll", layout.SITEDATA_ID])
+        self.assertIs(self.testcoll.get_alt_entities(altscope="all")[1], parents[1])
+        # Returned list is a copy
+        parents.append(altcoll1)
+        self.assertEqual(len(self.testcoll.get_alt_entities(altscope="all")), 2)
+        # Cached lists are discarded when alternative parent is changed
+        self.testcoll.set_alt_entities(altcoll1)
+        parentids = [ p.get_id() for p in self.testcoll.get_alt_entities(altscope="all") ]
+        self.assertEqual(parentids, ["testcoll", "altcoll1", layout.SITEDATA_ID])
+        parentids = [ p.get_id() for p in self.testcoll.get_alt_entities(altscope="nosite") ]
+        self.assertEqual(parentids, ["testcoll", "altcoll1"])
+        return
+
+    def test_get_alt_entities_parent_changed(self):
+        # Change to alternative parent of an alternative parent collection
+        coll_id   = "altcoll1"
+        altcoll1  = Collection.create(self.testsite, coll_id, collection_create_values(coll_id))
+        altcoll1.set_alt_entities(self.testcoll)
+        newcoll   = Collection(self.testsite, "newcoll")
+        newcoll.set_alt_entities(altcoll1)
+        parentids = [ p.get_id() for p in newcoll.get_alt_entities(altscope="all") ]
+        self.assertEqual(parentids, ["newcoll", "altcoll1", "testcoll", layout.SITEDATA_ID])
+        altcoll1.set_alt_entities(self.testsite.site_data_collection())
+        parentids = [ p.get_id() for p in newcoll.get_alt_entities(altscope="all") ]
+        self.assertEqual(parentids, ["newcoll", "altcoll1", layout.SITEDATA_ID])
+        return
+
+    def test_deferring_jsonld_context(self):
+        def read_context():
+            with self.testcoll._metaobj(
+                    layout.META_COLL_BASE_REF, layout.COLL_CONTEXT_FILE, "rt"
+                    ) as context_io:
+                return json.load(context_io)["@context"]
+        def create_vocab(vocab_id):
+            RecordVocab.create(self.testcoll, vocab_id,
+                { RDFS.CURIE.label:   "Vocabulary %s"%(vocab_id,)
+                , ANNAL.CURIE.uri:    "http://example.org/%s/"%(vocab_id,)
+                })
+        self.testcoll.generate_coll_jsonld_context()
+        with self.testcoll.deferring_jsonld_context():
+            create_vocab("vocab1")
+            with Collection.load(self.testsite, "testcoll").deferring_jsonld_context():
+                create_vocab("vocab2")
+            self.assertNotIn("vocab1", read_context())
+            self.assertNotIn("vocab2", read_context())
+        context = read_context()
+        self.assertEqual(context["vocab1"], "http://example.org/vocab1/")
+        self.assertEqual(context["vocab2"], "http://example.org/vocab2/")
+        # Not deferred
+        create_vocab("vocab3")
+        self.assertEqual(read_context()["vocab3"], "http://example.org/vocab3/")
+        return
+
+    def test_get_field_uri_jsonld_context_saved(self):
+        def get_field_context(fid):
+            return self.testcoll.get_field_uri_jsonld_context(
+                fid, self.testcoll.get_field_jsonld_context, field_contexts
+                )
+        field_contexts = {}
+        furi, fcontext, field_list = get_field_context("Entity_see_also_r")
+        self.assertEqual(furi, "rdfs:seeAlso")
+        self.assertEqual(fcontext, {"@type": "@id", "@container": "@set"})
+        self.assertEqual(len(field_list), 1)
+        self.assertEqual(list(field_contexts), ["Entity_see_also_r"])
+        # A new copy of saved context information is returned
+        fcontext['vid'] = "Default_view"
+        furi, fcontext, field_list = get_field_context("Entity_see_also_r")
+        self.assertEqual(fcontext, {"@type": "@id", "@container": "@set"})
+        # Saved result is used
+        field_contexts["Entity_see_also_r"] = ("test:saved", {"@type": "@id"}, None)
+        self.assertEqual(
+            get_field_context("Entity_see_also_r"), ("test:saved", {"@type": "@id"}, None)
+            )
+        self.assertEqual(get_field_context("no_field"), (None, None, None))
+        return
+
     def test_alt_parent_inherit_coll(self):
         # Test inheritance of definitions from an alternative collection
         # (tescoll is set up with testtype created)
@@ -520,6 +603,16 @@ class CollectionEditViewTest(AnnalistTestCase):
             )
         return
 
+    def test_get_edit_no_generation_update(self):
+        # Displaying the customize page does not record a collection update
+        g1 = get_coll_generation(self.coll1)
+        c1 = get_coll_config_generation(self.coll1)
+        r = self.client.get(self.edit_url)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(get_coll_generation(self.coll1), g1)
+        self.assertEqual(get_coll_config_generation(self.coll1), c1)
+        return
+
     def test_get_edit_no_collection(self):
         u = collection_edit_url(coll_id="no_collection")
         r = self.client.get(u)
@@ -0,0 +1,148 @@
+"""
+Tests for collection generation values, and their use to keep per-process
+collection caches consistent with updates made by other server processes.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.collection         import Collection
+from annalist.models.recordtype         import RecordType
+from annalist.models.collectiongeneration   import (
+    get_coll_generation, get_coll_config_generation,
+    update_coll_generation, coll_config_updated
+    )
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Collection generation tests
+#
+#   -----------------------------------------------------------------------------
+
+class CollectionGenerationTest(AnnalistTestCase):
+    """
+    Tests collection generation values and cache consistency checks
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.sitedata = self.testsite.site_data_collection()
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(CollectionGenerationTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def other_process_coll(self, coll_id="testcoll"):
+        # New collection object, as used for a request in another process
+        return Collection.load(self.testsite, coll_id, altscope="all")
+
+    def write_type_label(self, type_id, label):
+        # Update type description in storage without updating caches
+        type_path = RecordType.path(self.testcoll, type_id)
+        with open(type_path, "r") as type_io:
+            type_data = json.load(type_io)
+        type_data[RDFS.CURIE.label] = label
+        with open(type_path, "w") as type_io:
+            json.dump(type_data, type_io, indent=2)
+        return
+
+    def test_generation_file(self):
+        g1 = get_coll_generation(self.testcoll)
+        g2 = update_coll_generation(self.testcoll)
+        self.assertGreater(g2, g1)
+        gen_path = os.path.join(self.testcoll._entitydir, layout.COLL_GENERATION_FILE)
+        self.assertTrue(os.path.isfile(gen_path))
+        # Value is visible to other collection objects
+        self.assertEqual(get_coll_generation(self.other_process_coll()), g2)
+        # Configuration generation is updated only when requested
+        c1 = get_coll_config_generation(self.testcoll)
+        update_coll_generation(self.testcoll)
+        self.assertEqual(get_coll_config_generation(self.testcoll), c1)
+        update_coll_generation(self.testcoll, config=True)
+        self.assertGreater(get_coll_config_generation(self.testcoll), c1)
+        return
+
+    def test_generation_files_not_entities(self):
+        update_coll_generation(self.testcoll, config=True)
+        coll_ids = [ c.get_id() for c in self.testsite.collections() ]
+        self.assertIn("testcoll", coll_ids)
+        for c in coll_ids:
+            self.assertFalse(c.startswith("."))
+        type_ids = list(self.testcoll.child_entity_ids(RecordType, altscope="all"))
+        self.assertNotIn(layout.COLL_GENERATION_FILE, type_ids)
+        return
+
+    def test_config_update_on_type_save(self):
+        c1 = get_coll_config_generation(self.testcoll)
+        t = RecordType.load(self.testcoll, "testtype")
+        t[RDFS.CURIE.label] = "Updated label"
+        t._save()
+        self.assertGreater(get_coll_config_generation(self.testcoll), c1)
+        return
+
+    def test_coll_config_updated(self):
+        coll = self.other_process_coll()
+        # Record current values (values seen are retained by the test process)
+        coll_config_updated(coll)
+        self.assertEqual(coll_config_updated(coll), [])
+        update_coll_generation(self.testcoll, config=True)
+        updated = [ c.get_id() for c in coll_config_updated(coll) ]
+        self.assertEqual(updated, ["testcoll"])
+        # Update to inherited configuration
+        update_coll_generation(self.sitedata, config=True)
+        updated = [ c.get_id() for c in coll_config_updated(coll) ]
+        self.assertEqual(updated, [layout.SITEDATA_ID])
+        self.assertEqual(coll_config_updated(coll), [])
+        # Data update is not a configuration update
+        update_coll_generation(self.testcoll)
+        self.assertEqual(coll_config_updated(coll), [])
+        return
+
+    def test_check_collection_caches(self):
+        coll = self.other_process_coll()
+        coll.check_collection_caches()
+        self.assertEqual(coll.cache_get_type("testtype")[RDFS.CURIE.label], "RecordType testcoll/_type/testtype")
+        # Update in storage (e.g. by another process) is not seen while cached
+        self.write_type_label("testtype", "Label from other process")
+        coll = self.other_process_coll()
+        coll.check_collection_caches()
+        self.assertEqual(coll.cache_get_type("testtype")[RDFS.CURIE.label], "RecordType testcoll/_type/testtype")
+        # Update is seen after configuration update is recorded
+        update_coll_generation(self.other_process_coll(), config=True)
+        coll = self.other_process_coll()
+        coll.check_collection_caches()
+        self.assertEqual(coll.cache_get_type("testtype")[RDFS.CURIE.label], "Label from other process")
+        return
+
+# End.
@@ -0,0 +1,136 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+Tests for collection list definition cache class.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist.identifiers                   import RDFS
+
+from annalist.models.site                   import Site
+from annalist.models.collection             import Collection
+from annalist.models.recordlist             import RecordList
+from annalist.models.collectionlistcache    import CollectionListCache
+from annalist.models.collectiongeneration   import update_coll_generation
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testlistdata import (
+    recordlist_create_values
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   CollectionListCache tests
+#
+#   -----------------------------------------------------------------------------
+
+class CollectionListCacheTest(AnnalistTestCase):
+    """
+    Tests CollectionListCache class, and its use by Collection methods.
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite     = Site(TestBaseUri, TestBaseDir)
+        self.testcoll     = init_annalist_test_coll()
+        self.testcoll1_a  = Collection(self.testsite, "testcoll1")
+        self.testcoll1_b  = Collection(self.testsite, "testcoll1")
+        self.testcoll2_a  = Collection(self.testsite, "testcoll2")
+        self.listcache    = CollectionListCache()
+        self.list1        = RecordList(self.testcoll1_a, "list1")
+        self.list1.set_values(
+            recordlist_create_values(coll_id="testcoll1", list_id="list1")
+            )
+        return
+
+    def tearDown(self):
+        resetSitedata(scope="collections")
+        return
+
+    def create_list_record(self, coll, list_entity):
+        return RecordList.create(coll, list_entity.get_id(), list_entity.get_values())
+
+    def write_list_label(self, list_id, label):
+        # Update list description in storage without updating caches
+        list_path = RecordList.path(self.testcoll, list_id)
+        with open(list_path, "r") as list_io:
+            list_data = json.load(list_io)
+        list_data[RDFS.CURIE.label] = label
+        with open(list_path, "w") as list_io:
+            json.dump(list_data, list_io, indent=2)
+        return
+
+    def test_empty_cache(self):
+        self.assertEqual(set(self.listcache.get_all_lists(self.testcoll1_a)), set())
+        self.assertEqual(set(self.listcache.get_all_lists(self.testcoll2_a)), set())
+        return
+
+    def test_singleton_cache(self):
+        # Test that cached values are shared between different instantiations
+        # of the same collection.
+        self.assertEqual(self.listcache.get_list(self.testcoll1_a, "list1"), None)
+        self.create_list_record(self.testcoll1_a, self.list1)
+        self.assertFalse(self.listcache.set_list(self.testcoll1_a, self.list1))
+        self.assertEqual(self.listcache.get_list(self.testcoll1_a, "list1").get_id(), "list1")
+        self.assertEqual(self.listcache.get_list(self.testcoll1_b, "list1").get_id(), "list1")
+        self.assertEqual([ e.get_id() for e in self.listcache.get_all_lists(self.testcoll1_b) ], ["list1"])
+        self.assertEqual([ e.get_id() for e in self.listcache.get_all_lists(self.testcoll2_a) ], [])
+        self.assertIsNotNone(self.listcache.remove_list(self.testcoll1_a, "list1"))
+        self.assertEqual(self.listcache.get_list(self.testcoll1_b, "list1"), None)
+        return
+
+    def test_get_all_lists_scope_all(self):
+        self.create_list_record(self.testcoll1_a, self.list1)
+        list_ids = set(e.get_id() for e in self.listcache.get_all_lists(self.testcoll1_a, altscope="all"))
+        self.assertIn("list1", list_ids)
+        self.assertIn("Default_list", list_ids)
+        self.assertNotIn("_initial_values", list_ids)
+        return
+
+    def test_collection_list_updated(self):
+        # Collection list access is updated when lists are saved or removed
+        self.assertEqual(self.testcoll.get_list("list1"), None)
+        list1 = self.create_list_record(self.testcoll, self.list1)
+        self.assertIn("list1", [ e.get_id() for e in self.testcoll.lists(altscope=None) ])
+        list1[RDFS.CURIE.label] = "Updated label"
+        list1._save()
+        self.assertEqual(self.testcoll.get_list("list1")[RDFS.CURIE.label], "Updated label")
+        self.testcoll.remove_list("list1")
+        self.assertEqual(self.testcoll.get_list("list1"), None)
+        self.assertNotIn("list1", [ e.get_id() for e in self.testcoll.lists(altscope=None) ])
+        return
+
+    def test_collection_list_cached(self):
+        self.create_list_record(self.testcoll, self.list1)
+        self.assertEqual(self.testcoll.get_list("list1")[RDFS.CURIE.label], "RecordList testcoll1/list1")
+        # Cached values are used without reading list data
+        self.write_list_label("list1", "Label not read")
+        self.assertEqual(self.testcoll.get_list("list1")[RDFS.CURIE.label], "RecordList testcoll1/list1")
+        # Recorded configuration update causes list data to be re-read
+        update_coll_generation(self.testcoll, config=True)
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        coll.check_collection_caches()
+        self.assertEqual(coll.get_list("list1")[RDFS.CURIE.label], "Label not read")
+        return
+
+if __name__ == "__main__":
+    unittest.main()
+
+# End.
@@ -0,0 +1,136 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+Tests for collection view definition cache class.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist.identifiers                   import RDFS
+
+from annalist.models.site                   import Site
+from annalist.models.collection             import Collection
+from annalist.models.recordview             import RecordView
+from annalist.models.collectionviewcache    import CollectionViewCache
+from annalist.models.collectiongeneration   import update_coll_generation
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testviewdata import (
+    recordview_create_values
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   CollectionViewCache tests
+#
+#   -----------------------------------------------------------------------------
+
+class CollectionViewCacheTest(AnnalistTestCase):
+    """
+    Tests CollectionViewCache class, and its use by Collection methods.
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite     = Site(TestBaseUri, TestBaseDir)
+        self.testcoll     = init_annalist_test_coll()
+        self.testcoll1_a  = Collection(self.testsite, "testcoll1")
+        self.testcoll1_b  = Collection(self.testsite, "testcoll1")
+        self.testcoll2_a  = Collection(self.testsite, "testcoll2")
+        self.viewcache    = CollectionViewCache()
+        self.view1        = RecordView(self.testcoll1_a, "view1")
+        self.view1.set_values(
+            recordview_create_values(coll_id="testcoll1", view_id="view1")
+            )
+        return
+
+    def tearDown(self):
+        resetSitedata(scope="collections")
+        return
+
+    def create_view_record(self, coll, view_entity):
+        return RecordView.create(coll, view_entity.get_id(), view_entity.get_values())
+
+    def write_view_label(self, view_id, label):
+        # Update view description in storage without updating caches
+        view_path = RecordView.path(self.testcoll, view_id)
+        with open(view_path, "r") as view_io:
+            view_data = json.load(view_io)
+        view_data[RDFS.CURIE.label] = label
+        with open(view_path, "w") as view_io:
+            json.dump(view_data, view_io, indent=2)
+        return
+
+    def test_empty_cache(self):
+        self.assertEqual(set(self.viewcache.get_all_views(self.testcoll1_a)), set())
+        self.assertEqual(set(self.viewcache.get_all_views(self.testcoll2_a)), set())
+        return
+
+    def test_singleton_cache(self):
+        # Test that cached values are shared between different instantiations
+        # of the same collection.
+        self.assertEqual(self.viewcache.get_view(self.testcoll1_a, "view1"), None)
+        self.create_view_record(self.testcoll1_a, self.view1)
+        self.assertFalse(self.viewcache.set_view(self.testcoll1_a, self.view1))
+        self.assertEqual(self.viewcache.get_view(self.testcoll1_a, "view1").get_id(), "view1")
+        self.assertEqual(self.viewcache.get_view(self.testcoll1_b, "view1").get_id(), "view1")
+        self.assertEqual([ e.get_id() for e in self.viewcache.get_all_views(self.testcoll1_b) ], ["view1"])
+        self.assertEqual([ e.get_id() for e in self.viewcache.get_all_views(self.testcoll2_a) ], [])
+        self.assertIsNotNone(self.viewcache.remove_view(self.testcoll1_a, "view1"))
+        self.assertEqual(self.viewcache.get_view(self.testcoll1_b, "view1"), None)
+        return
+
+    def test_get_all_views_scope_all(self):
+        self.create_view_record(self.testcoll1_a, self.view1)
+        view_ids = set(e.get_id() for e in self.viewcache.get_all_views(self.testcoll1_a, altscope="all"))
+        self.assertIn("view1", view_ids)
+        self.assertIn("Default_view", view_ids)
+        self.assertNotIn("_initial_values", view_ids)
+        return
+
+    def test_collection_view_updated(self):
+        # Collection view access is updated when views are saved or removed
+        self.assertEqual(self.testcoll.get_view("view1"), None)
+        view1 = self.create_view_record(self.testcoll, self.view1)
+        self.assertIn("view1", [ e.get_id() for e in self.testcoll.views(altscope=None) ])
+        view1[RDFS.CURIE.label] = "Updated label"
+        view1._save()
+        self.assertEqual(self.testcoll.get_view("view1")[RDFS.CURIE.label], "Updated label")
+        self.testcoll.remove_view("view1")
+        self.assertEqual(self.testcoll.get_view("view1"), None)
+        self.assertNotIn("view1", [ e.get_id() for e in self.testcoll.views(altscope=None) ])
+        return
+
+    def test_collection_view_cached(self):
+        self.create_view_record(self.testcoll, self.view1)
+        self.assertEqual(self.testcoll.get_view("view1")[RDFS.CURIE.label], "RecordView testcoll1/view1")
+        # Cached values are used without reading view data
+        self.write_view_label("view1", "Label not read")
+        self.assertEqual(self.testcoll.get_view("view1")[RDFS.CURIE.label], "RecordView testcoll1/view1")
+        # Recorded configuration update causes view data to be re-read
+        update_coll_generation(self.testcoll, config=True)
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        coll.check_collection_caches()
+        self.assertEqual(coll.get_view("view1")[RDFS.CURIE.label], "Label not read")
+        return
+
+if __name__ == "__main__":
+    unittest.main()
+
+# End.
@@ -0,0 +1,134 @@
+"""
+Tests for compiled field list value maps used to render entity views and lists.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS, ANNAL
+
+from annalist.models.site               import Site
+from annalist.models.collection         import Collection
+from annalist.models.recordfield        import RecordField
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+
+from annalist.views.fieldlistvaluemap   import get_field_list_value_map
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Compiled value map tests
+#
+#   -----------------------------------------------------------------------------
+
+class CompiledValueMapTest(AnnalistTestCase):
+    """
+    Tests re-use of compiled field list value maps
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        for entity_id in ("entity2", "entity3"):
+            EntityData.create(self.testdata, entity_id,
+                { RDFS.CURIE.label: "Entity %s"%(entity_id,) }
+                )
+        RecordField.create(self.testcoll, "Test_enum",
+            { RDFS.CURIE.label:                     "Test enum field"
+            , ANNAL.CURIE.field_render_type:        "_enum_render_type/Enum_choice"
+            , ANNAL.CURIE.field_value_mode:         "_enum_value_mode/Value_direct"
+            , ANNAL.CURIE.property_uri:             "test:enum"
+            , ANNAL.CURIE.field_placement:          "small:0,12"
+            , ANNAL.CURIE.field_ref_type:           "testtype"
+            , ANNAL.CURIE.field_ref_restriction:    "[annal:id] in view[test:ids]"
+            })
+        self.fields = (
+            [ { ANNAL.CURIE.field_id:         layout.FIELD_TYPEID+"/Entity_id"
+              , ANNAL.CURIE.field_placement:  "small:0,12;medium:0,6"
+              }
+            , { ANNAL.CURIE.field_id:         layout.FIELD_TYPEID+"/Test_enum"
+              , ANNAL.CURIE.field_placement:  "small:0,12;medium:6,6"
+              }
+            ])
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(CompiledValueMapTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def write_field_label(self, field_id, label):
+        # Update field description in storage without recording a configuration update
+        field_path = RecordField.path(self.testcoll, field_id)
+        with open(field_path, "r") as field_io:
+            field_data = json.load(field_io)
+        field_data[RDFS.CURIE.label] = label
+        with open(field_path, "w") as field_io:
+            json.dump(field_data, field_io, indent=2)
+        return
+
+    def field_descs(self, view_ids=["entity2"]):
+        # Field descriptions from new collection object, as used for a request
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        fieldlistmap = get_field_list_value_map(
+            "fields", coll, self.fields, {'view': {"test:ids": view_ids}}
+            )
+        return fieldlistmap.get_structure_description()['field_list']
+
+    def test_compiled_map_reused(self):
+        fds = self.field_descs()
+        self.assertEqual([ fd.get_field_id() for fd in fds ], ["Entity_id", "Test_enum"])
+        self.assertEqual(fds[1]['field_label'], "Test enum field")
+        # Compiled value map is used without reading field descriptions
+        self.write_field_label("Test_enum", "Label not read")
+        Collection.flush_all_caches()
+        self.assertEqual(self.field_descs()[1]['field_label'], "Test enum field")
+        # Recorded configuration update causes field descriptions to be re-read
+        self.testcoll.flush_collection_caches()
+        self.assertEqual(self.field_descs()[1]['field_label'], "Label not read")
+        return
+
+    def test_compiled_map_copied(self):
+        fds = self.field_descs()
+        fds[0].set_field_instance_name("updated_name")
+        fds[0]['group_list'] = ["group"]
+        fds = self.field_descs()
+        self.assertEqual(fds[0].get_field_instance_name(), "entity_id")
+        self.assertNotIn('group_list', fds[0])
+        return
+
+    def test_compiled_map_context(self):
+        fds = self.field_descs(["entity2"])
+        self.assertEqual(list(fds[1]['field_choices']), ["testtype/entity2"])
+        fds = self.field_descs(["entity2", "entity3"])
+        self.assertEqual(list(fds[1]['field_choices']), ["testtype/entity2", "testtype/entity3"])
+        self.assertEqual(fds[1]._collection.get_id(), "testcoll")
+        return
+
+# End.
@@ -0,0 +1,246 @@
+"""
+Tests for conditional GET requests (If-None-Match, If-Modified-Since) for
+entity views and entity, collection and site resources.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from django.test.client                 import Client
+from django.urls                        import reverse
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.collectiongeneration   import (
+    get_coll_generation, get_coll_generation_inherited
+    )
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testutils import (
+    create_test_user, collection_resource_url
+    )
+from .entity_testentitydata import (
+    entity_url, entity_resource_url, entitydata_edit_url
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Conditional request tests
+#
+#   -----------------------------------------------------------------------------
+
+class ConditionalRequestTest(AnnalistTestCase):
+    """
+    Tests conditional GET requests
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        self.datafile = os.path.join(
+            self.testdata._entitydir, "entity1", layout.ENTITY_DATA_FILE
+            )
+        create_test_user(self.testcoll, "testuser", "testpassword")
+        self.client = Client(HTTP_HOST=TestHost)
+        loggedin = self.client.login(username="testuser", password="testpassword")
+        self.assertTrue(loggedin)
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ConditionalRequestTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def resource_url(self, resource_ref):
+        return TestHostUri + entity_resource_url(
+            coll_id="testcoll", type_id="testtype", entity_id="entity1",
+            resource_ref=resource_ref
+            )
+
+    def update_entity(self, entity_id, label):
+        e = EntityData.load(self.testdata, entity_id)
+        e[RDFS.CURIE.label] = label
+        e._save()
+        return
+
+    def create_entity(self, entity_id):
+        EntityData.create(self.testdata, entity_id, 
+            { RDFS.CURIE.label: "Entity %s"%(entity_id,) }
+            )
+        return
+
+    def test_coll_generation(self):
+        g1 = get_coll_generation(self.testcoll)
+        self.assertGreaterEqual(get_coll_generation_inherited(self.testcoll), g1)
+        self.update_entity("entity1", "Updated label")
+        g2 = get_coll_generation(self.testcoll)
+        self.assertGreater(g2, g1)
+        # Updating site data collection affects inherited generation
+        sitedata = self.testsite.site_data_collection()
+        sitedata._save()
+        self.assertEqual(get_coll_generation(self.testcoll), g2)
+        self.assertGreater(get_coll_generation_inherited(self.testcoll), g2)
+        return
+
+    def test_entity_data_if_none_match(self):
+        u = self.resource_url(layout.ENTITY_DATA_FILE)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        self.assertFalse(etag.startswith("W/"))
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        self.assertEqual(r['ETag'],       etag)
+        self.assertEqual(r.content,       b"")
+        r = self.client.get(u, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(r.status_code,   200)
+        self.update_entity("entity1", "Updated label")
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   200)
+        self.assertNotEqual(r['ETag'],    etag)
+        return
+
+    def test_entity_data_if_modified_since(self):
+        u = self.resource_url(layout.ENTITY_DATA_FILE)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        last_modified = r['Last-Modified']
+        r = self.client.get(u, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(r.status_code,   304)
+        r = self.client.get(u, HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 1970 00:00:01 GMT")
+        self.assertEqual(r.status_code,   200)
+        return
+
+    def test_entity_data_not_modified_without_loading(self):
+        u = self.resource_url(layout.ENTITY_DATA_FILE)
+        r = self.client.get(u)
+        etag = r['ETag']
+        # Replace entity data with unreadable content, preserving size and modification time
+        st = os.stat(self.datafile)
+        with open(self.datafile, "wb") as f:
+            f.write(b"#"*st.st_size)
+        os.utime(self.datafile, ns=(st.st_atime_ns, st.st_mtime_ns))
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        return
+
+    def test_entity_turtle_if_none_match(self):
+        u = self.resource_url(layout.ENTITY_DATA_TURTLE)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        # Adding another entity to the collection changes generated data validator
+        self.create_entity("entity2")
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   200)
+        self.assertNotEqual(r['ETag'],    etag)
+        return
+
+    def test_missing_entity_resource(self):
+        u = TestHostUri + entity_resource_url(
+            coll_id="testcoll", type_id="testtype", entity_id="no_entity",
+            resource_ref=layout.ENTITY_DATA_FILE
+            )
+        r = self.client.get(u, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(r.status_code,   404)
+        return
+
+    def test_coll_context_if_none_match(self):
+        u = collection_resource_url(coll_id="testcoll", resource_ref=layout.COLL_CONTEXT_FILE)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        # Regenerated context file
+        self.testcoll.generate_coll_jsonld_context()
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   200)
+        return
+
+    def test_site_context_if_none_match(self):
+        u = reverse("AnnalistSiteResourceAccess", kwargs={"resource_ref": layout.SITE_CONTEXT_FILE})
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        return
+
+    def test_entity_view_if_none_match(self):
+        u = entity_url(coll_id="testcoll", type_id="testtype", entity_id="entity1")
+        # Initial request sets CSRF cookie, which distinguishes subsequent responses
+        r = self.client.get(u)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertNotIn("Last-Modified", r)
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        # Different requested content type
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT="application/ld+json")
+        self.assertEqual(r.status_code,   302)
+        # Adding another entity to the collection
+        self.create_entity("entity2")
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        # Different user
+        self.client.logout()
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertNotEqual(r.status_code, 304)
+        return
+
+    def test_entity_edit_if_none_match(self):
+        u = entitydata_edit_url(
+            "edit", "testcoll", "testtype", entity_id="entity1", view_id="Default_view"
+            )
+        r = self.client.get(u)
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        etag = r['ETag']
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   304)
+        self.update_entity("entity1", "Updated label")
+        r = self.client.get(u, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code,   200)
+        return
+
+    def test_entity_new_no_validators(self):
+        u = entitydata_edit_url("new", "testcoll", "testtype", view_id="Default_view")
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        self.assertNotIn("ETag", r)
+        return
+
+# End.
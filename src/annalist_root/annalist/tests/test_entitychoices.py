@@ -0,0 +1,136 @@
+"""
+Tests for cached enumerated value choices used by fields that reference entities.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.collectiongeneration   import update_coll_generation
+
+from annalist.views.fields.field_description    import get_entity_choices
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Entity choices tests
+#
+#   -----------------------------------------------------------------------------
+
+class EntityChoicesTest(AnnalistTestCase):
+    """
+    Tests cached entity choices for enumerated value fields
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        for entity_id in ("entity2", "entity3"):
+            EntityData.create(self.testdata, entity_id,
+                { RDFS.CURIE.label: "Entity %s"%(entity_id,) }
+                )
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(EntityChoicesTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def write_entity_label(self, entity_id, label):
+        # Update entity data in storage without recording a collection update
+        data_path = EntityData.load(self.testdata, entity_id)._exists_path()
+        with open(data_path, "r") as data_io:
+            data = json.load(data_io)
+        data[RDFS.CURIE.label] = label
+        with open(data_path, "w") as data_io:
+            json.dump(data, data_io, indent=2)
+        return
+
+    def choice_labels(self, restriction="ALL", context={}):
+        choices = get_entity_choices(self.testcoll, "testtype", restriction, context)
+        return [ label for (val, label, link) in choices ]
+
+    def test_entity_choices(self):
+        choices = get_entity_choices(self.testcoll, "testtype", "ALL", {})
+        self.assertEqual(choices[0][0], "testtype/entity1")
+        self.assertEqual(choices[1],
+            ( "testtype/entity2", "Entity entity2",
+              "/testsite/c/testcoll/d/testtype/entity2/"
+            ))
+        self.assertEqual(len(choices), 3)
+        return
+
+    def test_cached_choices_reused(self):
+        self.assertIn("Entity entity2", self.choice_labels())
+        self.write_entity_label("entity2", "Label not read")
+        self.assertIn("Entity entity2", self.choice_labels())
+        # Update to entity of referenced type causes choices to be re-read
+        e3 = EntityData.load(self.testdata, "entity3")
+        e3[RDFS.CURIE.label] = "Updated entity3"
+        e3._save()
+        self.assertIn("Label not read", self.choice_labels())
+        self.assertIn("Updated entity3", self.choice_labels())
+        return
+
+    def test_cached_choices_other_updates(self):
+        self.assertIn("Entity entity2", self.choice_labels())
+        self.write_entity_label("entity2", "Label not read")
+        # Updates to entities of other types do not cause choices to be re-read
+        otherdata = RecordTypeData.create(self.testcoll, "othertype", {})
+        EntityData.create(otherdata, "other1", { RDFS.CURIE.label: "Other entity" })
+        update_coll_generation(self.testcoll)
+        self.assertIn("Entity entity2", self.choice_labels())
+        # Configuration update causes choices to be re-read
+        update_coll_generation(self.testcoll, config=True)
+        self.assertIn("Label not read", self.choice_labels())
+        return
+
+    def test_choices_context(self):
+        restriction = "[annal:id] in view[test:ids]"
+        self.assertEqual(
+            self.choice_labels(restriction, {"view": {"test:ids": ["entity2"]}}),
+            ["Entity entity2"]
+            )
+        self.assertEqual(
+            self.choice_labels(restriction, {"view": {"test:ids": ["entity2", "entity3"]}}),
+            ["Entity entity2", "Entity entity3"]
+            )
+        # Context values not referenced by restriction
+        self.assertEqual(
+            self.choice_labels(restriction,
+                {"view": {"test:ids": ["entity2"], "test:other": "other"}}
+                ),
+            ["Entity entity2"]
+            )
+        return
+
+# End.
@@ -0,0 +1,265 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+Tests for entity data value cache.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import io
+import time
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from django.test                        import override_settings
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS, ANNAL
+from annalist.models.site               import Site
+from annalist.models.collection         import Collection
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.recordfield        import RecordField
+from annalist.models.entitytypeinfo     import EntityTypeInfo
+from annalist.models.entityindex        import INDEX_MTIME_RESOLUTION
+from annalist.models.sizedcache         import SizedCache, get_sized_cache
+from annalist.models.entitydatacache    import EntityDataCache, get_entitydata_cache
+
+from .AnnalistTestCase import AnnalistTestCase
+from .entity_testfielddata import recordfield_create_values
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   EntityDataCache tests
+#
+#   -----------------------------------------------------------------------------
+
+class EntityDataCacheTest(AnnalistTestCase):
+    """
+    Tests EntityDataCache class
+    """
+
+    def setUp(self):
+        self.stamp = (time.time_ns() - 2*INDEX_MTIME_RESOLUTION, 100)
+        return
+
+    def tearDown(self):
+        return
+
+    def test_cache_get_set(self):
+        cache = EntityDataCache(10000)
+        self.assertIsNone(cache.get("key1", self.stamp))
+        cache.set("key1", self.stamp, {"a": ["b", "c"]})
+        self.assertEqual(cache.get("key1", self.stamp), {"a": ["b", "c"]})
+        self.assertGreater(cache.size(), 0)
+        return
+
+    def test_cache_returns_copy(self):
+        cache = EntityDataCache(10000)
+        v = {"a": ["b", "c"]}
+        cache.set("key1", self.stamp, v)
+        v["a"].append("d")
+        v1 = cache.get("key1", self.stamp)
+        self.assertEqual(v1, {"a": ["b", "c"]})
+        v1["a"].append("e")
+        self.assertEqual(cache.get("key1", self.stamp), {"a": ["b", "c"]})
+        return
+
+    def test_cache_stamp_mismatch(self):
+        cache = EntityDataCache(10000)
+        cache.set("key1", self.stamp, {"a": "b"})
+        self.assertIsNone(cache.get("key1", (self.stamp[0], 101)))
+        self.assertEqual(cache.size(), 0)
+        self.assertIsNone(cache.get("key1", self.stamp))
+        return
+
+    def test_cache_recent_stamp(self):
+        # Values from recently modified file are not cached
+        cache = EntityDataCache(10000)
+        stamp = (time.time_ns(), 100)
+        cache.set("key1", stamp, {"a": "b"})
+        self.assertIsNone(cache.get("key1", stamp))
+        return
+
+    def test_cache_lru_size(self):
+        v = {"a": "x"*100}
+        cache_size = EntityDataCache(10000)
+        cache_size.set("key", self.stamp, v)
+        entry_size = cache_size.size()
+        cache = EntityDataCache(entry_size*3)
+        cache.set("key1", self.stamp, v)
+        cache.set("key2", self.stamp, v)
+        cache.set("key3", self.stamp, v)
+        self.assertIsNotNone(cache.get("key1", self.stamp))
+        cache.set("key4", self.stamp, v)
+        self.assertIsNotNone(cache.get("key1", self.stamp))
+        self.assertIsNone(cache.get("key2", self.stamp))
+        self.assertIsNotNone(cache.get("key3", self.stamp))
+        self.assertIsNotNone(cache.get("key4", self.stamp))
+        self.assertEqual(cache.size(), entry_size*3)
+        # Value larger than cache is not saved
+        cache.set("key5", self.stamp, {"a": "x"*(entry_size*3)})
+        self.assertIsNone(cache.get("key5", self.stamp))
+        self.assertEqual(cache.size(), entry_size*3)
+        return
+
+    def test_cache_remove_flush(self):
+        cache = EntityDataCache(10000)
+        cache.set("key1", self.stamp, {"a": "b"})
+        cache.set("key2", self.stamp, {"a": "c"})
+        cache.remove("key1")
+        self.assertIsNone(cache.get("key1", self.stamp))
+        self.assertEqual(cache.get("key2", self.stamp), {"a": "c"})
+        cache.flush()
+        self.assertIsNone(cache.get("key2", self.stamp))
+        self.assertEqual(cache.size(), 0)
+        return
+
+    def test_sized_cache(self):
+        cache = SizedCache(10)
+        cache.set("key1", "abcd")
+        cache.set("key2", "efgh")
+        self.assertEqual(cache.get("key1"), "abcd")
+        cache.set("key3", "ijkl")
+        self.assertEqual(cache.get("key1"), "abcd")
+        self.assertIsNone(cache.get("key2"))
+        self.assertEqual(cache.size(), 8)
+        return
+
+    @override_settings(ENTITY_DATA_CACHE_SIZE=10000)
+    def test_get_sized_cache(self):
+        self.assertIsNone(get_sized_cache("NO_SUCH_CACHE_SIZE", SizedCache))
+        cache = get_sized_cache("ENTITY_DATA_CACHE_SIZE", EntityDataCache)
+        self.assertIsInstance(cache, EntityDataCache)
+        self.assertIs(get_entitydata_cache(), cache)
+        with override_settings(ENTITY_DATA_CACHE_SIZE=20000):
+            cache2 = get_entitydata_cache()
+        self.assertIsNot(cache2, cache)
+        self.assertEqual(cache2.max_size(), 20000)
+        return
+
+#   -----------------------------------------------------------------------------
+#
+#   Entity data loading tests
+#
+#   -----------------------------------------------------------------------------
+
+class EntityDataCacheLoadTest(AnnalistTestCase):
+    """
+    Tests loading of entity data values using EntityDataCache
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite  = Site(TestBaseUri, TestBaseDir)
+        self.testcoll  = init_annalist_test_coll()
+        self.testdata  = RecordTypeData.load(self.testcoll, "testtype")
+        self.datafile  = os.path.join(
+            self.testdata._entitydir, "entity1", layout.ENTITY_DATA_FILE
+            )
+        self.age_datafile()
+        return
+
+    def tearDown(self):
+        resetSitedata(scope="collections")
+        return
+
+    def age_datafile(self):
+        t = time.time_ns() - 2*INDEX_MTIME_RESOLUTION
+        os.utime(self.datafile, ns=(t, t))
+        return
+
+    def test_cache_disabled(self):
+        self.assertIsNone(get_entitydata_cache())
+        return
+
+    @override_settings(ENTITY_DATA_CACHE_SIZE=100000)
+    def test_load_cached_values(self):
+        cache = get_entitydata_cache()
+        cache.flush()
+        e1 = EntityData.load(self.testdata, "entity1")
+        self.assertGreater(cache.size(), 0)
+        # Update file without changing modification time or size
+        mtime = os.stat(self.datafile).st_mtime_ns
+        with io.open(self.datafile, "rt", encoding="utf-8") as f:
+            text = f.read()
+        with io.open(self.datafile, "wt", encoding="utf-8") as f:
+            f.write(text.replace("entity1", "entityX"))
+        os.utime(self.datafile, ns=(mtime, mtime))
+        e2 = EntityData.load(self.testdata, "entity1")
+        self.assertEqual(e2[RDFS.CURIE.label], e1[RDFS.CURIE.label])
+        self.assertEqual(e2[ANNAL.CURIE.url], e1[ANNAL.CURIE.url])
+        # Update file changing size
+        with io.open(self.datafile, "wt", encoding="utf-8") as f:
+            f.write(text.replace("entity1", "entity_updated"))
+        self.age_datafile()
+        e3 = EntityData.load(self.testdata, "entity1")
+        self.assertIn("entity_updated", e3[RDFS.CURIE.label])
+        return
+
+    @override_settings(ENTITY_DATA_CACHE_SIZE=100000)
+    def test_save_removes_cached_values(self):
+        cache = get_entitydata_cache()
+        cache.flush()
+        e1 = EntityData.load(self.testdata, "entity1")
+        self.assertGreater(cache.size(), 0)
+        e1[RDFS.CURIE.label] = "Updated label"
+        e1._save()
+        self.assertEqual(cache.size(), 0)
+        self.assertEqual(EntityData.load(self.testdata, "entity1")[RDFS.CURIE.label], "Updated label")
+        EntityData.remove(self.testdata, "entity1")
+        self.assertEqual(cache.size(), 0)
+        self.assertIsNone(EntityData.load(self.testdata, "entity1"))
+        return
+
+    @override_settings(ENTITY_DATA_CACHE_SIZE=100000)
+    def test_save_config_removes_cached_values(self):
+        f = RecordField.create(self.testcoll, "testfield", recordfield_create_values())
+        (field_dir, field_file) = f._dir_path()
+        t = time.time_ns() - 2*INDEX_MTIME_RESOLUTION
+        os.utime(field_file, ns=(t, t))
+        cache = get_entitydata_cache()
+        cache.flush()
+        f = RecordField.load(self.testcoll, "testfield")
+        self.assertIn(field_file, cache._values)
+        f[RDFS.CURIE.label] = "Updated label"
+        f._save()
+        self.assertNotIn(field_file, cache._values)
+        self.assertEqual(RecordField.load(self.testcoll, "testfield")[RDFS.CURIE.label], "Updated label")
+        os.utime(field_file, ns=(t, t))
+        RecordField.load(self.testcoll, "testfield")
+        self.assertIn(field_file, cache._values)
+        RecordField.remove(self.testcoll, "testfield")
+        self.assertNotIn(field_file, cache._values)
+        return
+
+    @override_settings(ENTITY_DATA_CACHE_SIZE=100000)
+    def test_typeinfo_get_entity(self):
+        cache = get_entitydata_cache()
+        cache.flush()
+        typeinfo = EntityTypeInfo(self.testcoll, "testtype")
+        e1 = typeinfo.get_entity("entity1")
+        size = cache.size()
+        self.assertGreater(size, 0)
+        e1[RDFS.CURIE.label] = "Modified in memory"
+        e2 = typeinfo.get_entity("entity1")
+        self.assertNotEqual(e2[RDFS.CURIE.label], "Modified in memory")
+        self.assertEqual(cache.size(), size)
+        self.assertIsNone(typeinfo.get_entity("no_entity"))
+        es = list(typeinfo.enum_entities_with_implied_values())
+        self.assertEqual([ e.get_id() for e in es ], ["entity1"])
+        return
+
+# End.
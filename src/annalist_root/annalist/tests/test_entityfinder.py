@@ -0,0 +1,172 @@
+"""
+Tests for EntityFinder use of selector index plans.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.entitytypeinfo     import EntityTypeInfo
+from annalist.models.entityfinder       import EntityFinder, EntitySelector
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   EntityFinder tests
+#
+#   -----------------------------------------------------------------------------
+
+class EntityFinderTest(AnnalistTestCase):
+    """
+    Tests EntityFinder selection of candidate entities using index plans
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        for entity_id in ("entity2", "entity3"):
+            EntityData.create(self.testdata, entity_id,
+                { RDFS.CURIE.label: "Entity %s"%(entity_id,) }
+                )
+        self.context = {"view": {"test:ids": ["entity1", "entity3"]}}
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(EntityFinderTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def entity_refs(self, selector, type_id=None):
+        finder = EntityFinder(self.testcoll, selector=selector)
+        refs   = finder.get_entity_refs(type_id=type_id, altscope="all", context=self.context)
+        return { (typeinfo.type_id, eid) for (key, typeinfo, eid) in refs }
+
+    def selected_entities(self, selector, type_id=None):
+        finder = EntityFinder(self.testcoll, selector=selector)
+        es     = finder.get_entities(type_id=type_id, altscope="all", context=self.context)
+        return { (e.get_type_id(), e.get_id()) for e in es }
+
+    def filtered_entities(self, selector, type_id=None):
+        # Selection by applying selector to all entities
+        finder = EntityFinder(self.testcoll, selector=selector)
+        es     = finder._selector.filter(
+            finder.get_base_entities(type_id=type_id, altscope="all"), context=self.context
+            )
+        return { (e.get_type_id(), e.get_id()) for e in es }
+
+    def test_type_plan(self):
+        refs = self.entity_refs("'annal:Type' in [@type]")
+        self.assertEqual({ t for (t, e) in refs }, {layout.TYPE_TYPEID})
+        self.assertIn((layout.TYPE_TYPEID, "testtype"), refs)
+        self.assertIn((layout.TYPE_TYPEID, "Default_type"), refs)
+        return
+
+    def test_type_id_plan(self):
+        refs = self.entity_refs("[annal:type_id] == 'testtype'")
+        self.assertEqual(refs,
+            { ("testtype", "entity1"), ("testtype", "entity2"), ("testtype", "entity3") }
+            )
+        return
+
+    def test_entity_id_plan(self):
+        refs = self.entity_refs("'entity2' in [annal:id]", type_id="testtype")
+        self.assertEqual(refs, { ("testtype", "entity2") })
+        refs = self.entity_refs("[annal:id] in view[test:ids]")
+        self.assertEqual(refs, { ("testtype", "entity1"), ("testtype", "entity3") })
+        return
+
+    def test_no_plan(self):
+        refs = self.entity_refs("'Entity entity2' == [rdfs:label]", type_id="testtype")
+        self.assertEqual(refs,
+            { ("testtype", "entity1"), ("testtype", "entity2"), ("testtype", "entity3") }
+            )
+        return
+
+    def test_list_context_value_no_plan(self):
+        # List-valued context value compared with single-valued property, or tested
+        # for membership of a list-valued property, does not give an index plan
+        for selector in ("[annal:id] == view[test:ids]", "view[test:ids] in [@type]"):
+            self.assertEqual(EntitySelector(selector).index_plan(self.context), None)
+            self.assertEqual(self.selected_entities(selector, "testtype"), set())
+            self.assertEqual(
+                self.selected_entities(selector, "testtype"),
+                self.filtered_entities(selector, "testtype")
+                )
+        return
+
+    def test_selected_entities(self):
+        # Entities selected using index plans are the same as those selected by
+        # applying the selector to all entities
+        for selector, type_id in (
+                ("'annal:Type' in [@type]",          None),
+                ("'annal:View' in [@type]",          None),
+                ("'annal:EntityData' in [@type]",    None),
+                ("[annal:type_id] == 'testtype'",    None),
+                ("[annal:type_id] == '_field'",      None),
+                ("'entity2' in [annal:id]",          "testtype"),
+                ("[annal:id] in view[test:ids]",     None),
+                ("[annal:id] == 'Default_type'",     None),
+                ("'Entity entity2' == [rdfs:label]", "testtype"),
+                ):
+            self.assertEqual(
+                self.selected_entities(selector, type_id),
+                self.filtered_entities(selector, type_id)
+                )
+        return
+
+    def test_recorded_type_uris(self):
+        finder   = EntityFinder(self.testcoll)
+        typeinfo = EntityTypeInfo(self.testcoll, "testtype")
+        self.assertNotIn("test:extra", finder.get_recorded_type_uris(typeinfo))
+        # Entity with additional recorded type
+        e = EntityData.load(self.testdata, "entity2")
+        e["@type"] = e["@type"] + ["test:extra"]
+        e._save()
+        self.assertIn("test:extra", finder.get_recorded_type_uris(typeinfo))
+        self.assertEqual(self.selected_entities("'test:extra' in [@type]"), {("testtype", "entity2")})
+        return
+
+    def test_entities_page(self):
+        finder = EntityFinder(self.testcoll, selector="[annal:id] in view[test:ids]")
+        (es, prev_cursor, next_cursor) = finder.get_entities_page(
+            type_id="testtype", altscope="all", context=self.context, page_size=1
+            )
+        self.assertEqual([ e.get_id() for e in es ], ["entity1"])
+        self.assertEqual(next_cursor, "testtype/entity1")
+        (es, prev_cursor, next_cursor) = finder.get_entities_page(
+            type_id="testtype", altscope="all", context=self.context, page_size=1,
+            cursor=next_cursor
+            )
+        self.assertEqual([ e.get_id() for e in es ], ["entity3"])
+        self.assertEqual(next_cursor, None)
+        return
+
+# End.
@@ -20,6 +20,7 @@ import logging
 log = logging.getLogger(__name__)
 
 import os
+import json
 import unittest
 
 from django.conf                    import settings
@@ -28,13 +29,15 @@ from django.http                    import QueryDict
 from django.test                    import TestCase # cf. https://docs.djangoproject.com/en/dev/topics/testing/tools/#assertions
 from django.test.client             import Client
 
+from rdflib                         import Graph, URIRef, Literal
+
 from utils.py3porting               import urlparse, urljoin
 from utils.SuppressLoggingContext   import SuppressLogging
 
 from annalist                       import layout
 from annalist                       import message
 from annalist.identifiers           import RDF, RDFS, ANNAL
-from annalist.util                  import extract_entity_id
+from annalist.util                  import extract_entity_id, make_resource_url
 
 from annalist.models.site           import Site
 from annalist.models.collection     import Collection
@@ -43,6 +46,7 @@ from annalist.models.recordtypedata import RecordTypeData
 from annalist.models.entitydata     import EntityData
 from annalist.models.entityfinder   import EntityFinder
 from annalist.models.entitytypeinfo import EntityTypeInfo
+from annalist.models.entityresourceaccess import json_resource_file, json_resource_stream
 
 from annalist.views.uri_builder     import (
     uri_quote_param,
@@ -50,6 +54,7 @@ from annalist.views.uri_builder     import (
     continuation_params_url
     )
 from annalist.views.entitylist      import EntityGenericListView
+from annalist.views.rendercache     import get_listrow_cache
 from annalist.views.form_utils.fieldchoice  import FieldChoice
 
 from .AnnalistTestCase import AnnalistTestCase
@@ -711,6 +716,204 @@ class EntityGenericListViewTest(AnnalistTestCase):
         self.assertContains(r, msg_text, status_code=200)
         return
 
+    def test_get_entities_page(self):
+        # Test enumeration of entities a page at a time
+        finder = EntityFinder(self.testcoll, selector="ALL")
+        def get_page(type_id, cursor):
+            (entity_list, prev_cursor, next_cursor) = finder.get_entities_page(
+                type_id=type_id, altscope="all", user_permissions=None, 
+                context={}, search="", page_size=2, cursor=cursor
+                )
+            entity_ids = [ "%s/%s"%(e.get_type_id(), e.get_id()) for e in entity_list ]
+            return (entity_ids, prev_cursor, next_cursor)
+        self.assertEqual(
+            get_page("testtype", None), 
+            (["testtype/entity1", "testtype/entity2"], None, "testtype/entity2")
+            )
+        self.assertEqual(
+            get_page("testtype", "testtype/entity2"), 
+            (["testtype/entity3"], "", None)
+            )
+        self.assertEqual(
+            get_page("testtype", "testtype/entity3"), 
+            ([], "testtype/entity1", None)
+            )
+        # Pages of all entities are consistent with sorted list of all entities
+        expect_entity_ids = [ fc.id for fc in get_site_entities_sorted() ]
+        actual_entity_ids = []
+        cursor = None
+        while True:
+            (entity_ids, prev_cursor, next_cursor) = get_page(None, cursor)
+            self.assertEqual(prev_cursor is None, cursor is None)
+            actual_entity_ids.extend(entity_ids)
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+        self.assertEqual(actual_entity_ids, expect_entity_ids)
+        return
+
+    def test_get_list_page(self):
+        u = entitydata_list_type_url(
+            "testcoll", "testtype", list_id="Default_list", 
+            query_params={"page_size": "2"}
+            )
+        r = self.client.get(u)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(r.reason_phrase, "OK")
+        entities = context_list_entities(r.context)
+        self.assertEqual([ e['entity_id'] for e in entities ], ["entity1", "entity2"])
+        self.assertEqual(r.context['page_size'],        "2")
+        self.assertEqual(r.context['page_prev_url'],    None)
+        next_url = r.context['page_next_url']
+        self.assertIn("page_size=2", next_url)
+        self.assertIn("cursor=testtype/entity2", next_url)
+        self.assertContains(r, 
+            '<a href="%s" title="Display next page of list">Next page</a>'%(next_url,), 
+            html=True
+            )
+        r = self.client.get(next_url)
+        self.assertEqual(r.status_code,   200)
+        entities = context_list_entities(r.context)
+        self.assertEqual([ e['entity_id'] for e in entities ], ["entity3"])
+        self.assertEqual(r.context['page_next_url'],    None)
+        prev_url = r.context['page_prev_url']
+        self.assertIn("page_size=2", prev_url)
+        self.assertNotIn("cursor=", prev_url)
+        return
+
+    def test_list_json_stream(self):
+        # Streamed JSON list data is the same as JSON list data from file
+        list_data = (
+            { '@id':        "/testsite/c/testcoll/d/testtype/"
+            , '@context':   [ {"@base": "../../"}, "../../coll_context.jsonld" ]
+            , ANNAL.CURIE.entity_list:  
+                [ { ANNAL.CURIE.id: "entity1", "rdfs:label": "Entity \u00e9 1", "p:list": [1, {}] }
+                , { ANNAL.CURIE.id: "entity2", "p:dict": { "p:a": [], "p:b": "b" } }
+                ]
+            })
+        def stream_data(jsondata):
+            return "".join(json_resource_stream("http://example.org/", jsondata, {}))
+        def file_data(jsondata):
+            return json_resource_file("http://example.org/", jsondata, {}).read()
+        self.assertEqual(stream_data(list_data), file_data(list_data))
+        list_iter_data = dict(list_data)
+        list_iter_data[ANNAL.CURIE.entity_list] = iter(list_data[ANNAL.CURIE.entity_list])
+        self.assertEqual(stream_data(list_iter_data), file_data(list_data))
+        list_data[ANNAL.CURIE.entity_list] = []
+        self.assertEqual(stream_data(list_data), file_data(list_data))
+        self.assertEqual(stream_data({}), file_data({}))
+        return
+
+    def test_get_list_json_stream(self):
+        list_url = entitydata_list_type_url("testcoll", "testtype", list_id="Default_list")
+        json_url = make_resource_url(TestHostUri, list_url, layout.ENTITY_LIST_FILE)
+        r = self.client.get(json_url)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(r.reason_phrase, "OK")
+        self.assertTrue(r.streaming)
+        self.assertEqual(r['Content-Type'], "application/ld+json")
+        list_data = json.loads(b"".join(r.streaming_content).decode("utf-8"))
+        self.assertEqual(
+            [ e[ANNAL.CURIE.id] for e in list_data[ANNAL.CURIE.entity_list] ], 
+            ["entity1", "entity2", "entity3"]
+            )
+        return
+
+    def get_list_all_stream(self, list_ref):
+        list_url = entitydata_list_all_url("testcoll")
+        data_url = make_resource_url(TestHostUri, list_url, list_ref)
+        r = self.client.get(data_url)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(r.reason_phrase, "OK")
+        self.assertTrue(r.streaming)
+        return (data_url, r['Content-Type'], b"".join(r.streaming_content).decode("utf-8"))
+
+    def test_get_list_ntriples_stream(self):
+        self.testcoll.generate_coll_jsonld_context()
+        data_url, content_type, data = self.get_list_all_stream(layout.ENTITY_LIST_NTRIPLES)
+        self.assertEqual(content_type, "application/n-triples")
+        g = Graph()
+        g.parse(data=data, format="nt")
+        for type_id, entity_id in (
+                ("testtype", "entity1"), ("testtype", "entity3"), ("testtype2", "entity4")
+                ):
+            entity_uri = URIRef(urljoin(data_url, type_id+"/"+entity_id))
+            self.assertIn((entity_uri, URIRef(ANNAL.URI.id), Literal(entity_id)), g)
+            self.assertIn((entity_uri, URIRef(ANNAL.URI.type_id), Literal(type_id)), g)
+        _, _, jsonld = self.get_list_all_stream(layout.ENTITY_LIST_FILE)
+        self.assertEqual(
+            len(set(g.subjects(URIRef(ANNAL.URI.id), None))), 
+            len(json.loads(jsonld)[ANNAL.CURIE.entity_list])
+            )
+        return
+
+    def test_get_list_ndjson_stream(self):
+        data_url, content_type, data = self.get_list_all_stream(layout.ENTITY_LIST_NDJSON)
+        self.assertEqual(content_type, "application/x-ndjson")
+        entities = [ json.loads(line) for line in data.splitlines() ]
+        _, _, jsonld = self.get_list_all_stream(layout.ENTITY_LIST_FILE)
+        self.assertEqual(
+            [ e["@id"] for e in entities ], 
+            [ e["@id"] for e in json.loads(jsonld)[ANNAL.CURIE.entity_list] ]
+            )
+        coll_url = urljoin(data_url, "./")
+        for e in entities:
+            self.assertEqual(
+                e["@context"], 
+                [ { "@base": coll_url }, coll_url+layout.COLL_CONTEXT_FILE ]
+                )
+        return
+
+    def test_get_list_row_cache(self):
+        cache = get_listrow_cache()
+        cache.flush()
+        u = entitydata_list_type_url("testcoll", "testtype", list_id="Default_list")
+        r = self.client.get(u)
+        self.assertEqual(r.status_code, 200)
+        self.assertContains(r, "Entity testcoll/testtype/entity1")
+        size1 = cache.size()
+        self.assertGreater(size1, 0)
+        # Rows are re-used when the list is displayed again
+        r = self.client.get(u)
+        self.assertEqual(r.status_code, 200)
+        self.assertContains(r, "Entity testcoll/testtype/entity1")
+        self.assertEqual(cache.size(), size1)
+        # Rows are rendered again for a different request URI (continuation links)
+        r = self.client.get(u+"?search=entity")
+        self.assertEqual(r.status_code, 200)
+        self.assertGreater(cache.size(), size1)
+        # Rows are rendered again when collection data is updated
+        cache.flush()
+        self.client.get(u)
+        size1 = cache.size()
+        EntityData.create(self.testdata, "entity1",
+            entitydata_create_values("entity1", update="Updated entity")
+            )
+        r = self.client.get(u)
+        self.assertEqual(r.status_code, 200)
+        self.assertContains(r, "Updated entity testcoll/testtype/entity1")
+        self.assertGreater(cache.size(), size1)
+        return
+
+    def test_get_list_page_json(self):
+        list_url = entitydata_list_type_url(
+            "testcoll", "testtype", list_id="Default_list", 
+            query_params={"page_size": "2"}
+            )
+        json_url = make_resource_url(TestHostUri, list_url, layout.ENTITY_LIST_FILE)
+        r = self.client.get(json_url)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(r.reason_phrase, "OK")
+        list_data = json.loads(b"".join(r.streaming_content).decode("utf-8"))
+        self.assertEqual(
+            [ e[ANNAL.CURIE.id] for e in list_data[ANNAL.CURIE.entity_list] ], 
+            ["entity1", "entity2"]
+            )
+        self.assertIn('rel="next"',               r['Link'])
+        self.assertIn('cursor=testtype/entity2',  r['Link'])
+        self.assertNotIn('rel="prev"',            r['Link'])
+        return
+
     #   -----------------------------------------------------------------------------
     #   Form response tests
     #   -----------------------------------------------------------------------------
@@ -0,0 +1,273 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+Tests for persistent entity index used to enumerate child entities.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import io
+import time
+import shutil
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from annalist                       import layout
+from annalist.models.site           import Site
+from annalist.models.collection     import Collection
+from annalist.models.recordtypedata import RecordTypeData
+from annalist.models.entitydata     import EntityData
+from annalist.models.entitytypeinfo import EntityTypeInfo
+from annalist.models.entityfinder   import EntityFinder
+from annalist.models.entityindex    import get_entity_index, INDEX_MTIME_RESOLUTION
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testentitydata import (
+    entitydata_create_values
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   EntityIndex tests
+#
+#   -----------------------------------------------------------------------------
+
+class EntityIndexTest(AnnalistTestCase):
+    """
+    Tests EntityIndex class, and its use to enumerate child entities.
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite  = Site(TestBaseUri, TestBaseDir)
+        self.testcoll  = init_annalist_test_coll()
+        self.testdata  = RecordTypeData.load(self.testcoll, "testtype")
+        self.typedir   = os.path.normpath(self.testdata._entitydir)
+        self.indexfile = os.path.join(
+            self.typedir,
+            layout.ENTITY_INDEX_FILE%{'entityfile': layout.ENTITY_DATA_FILE}
+            )
+        return
+
+    def tearDown(self):
+        resetSitedata(scope="collections")
+        return
+
+    def age_typedir(self):
+        # Set type data directory modification time so that it is not too
+        # recent for the index to be relied upon.
+        t = time.time_ns() - 2*INDEX_MTIME_RESOLUTION
+        os.utime(self.typedir, ns=(t, t))
+        return
+
+    def init_index(self):
+        # Scan type data directory, creating an index file, then make the
+        # index reliable.  (Creating the index file modifies the directory.)
+        self.assertEqual(self.child_ids(), ["entity1"])
+        self.age_typedir()
+        self.assertEqual(self.child_ids(), ["entity1"])
+        return
+
+    def create_entity(self, entity_id):
+        return EntityData.create(self.testdata, entity_id,
+            entitydata_create_values(entity_id, type_id="testtype")
+            )
+
+    def child_ids(self):
+        return list(self.testdata.child_entity_ids(EntityData))
+
+    def read_index_lines(self):
+        with io.open(self.indexfile, "rt", encoding="utf-8") as f:
+            return [ l.rstrip("\n") for l in f ]
+
+    def test_entity_index_scan(self):
+        self.assertEqual(self.child_ids(), ["entity1"])
+        self.assertTrue(os.path.isfile(self.indexfile))
+        self.assertEqual(self.read_index_lines(), [])
+        self.age_typedir()
+        self.assertEqual(self.child_ids(), ["entity1"])
+        lines = self.read_index_lines()
+        self.assertEqual(lines[0], "+entity1")
+        self.assertTrue(lines[1].startswith("@"))
+        self.assertEqual(len(lines), 2)
+        return
+
+    def test_entity_index_not_a_child(self):
+        # Index file name is not a valid entity id
+        self.init_index()
+        self.assertTrue(os.path.isfile(self.indexfile))
+        self.assertNotIn(os.path.basename(self.indexfile), self.child_ids())
+        return
+
+    def test_entity_index_scan_files(self):
+        # Files in the scanned directory are not checked as possible entities
+        with io.open(os.path.join(self.typedir, "notentity"), "wt", encoding="utf-8") as f:
+            f.write("not an entity\n")
+        checked = []
+        def check_entity(entity_id):
+            checked.append(entity_id)
+            return True
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        self.assertEqual(index.entity_ids(check_entity=check_entity), ["entity1"])
+        self.assertEqual(checked, [])
+        return
+
+    def test_entity_index_save_remove(self):
+        self.init_index()
+        self.create_entity("entity2")
+        self.create_entity("entity3")
+        self.assertEqual(sorted(self.child_ids()), ["entity1", "entity2", "entity3"])
+        EntityData.remove(self.testdata, "entity2")
+        self.assertEqual(sorted(self.child_ids()), ["entity1", "entity3"])
+        lines = self.read_index_lines()
+        self.assertEqual(
+            [ l for l in lines if not l.startswith("@") ],
+            ["+entity1", "+entity2", "+entity3", "-entity2"]
+            )
+        self.assertTrue(lines[-1].startswith("@"))
+        return
+
+    def test_entity_index_update_unchanged(self):
+        # Updating an existing entity records just a new marker
+        self.init_index()
+        lines = self.read_index_lines()
+        self.create_entity("entity1")
+        lines_2 = self.read_index_lines()
+        self.assertEqual(lines_2[:-1], lines)
+        self.assertTrue(lines_2[-1].startswith("@"))
+        self.assertEqual(self.child_ids(), ["entity1"])
+        return
+
+    def test_entity_index_not_locked_during_update(self):
+        # Index can be used while an entity data update is in progress
+        self.init_index()
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        with index.updating("entity2", True):
+            self.assertEqual(index.entity_ids(), ["entity1"])
+            self.assertIsNotNone(index.stamp())
+        return
+
+    def test_entity_index_concurrent_updates(self):
+        # Marker is recorded when the last of overlapping updates completes
+        self.init_index()
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        lines = self.read_index_lines()
+        with index.updating("entity2", True):
+            self.create_entity("entity3")
+            self.assertEqual(self.read_index_lines(), lines + ["+entity3"])
+            shutil.copytree(
+                os.path.join(self.typedir, "entity1"),
+                os.path.join(self.typedir, "entity2")
+                )
+        lines = self.read_index_lines()
+        self.assertEqual(lines[-2], "+entity2")
+        self.assertTrue(lines[-1].startswith("@"))
+        self.assertEqual(sorted(self.child_ids()), ["entity1", "entity2", "entity3"])
+        return
+
+    def test_entity_index_stamp(self):
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        # Index file is created if not present
+        if os.path.exists(self.indexfile):
+            os.remove(self.indexfile)
+        s1 = index.stamp()
+        self.assertIsNotNone(s1)
+        self.assertTrue(os.path.isfile(self.indexfile))
+        self.assertEqual(index.stamp(), s1)
+        # Stamp changes when entity is updated, whether or not the index is up to date
+        self.create_entity("entity1")
+        s2 = index.stamp()
+        self.assertNotEqual(s2, s1)
+        self.init_index()
+        s3 = index.stamp()
+        self.create_entity("entity1")
+        self.assertNotEqual(index.stamp(), s3)
+        # Missing directory
+        index = get_entity_index(os.path.join(self.typedir, "nodir"), layout.ENTITY_DATA_FILE)
+        self.assertEqual(index.stamp(), (None, None, None))
+        return
+
+    def test_entity_index_external_change(self):
+        # Entity data copied into place is found
+        self.init_index()
+        shutil.copytree(
+            os.path.join(self.typedir, "entity1"),
+            os.path.join(self.typedir, "entity9")
+            )
+        self.assertEqual(sorted(self.child_ids()), ["entity1", "entity9"])
+        # Entity data removed is not found
+        shutil.rmtree(os.path.join(self.typedir, "entity1"))
+        self.assertEqual(self.child_ids(), ["entity9"])
+        return
+
+    def test_entity_index_removed_data_file(self):
+        # Entity whose data file is removed, leaving its directory, may still be
+        # indexed, but is skipped when entities are enumerated
+        self.init_index()
+        os.remove(os.path.join(self.typedir, "entity1", layout.ENTITY_DATA_FILE))
+        typeinfo = EntityTypeInfo(self.testcoll, "testtype")
+        self.assertEqual(list(typeinfo.enum_entities()), [])
+        self.assertEqual(list(typeinfo.enum_entities_with_implied_values()), [])
+        finder = EntityFinder(self.testcoll)
+        self.assertEqual(list(finder.get_type_entities("testtype", None, None)), [])
+        return
+
+    def test_entity_index_recent_marker(self):
+        # Index marker recorded immediately after a directory change is not relied on
+        self.init_index()
+        os.mkdir(os.path.join(self.typedir, "entity9"))
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        self.assertEqual(index.entity_ids(), ["entity1"])
+        # Add entity data without changing directory mtime: detected by rescan
+        shutil.copy(
+            os.path.join(self.typedir, "entity1", layout.ENTITY_DATA_FILE),
+            os.path.join(self.typedir, "entity9", layout.ENTITY_DATA_FILE)
+            )
+        self.assertEqual(sorted(index.entity_ids()), ["entity1", "entity9"])
+        return
+
+    def test_entity_index_incomplete(self):
+        # Incomplete index file is ignored, and re-written
+        self.init_index()
+        with io.open(self.indexfile, "at", encoding="utf-8") as f:
+            f.write("+entity8\n+entity9")
+        index = get_entity_index(self.typedir, layout.ENTITY_DATA_FILE)
+        index._ids = None   # Force re-read
+        self.assertEqual(self.child_ids(), ["entity1"])
+        lines = self.read_index_lines()
+        self.assertEqual(lines[0], "+entity1")
+        self.assertEqual(len(lines), 2)
+        return
+
+    def test_entity_index_migrated_filename(self):
+        # Entity with data filename used by older software is found by scan
+        os.rename(
+            os.path.join(self.typedir, "entity1", layout.ENTITY_DATA_FILE),
+            os.path.join(self.typedir, "entity1", layout.ENTITY_OLD_DATA_FILE)
+            )
+        self.init_index()
+        self.assertTrue(os.path.isfile(os.path.join(self.typedir, "entity1", layout.ENTITY_DATA_FILE)))
+        return
+
+    def test_collection_index(self):
+        # Collections are enumerated using index
+        coll_ids = sorted(c.get_id() for c in self.testsite.collections())
+        self.assertIn("testcoll", coll_ids)
+        self.testsite.remove_collection("testcoll")
+        coll_ids_2 = sorted(c.get_id() for c in self.testsite.collections())
+        self.assertEqual(coll_ids_2, [ c for c in coll_ids if c != "testcoll" ])
+        return
+
+# End.
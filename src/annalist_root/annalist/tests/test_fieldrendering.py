@@ -31,6 +31,11 @@ from annalist.views.fields.render_placement     import get_placement_classes
 from annalist.views.fields                      import render_repeatgroup
 from annalist.views.fields.render_repeatgroup   import RenderRepeatGroup
 from annalist.views.fields.render_fieldvalue    import RenderFieldValue, get_field_template
+from annalist.views.fields.field_renderer       import get_field_renderer
+from annalist.views.fields.find_renderers       import (
+    init_field_renderers, get_field_base_renderer, get_field_mode_renderers,
+    _field_view_files, _field_edit_files, _field_get_renderer_functions
+    )
 from annalist.views.form_utils.fieldchoice      import FieldChoice
 
 # from .AnnalistTestCase import AnnalistTestCase
@@ -299,6 +304,29 @@ class FieldRenderingTest(FieldRendererTestSupport):
             )
         return
 
+    # Renderers shared between fields
+    def test_shared_field_renderers(self):
+        renderers = init_field_renderers()
+        self.assertEqual(
+            set(renderers),
+            set(_field_view_files) | set(_field_edit_files) | set(_field_get_renderer_functions)
+            )
+        self.assertIs(init_field_renderers(), renderers)
+        self.assertIs(get_field_base_renderer("Text"), renderers["Text"])
+        self.assertIs(get_field_base_renderer("Group_Seq_Row"), get_field_base_renderer("RepeatGroupRow"))
+        self.assertIsNone(get_field_base_renderer("Unknown_render_type"))
+        self.assertIs(
+            get_field_mode_renderers("Text", "Value_direct"),
+            get_field_mode_renderers("Text", "Value_direct")
+            )
+        fr1 = get_field_renderer("Text", "Value_direct")
+        fr2 = get_field_renderer("Text", "Value_direct")
+        self.assertIs(fr1, fr2)
+        self.assertIs(fr1.mode(), fr2.mode())
+        self.assertIsNot(fr1, get_field_renderer("Text", "Value_entity"))
+        self.assertIsNot(fr1, get_field_renderer("Textarea", "Value_direct"))
+        return
+
 
 # End.
 
@@ -0,0 +1,164 @@
+"""
+Tests for bulk import of entity data into a collection.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import io
+import json
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from utils.SuppressLoggingContext       import SuppressLogging
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS, ANNAL
+
+from annalist.models.site               import Site
+from annalist.models.collection         import Collection
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.searchindex        import get_search_index
+from annalist.models.collectiondata     import read_entity_values, import_coll_entities
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Entity import tests
+#
+#   -----------------------------------------------------------------------------
+
+class ImportEntitiesTest(AnnalistTestCase):
+    """
+    Tests bulk import of entity data
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.entities = (
+            [ { ANNAL.CURIE.type_id:    layout.TYPE_TYPEID
+              , ANNAL.CURIE.id:         "imptype"
+              , RDFS.CURIE.label:       "Imported type"
+              , ANNAL.CURIE.uri:        "imp:imptype"
+              , ANNAL.CURIE.ns_prefix:  "imp"
+              }
+            , { ANNAL.CURIE.type_id:    "imptype"
+              , ANNAL.CURIE.id:         "imp1"
+              , RDFS.CURIE.label:       "Imported entity imp1"
+              }
+            , { ANNAL.CURIE.type_id:    "testtype"
+              , ANNAL.CURIE.id:         "entity2"
+              , RDFS.CURIE.label:       "Imported entity entity2"
+              }
+            , { ANNAL.CURIE.type_id:    layout.VOCAB_TYPEID
+              , ANNAL.CURIE.id:         "impvocab"
+              , RDFS.CURIE.label:       "Imported vocabulary"
+              , ANNAL.CURIE.uri:        "http://example.org/impvocab/"
+              }
+            ])
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ImportEntitiesTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def read_context(self):
+        with self.testcoll._metaobj(
+                layout.META_COLL_BASE_REF, layout.COLL_CONTEXT_FILE, "rt"
+                ) as context_io:
+            return json.load(context_io)["@context"]
+
+    def test_read_entity_values_array(self):
+        data_io = io.StringIO(json.dumps(self.entities, indent=2))
+        self.assertEqual(list(read_entity_values(data_io)), self.entities)
+        data_io = io.StringIO(json.dumps({ "@graph": self.entities }))
+        self.assertEqual(list(read_entity_values(data_io)), self.entities)
+        data_io = io.StringIO(json.dumps(self.entities[0], indent=2))
+        self.assertEqual(list(read_entity_values(data_io)), self.entities[:1])
+        return
+
+    def test_read_entity_values_ndjson(self):
+        data_io = io.StringIO(
+            "\n".join([ json.dumps(e) for e in self.entities ]) + "\n\n"
+            )
+        self.assertEqual(list(read_entity_values(data_io)), self.entities)
+        self.assertEqual(list(read_entity_values(io.StringIO(""))), [])
+        with self.assertRaises(ValueError):
+            list(read_entity_values(io.StringIO('{"a": 1}\n{"b": \n')))
+        return
+
+    def test_import_entities(self):
+        self.assertNotIn("impvocab", self.read_context())
+        count, errs = import_coll_entities(self.testcoll, iter(self.entities))
+        self.assertEqual(errs, [])
+        self.assertEqual(count, 4)
+        e = EntityData.load(RecordTypeData.load(self.testcoll, "imptype"), "imp1")
+        self.assertEqual(e[RDFS.CURIE.label], "Imported entity imp1")
+        self.assertEqual(e[ANNAL.CURIE.uri], "imp:imp1")
+        self.assertIn("imp:imptype", e["@type"])
+        e = EntityData.load(RecordTypeData.load(self.testcoll, "testtype"), "entity2")
+        self.assertEqual(e[RDFS.CURIE.label], "Imported entity entity2")
+        # Collection caches and context are updated
+        vocab   = self.testcoll.cache_get_vocab("impvocab")
+        self.assertEqual(vocab[ANNAL.CURIE.uri], "http://example.org/impvocab/")
+        context = self.read_context()
+        self.assertEqual(context["impvocab"], "http://example.org/impvocab/")
+        self.assertIn("imp", context)
+        return
+
+    def test_import_entities_search_index(self):
+        index = get_search_index(self.testcoll)
+        index.rebuild([])
+        self.assertEqual(index.find("Imported entity"), set())
+        count, errs = import_coll_entities(self.testcoll, iter(self.entities))
+        self.assertEqual(count, 4)
+        self.assertEqual(
+            index.find("Imported entity"),
+            {("imptype", "imp1"), ("testtype", "entity2")}
+            )
+        return
+
+    def test_import_entities_errors(self):
+        entities = (
+            [ ["not", "an", "entity"]
+            , { ANNAL.CURIE.type_id: "testtype", RDFS.CURIE.label: "No id" }
+            , { ANNAL.CURIE.type_id: "notype",   ANNAL.CURIE.id: "entity3" }
+            , { ANNAL.CURIE.type_id: layout.COLL_TYPEID, ANNAL.CURIE.id: "newcoll" }
+            , { ANNAL.CURIE.type_id: "testtype", ANNAL.CURIE.id: "entity3" }
+            ])
+        with SuppressLogging(logging.WARNING):
+            count, errs = import_coll_entities(self.testcoll, iter(entities))
+        self.assertEqual(count, 1)
+        self.assertEqual(len(errs), 4)
+        self.assertIn("import item 1 ", errs[0])
+        self.assertIn("import item 2 ", errs[1])
+        self.assertIn("type notype ", errs[2])
+        self.assertIn("type _coll ", errs[3])
+        self.assertTrue(EntityData.exists(RecordTypeData.load(self.testcoll, "testtype"), "entity3"))
+        self.assertFalse(RecordTypeData.exists(self.testcoll, "notype"))
+        self.assertFalse(Collection.exists(self.testsite, "newcoll"))
+        return
+
+# End.
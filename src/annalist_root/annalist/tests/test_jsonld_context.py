@@ -1045,12 +1045,14 @@ class JsonldContextTest(AnnalistTestCase):
         r = self.client.get(json_url)
         self.assertEqual(r.status_code,   200)
         self.assertEqual(r.reason_phrase, "OK")
+        self.assertTrue(r.streaming)
+        list_content = b"".join(r.streaming_content)
         # print("***** json_url: "+json_url)
         # print("***** c: (testcoll/_type list)")
-        # print r.content
+        # print list_content
         g = Graph()
         with MockHttpDictResources(json_url, self.get_context_mock_dict(json_url, context_path=context_path)):
-            result = g.parse(data=r.content, publicID=json_url, base=json_url, format="json-ld")
+            result = g.parse(data=list_content, publicID=json_url, base=json_url, format="json-ld")
         # print("***** g: (testcoll/_type list)")
         # print(g.serialize(format='turtle', indent=4))
         # print("*****")
@@ -0,0 +1,295 @@
+"""
+Tests for object cache implementations.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from django.test                        import override_settings
+
+from utils.SuppressLoggingContext       import SuppressLogging
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.collection         import Collection
+from annalist.models.recordtype         import RecordType
+from annalist.models.objectcache        import (
+    ObjectCache, Cache_Error, get_cache, get_cache_class, remove_cache
+    )
+from annalist.models.sqliteobjectcache  import SqliteObjectCache
+from annalist.models.collectiongeneration   import update_coll_generation
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testtypedata import (
+    recordtype_create_values
+    )
+
+SQLITE_BACKEND = "annalist.models.sqliteobjectcache.SqliteObjectCache"
+
+#   -----------------------------------------------------------------------------
+#
+#   Object cache tests (common to all implementations)
+#
+#   -----------------------------------------------------------------------------
+
+class ObjectCacheTest(AnnalistTestCase):
+    """
+    Tests for in-memory object cache implementation
+    """
+
+    def setUp(self):
+        self.cache = self.new_cache("test_cache")
+        return
+
+    def tearDown(self):
+        self.cache.flush()
+        self.cache.close()
+        return
+
+    def new_cache(self, cachekey):
+        return ObjectCache(cachekey)
+
+    def test_set_get(self):
+        self.assertEqual(self.cache.cache_key(), "test_cache")
+        self.assertEqual(self.cache.get("key1"), None)
+        self.assertEqual(self.cache.get("key1", "default"), "default")
+        self.cache.set("key1", {"a": [1, 2]})
+        self.assertEqual(self.cache.get("key1"), {"a": [1, 2]})
+        self.cache.set("key1", "value1")
+        self.assertEqual(self.cache.get("key1"), "value1")
+        return
+
+    def test_pop(self):
+        self.cache.set("key1", "value1")
+        self.assertEqual(self.cache.pop("key1"), "value1")
+        self.assertEqual(self.cache.pop("key1", "default"), "default")
+        self.assertEqual(self.cache.get("key1"), None)
+        return
+
+    def test_flush(self):
+        self.cache.set("key1", "value1")
+        self.cache.set("key2", "value2")
+        self.cache.flush()
+        self.assertEqual(self.cache.get("key1"), None)
+        self.assertEqual(self.cache.get("key2"), None)
+        return
+
+    def test_access(self):
+        self.cache.set("key1", {"a": 1})
+        with self.cache.access("key1", "key2") as vals:
+            self.assertEqual(vals, {"key1": {"a": 1}})
+            vals["key1"]["b"] = 2
+            vals["key2"] = "value2"
+        self.assertEqual(self.cache.get("key1"), {"a": 1, "b": 2})
+        self.assertEqual(self.cache.get("key2"), "value2")
+        return
+
+    def test_access_exception(self):
+        self.cache.set("key1", "value1")
+        with self.assertRaises(ValueError):
+            with self.cache.access("key1") as vals:
+                vals["key1"] = "updated"
+                raise ValueError("test")
+        # Subsequent access is not locked out
+        with self.cache.access("key1") as vals:
+            self.assertIn("key1", vals)
+        return
+
+    def test_closed(self):
+        c = self.new_cache("closed_cache")
+        c.set("key1", "value1")
+        c.close()
+        with SuppressLogging(logging.ERROR):
+            with self.assertRaises(Exception):
+                c.get("key1")
+        return
+
+class SqliteObjectCacheTest(ObjectCacheTest):
+    """
+    Tests for SQLite-based object cache implementation
+    """
+
+    def setUp(self):
+        self.tempdir  = tempfile.mkdtemp()
+        self.settings = override_settings(
+            OBJECT_CACHE_PATH=os.path.join(self.tempdir, "cache.sqlite3")
+            )
+        self.settings.enable()
+        super(SqliteObjectCacheTest, self).setUp()
+        return
+
+    def tearDown(self):
+        super(SqliteObjectCacheTest, self).tearDown()
+        self.settings.disable()
+        shutil.rmtree(self.tempdir)
+        return
+
+    def new_cache(self, cachekey):
+        return SqliteObjectCache(cachekey)
+
+    def test_values_shared(self):
+        # Values are shared by cache objects with the same key (e.g. in other processes),
+        # and are retained when a cache object is closed.
+        other = self.new_cache("test_cache")
+        self.cache.set("key1", "value1")
+        self.assertEqual(other.get("key1"), "value1")
+        other.close()
+        other = self.new_cache("test_cache")
+        self.assertEqual(other.get("key1"), "value1")
+        self.assertEqual(self.new_cache("other_cache").get("key1"), None)
+        other.flush()
+        self.assertEqual(self.cache.get("key1"), None)
+        return
+
+    def test_values_copied(self):
+        v = {"a": 1}
+        self.cache.set("key1", v)
+        v["a"] = 2
+        self.assertEqual(self.cache.get("key1"), {"a": 1})
+        return
+
+    def test_access_exception_discards_updates(self):
+        self.cache.set("key1", "value1")
+        with self.assertRaises(ValueError):
+            with self.cache.access("key1") as vals:
+                vals["key1"] = "updated"
+                self.cache.set("key2", "value2")
+                raise ValueError("test")
+        self.assertEqual(self.cache.get("key1"), "value1")
+        self.assertEqual(self.cache.get("key2"), None)
+        return
+
+    def test_nested_access(self):
+        with self.cache.access("key1") as vals1:
+            vals1["key1"] = "value1"
+            with self.cache.access("key2") as vals2:
+                vals2["key2"] = "value2"
+        self.assertEqual(self.cache.get("key1"), "value1")
+        self.assertEqual(self.cache.get("key2"), "value2")
+        return
+
+    def test_get_cache_class(self):
+        self.assertIs(get_cache_class(), ObjectCache)
+        with override_settings(OBJECT_CACHE_BACKEND=SQLITE_BACKEND):
+            self.assertIs(get_cache_class(), SqliteObjectCache)
+            c = get_cache("test_get_cache_class")
+            self.assertIsInstance(c, SqliteObjectCache)
+            remove_cache("test_get_cache_class")
+        with override_settings(OBJECT_CACHE_BACKEND="annalist.models.no_module.NoClass"):
+            with self.assertRaises(Cache_Error):
+                get_cache_class()
+        return
+
+#   -----------------------------------------------------------------------------
+#
+#   Collection cache using shared object cache
+#
+#   -----------------------------------------------------------------------------
+
+class SharedCollectionCacheTest(AnnalistTestCase):
+    """
+    Tests collection caches using an object cache shared between processes
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.tempdir  = tempfile.mkdtemp()
+        self.settings = override_settings(
+            OBJECT_CACHE_BACKEND=SQLITE_BACKEND,
+            OBJECT_CACHE_PATH=os.path.join(self.tempdir, "cache.sqlite3")
+            )
+        self.settings.enable()
+        Collection.flush_all_caches()
+        update_coll_generation(self.testsite.site_data_collection(), config=True)
+        return
+
+    def tearDown(self):
+        Collection.flush_all_caches()
+        self.settings.disable()
+        shutil.rmtree(self.tempdir)
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(SharedCollectionCacheTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def write_type_label(self, type_id, label):
+        # Update type description in storage without updating caches
+        type_path = RecordType.path(self.testcoll, type_id)
+        with open(type_path, "r") as type_io:
+            type_data = json.load(type_io)
+        type_data[RDFS.CURIE.label] = label
+        with open(type_path, "w") as type_io:
+            json.dump(type_data, type_io, indent=2)
+        return
+
+    def get_type_label(self, type_id):
+        # Type label from new collection object, as used for a request in a new process
+        Collection.flush_all_caches()
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        return coll.cache_get_type(type_id)[RDFS.CURIE.label]
+
+    def test_cached_values_reused(self):
+        update_coll_generation(self.testcoll, config=True)
+        self.assertEqual(self.get_type_label("testtype"), "RecordType testcoll/_type/testtype")
+        # Cached values are used without reading type data
+        self.write_type_label("testtype", "Label not read")
+        self.assertEqual(self.get_type_label("testtype"), "RecordType testcoll/_type/testtype")
+        # Recorded configuration update causes type data to be re-read
+        update_coll_generation(self.testcoll, config=True)
+        self.assertEqual(self.get_type_label("testtype"), "Label not read")
+        return
+
+    def test_cached_values_not_reused_without_generation(self):
+        # Collection with no recorded configuration updates
+        gen_path = os.path.join(self.testcoll._entitydir, layout.COLL_CONFIG_GENERATION_FILE)
+        if os.path.exists(gen_path):
+            os.remove(gen_path)
+        self.assertEqual(self.get_type_label("testtype"), "RecordType testcoll/_type/testtype")
+        self.write_type_label("testtype", "Label read")
+        self.assertEqual(self.get_type_label("testtype"), "Label read")
+        return
+
+    def test_cached_supertypes(self):
+        for type_id, supertype_uris in (("type1", []), ("type11", ["test:type1"])):
+            RecordType.create(self.testcoll, type_id,
+                recordtype_create_values(type_id=type_id, type_uri="test:"+type_id,
+                    supertype_uris=supertype_uris
+                    )
+                )
+        Collection.flush_all_caches()
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        self.assertEqual(list(coll.cache_get_supertype_uris("test:type11")), ["test:type1"])
+        # Supertype closure values are reused with other cached type values
+        Collection.flush_all_caches()
+        coll = Collection.load(self.testsite, "testcoll", altscope="all")
+        self.assertEqual(list(coll.cache_get_supertype_uris("test:type11")), ["test:type1"])
+        self.assertEqual(list(coll.cache_get_subtype_uris("test:type1")), ["test:type11"])
+        return
+
+# End.
@@ -17,6 +17,11 @@ import os
 import unittest
 import re
 
+from django.test.utils                          import override_settings
+
+from annalist.views.rendercache                 import (
+    get_markdown_cache, render_markdown, get_help_text
+    )
 from annalist.views.fields.render_text_markdown import (
     get_text_markdown_renderer, 
     get_show_markdown_renderer, 
@@ -152,6 +157,38 @@ class TextMarkdownRenderingTest(FieldRendererTestSupport):
                 )
         return
 
+    @override_settings(MARKDOWN_CACHE_SIZE=100)
+    def test_MarkdownCache(self):
+        cache = get_markdown_cache()
+        cache.flush()
+        html1 = render_markdown("# heading 1")
+        self.assertEqual(html1, "<h1>heading 1</h1>")
+        self.assertEqual(cache.size(), len(html1))
+        self.assertIs(render_markdown("# heading 1"), html1)
+        self.assertEqual(cache.size(), len(html1))
+        # Least recently used values are discarded when size limit is exceeded
+        for i in range(2, 7):
+            self.assertEqual(render_markdown("# heading %d"%i), "<h1>heading %d</h1>"%i)
+        self.assertLessEqual(cache.size(), 100)
+        self.assertIsNot(render_markdown("# heading 1"), html1)
+        # Values larger than the cache are not saved
+        cache.flush()
+        self.assertEqual(render_markdown("long "*40), "<p>"+("long "*40)+"</p>")
+        self.assertEqual(cache.size(), 0)
+        return
+
+    @override_settings(MARKDOWN_CACHE_SIZE=0)
+    def test_MarkdownCacheDisabled(self):
+        self.assertIsNone(get_markdown_cache())
+        self.assertEqual(render_markdown("*text*"), "<p><em>text</em></p>")
+        return
+
+    def test_HelpText(self):
+        self.assertIn("<h1>Login page</h1>", get_help_text("_unused_login-help"))
+        self.assertIsNone(get_help_text("login-help"))
+        self.assertIsNone(get_help_text("no-such-help"))
+        return
+
 # End.
 
 if __name__ == "__main__":
@@ -0,0 +1,179 @@
+"""
+Tests for responses that return entity resource data from files
+(validators, range requests, streaming and front-end server delegation).
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from django.conf                        import settings
+from django.test                        import override_settings
+from django.test.client                 import Client
+
+from annalist                           import layout
+
+from annalist.models.site               import Site
+from annalist.models.recordtypedata     import RecordTypeData
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+from .entity_testutils import (
+    create_test_user
+    )
+from .entity_testentitydata import (
+    entity_resource_url
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Resource file response tests
+#
+#   -----------------------------------------------------------------------------
+
+class ResourceResponseTest(AnnalistTestCase):
+    """
+    Tests access to entity resource files
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        self.datafile = os.path.join(
+            self.testdata._entitydir, "entity1", layout.ENTITY_DATA_FILE
+            )
+        with open(self.datafile, "rb") as f:
+            self.filedata = f.read()
+        self.resource_url = TestHostUri + entity_resource_url(
+            coll_id="testcoll", type_id="testtype", entity_id="entity1",
+            resource_ref=layout.ENTITY_DATA_FILE
+            )
+        create_test_user(self.testcoll, "testuser", "testpassword")
+        self.client = Client(HTTP_HOST=TestHost)
+        loggedin = self.client.login(username="testuser", password="testpassword")
+        self.assertTrue(loggedin)
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(ResourceResponseTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def get_content(self, r):
+        if r.streaming:
+            return b"".join(r.streaming_content)
+        return r.content
+
+    def test_get_resource_file(self):
+        r = self.client.get(self.resource_url)
+        self.assertEqual(r.status_code,   200)
+        self.assertEqual(r.reason_phrase, "OK")
+        self.assertFalse(r.streaming)
+        self.assertEqual(r.content,           self.filedata)
+        self.assertEqual(r['Content-Type'],   "application/ld+json")
+        self.assertEqual(r['Content-Length'], str(len(self.filedata)))
+        self.assertEqual(r['Accept-Ranges'],  "bytes")
+        st = os.stat(self.datafile)
+        self.assertEqual(r['ETag'], '"%x-%x"'%(st.st_mtime_ns, st.st_size))
+        self.assertIn("GMT", r['Last-Modified'])
+        self.assertIn('rel="canonical"', r['Link'])
+        return
+
+    def test_get_resource_range(self):
+        size = len(self.filedata)
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=0-9")
+        self.assertEqual(r.status_code,       206)
+        self.assertEqual(r.content,           self.filedata[0:10])
+        self.assertEqual(r['Content-Length'], "10")
+        self.assertEqual(r['Content-Range'],  "bytes 0-9/%d"%(size,))
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=-20")
+        self.assertEqual(r.status_code,       206)
+        self.assertEqual(r.content,           self.filedata[-20:])
+        self.assertEqual(r['Content-Range'],  "bytes %d-%d/%d"%(size-20, size-1, size))
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=10-")
+        self.assertEqual(r.status_code,       206)
+        self.assertEqual(r.content,           self.filedata[10:])
+        return
+
+    def test_get_resource_range_unsatisfiable(self):
+        size = len(self.filedata)
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=%d-"%(size,))
+        self.assertEqual(r.status_code,       416)
+        self.assertEqual(r['Content-Range'],  "bytes */%d"%(size,))
+        return
+
+    def test_get_resource_if_range(self):
+        r = self.client.get(self.resource_url)
+        etag = r['ETag']
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag)
+        self.assertEqual(r.status_code,       206)
+        self.assertEqual(r.content,           self.filedata[0:10])
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"other"')
+        self.assertEqual(r.status_code,       200)
+        self.assertEqual(r.content,           self.filedata)
+        return
+
+    @override_settings(RESOURCE_STREAM_MIN_SIZE=16)
+    def test_get_resource_streamed(self):
+        r = self.client.get(self.resource_url)
+        self.assertEqual(r.status_code,       200)
+        self.assertTrue(r.streaming)
+        self.assertEqual(self.get_content(r), self.filedata)
+        self.assertEqual(r['Content-Length'], str(len(self.filedata)))
+        r = self.client.get(self.resource_url, HTTP_RANGE="bytes=5-104")
+        self.assertEqual(r.status_code,       206)
+        self.assertTrue(r.streaming)
+        self.assertEqual(self.get_content(r), self.filedata[5:105])
+        return
+
+    @override_settings(RESOURCE_SENDFILE="X-Sendfile")
+    def test_get_resource_x_sendfile(self):
+        r = self.client.get(self.resource_url)
+        self.assertEqual(r.status_code,       200)
+        self.assertEqual(r.content,           b"")
+        self.assertEqual(r['X-Sendfile'],     os.path.normpath(self.datafile))
+        self.assertIn("ETag", r)
+        return
+
+    @override_settings(RESOURCE_SENDFILE="X-Accel-Redirect", RESOURCE_SENDFILE_PREFIX="/data/")
+    def test_get_resource_x_accel_redirect(self):
+        r = self.client.get(self.resource_url)
+        self.assertEqual(r.status_code,       200)
+        self.assertEqual(r.content,           b"")
+        data_ref = os.path.relpath(self.datafile, settings.BASE_SITE_DIR)
+        self.assertEqual(r['X-Accel-Redirect'], "/data/"+data_ref)
+        return
+
+    def test_get_generated_resource(self):
+        # Generated (Turtle) resource data is not file-backed
+        turtle_url = TestHostUri + entity_resource_url(
+            coll_id="testcoll", type_id="testtype", entity_id="entity1",
+            resource_ref=layout.ENTITY_DATA_TURTLE
+            )
+        r = self.client.get(turtle_url)
+        self.assertEqual(r.status_code,       200)
+        self.assertTrue(r["ETag"].startswith('W/"'))
+        self.assertNotIn("Accept-Ranges", r)
+        return
+
+# End.
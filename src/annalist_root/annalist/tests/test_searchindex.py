@@ -0,0 +1,273 @@
+"""
+Tests for collection full-text search index, and its use by EntityFinder.
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import os
+import json
+import sqlite3
+import unittest
+
+import logging
+log = logging.getLogger(__name__)
+
+from django.test                        import override_settings
+
+from annalist                           import layout
+from annalist.identifiers               import RDFS
+
+from annalist.models.site               import Site
+from annalist.models.recordtype         import RecordType
+from annalist.models.recordtypedata     import RecordTypeData
+from annalist.models.entitydata         import EntityData
+from annalist.models.entityfinder       import EntityFinder
+from annalist.models                    import searchindex
+from annalist.models.searchindex        import get_search_index
+from annalist.models.collectiongeneration   import update_coll_generation
+
+from .AnnalistTestCase import AnnalistTestCase
+from .tests import (
+    TestHost, TestHostUri, TestBasePath, TestBaseUri, TestBaseDir
+    )
+from .init_tests import (
+    init_annalist_test_site, init_annalist_test_coll, resetSitedata
+    )
+
+#   -----------------------------------------------------------------------------
+#
+#   Search index tests
+#
+#   -----------------------------------------------------------------------------
+
+class SearchIndexTest(AnnalistTestCase):
+    """
+    Tests collection search index maintenance and use
+    """
+
+    def setUp(self):
+        init_annalist_test_site()
+        self.testsite = Site(TestBaseUri, TestBaseDir)
+        self.testcoll = init_annalist_test_coll()
+        self.testdata = RecordTypeData.load(self.testcoll, "testtype")
+        self.index    = get_search_index(self.testcoll)
+        self.remove_indexes()
+        for entity_id in ("entity2", "entity3"):
+            self.create_entity(entity_id, "Entity %s label"%(entity_id,))
+        return
+
+    def tearDown(self):
+        return
+
+    @classmethod
+    def tearDownClass(cls):
+        super(SearchIndexTest, cls).tearDownClass()
+        resetSitedata(scope="collections")
+        return
+
+    def create_entity(self, entity_id, label):
+        return EntityData.create(self.testdata, entity_id, { RDFS.CURIE.label: label })
+
+    def remove_indexes(self):
+        # Test site data is not reset for each test, so remove any index files
+        # left by earlier tests (including SQLite write-ahead log files)
+        for coll in self.testcoll.get_alt_entities(altscope="all"):
+            index_path = get_search_index(coll)._index_path
+            for p in (index_path, index_path+"-wal", index_path+"-shm"):
+                if os.path.exists(p):
+                    os.remove(p)
+        return
+
+    def rebuild_indexes(self):
+        for coll in self.testcoll.get_alt_entities(altscope="all"):
+            self.assertTrue(EntityFinder(coll).rebuild_search_index())
+        return
+
+    def index_locked(self):
+        conn = sqlite3.connect(self.index._index_path, timeout=0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ROLLBACK")
+        except sqlite3.OperationalError:
+            return True
+        finally:
+            conn.close()
+        return False
+
+    def search_candidates(self, search):
+        return EntityFinder(self.testcoll).get_search_candidates(search)
+
+    def searched_entities(self, search, type_id=None):
+        finder = EntityFinder(self.testcoll)
+        es     = finder.get_entities(type_id=type_id, altscope="all", search=search)
+        return { (e.get_type_id(), e.get_id()) for e in es }
+
+    def scanned_entities(self, search, type_id=None):
+        # Selection by scanning all entities for search term
+        finder = EntityFinder(self.testcoll)
+        es     = finder.search_entities(
+            finder.get_base_entities(type_id=type_id, altscope="all"), search
+            )
+        return { (e.get_type_id(), e.get_id()) for e in es }
+
+    def test_index_not_used_until_rebuilt(self):
+        self.assertEqual(self.index.find("entity2 label"), None)
+        self.assertEqual(self.search_candidates("entity2 label"), None)
+        # Background rebuild is disabled by test settings
+        self.assertFalse(self.index.exists())
+        self.assertEqual(self.index.find("entity2 label"), None)
+        self.assertEqual(self.searched_entities("entity2 label"), {("testtype", "entity2")})
+        self.rebuild_indexes()
+        self.assertEqual(self.search_candidates("entity2 label"), {("testtype", "entity2")})
+        self.assertEqual(self.index.find("entity2 label"), {("testtype", "entity2")})
+        # Search is case sensitive
+        self.assertEqual(self.index.find("Entity entity2"), {("testtype", "entity2")})
+        self.assertEqual(self.index.find("ENTITY ENTITY2"), set())
+        return
+
+    def test_index_rebuilt_in_background(self):
+        with override_settings(SEARCH_INDEX_BACKGROUND_REBUILD=True):
+            rebuild_thread = EntityFinder(self.testcoll).rebuild_search_index_background()
+            self.assertIsNotNone(rebuild_thread)
+            rebuild_thread.join()
+        self.assertEqual(self.index.find("entity2 label"), {("testtype", "entity2")})
+        return
+
+    def test_index_updated(self):
+        self.rebuild_indexes()
+        self.create_entity("entity4", "New entity label")
+        e2 = EntityData.load(self.testdata, "entity2")
+        e2[RDFS.CURIE.label] = "Updated label"
+        e2._save()
+        EntityData.remove(self.testdata, "entity3")
+        # Index is used without rebuilding
+        self.assertEqual(self.index.find("New entity"),    {("testtype", "entity4")})
+        self.assertEqual(self.index.find("Updated label"), {("testtype", "entity2")})
+        self.assertEqual(self.index.find("entity2 label"), set())
+        self.assertEqual(self.index.find("entity3 label"), set())
+        return
+
+    def test_index_not_locked_during_post_update_processing(self):
+        self.rebuild_indexes()
+        locked = []
+        index_locked = self.index_locked
+        class LockCheckEntityData(EntityData):
+            def _post_update_processing(self, entitydata, post_update_flags):
+                locked.append(index_locked())
+                return entitydata
+            def _post_remove_processing(self, post_update_flags):
+                locked.append(index_locked())
+                return
+        LockCheckEntityData.create(self.testdata, "entity4", { RDFS.CURIE.label: "New entity label" })
+        self.assertEqual(self.index.find("New entity"), {("testtype", "entity4")})
+        LockCheckEntityData.remove(self.testdata, "entity4")
+        self.assertEqual(locked, [False, False])
+        self.assertEqual(self.index.find("New entity"), set())
+        return
+
+    def test_index_updated_on_config_save(self):
+        # Configuration generation updates made by post-update processing
+        # are recorded in the index
+        self.rebuild_indexes()
+        t = RecordType.load(self.testcoll, "testtype")
+        t[RDFS.CURIE.label] = "Updated type label"
+        t._save()
+        self.assertEqual(self.index.find("Updated type"), {(layout.TYPE_TYPEID, "testtype")})
+        return
+
+    def test_index_not_used_after_other_update(self):
+        self.rebuild_indexes()
+        # Collection update not recorded in index (e.g. by older software)
+        update_coll_generation(self.testcoll)
+        self.assertEqual(self.index.find("entity2"), None)
+        self.assertEqual(self.search_candidates("entity2 label"), None)
+        self.rebuild_indexes()
+        self.assertEqual(self.search_candidates("entity2 label"), {("testtype", "entity2")})
+        self.assertEqual(self.index.find("entity2 label"), {("testtype", "entity2")})
+        return
+
+    def test_index_updated_in_batch(self):
+        self.rebuild_indexes()
+        with self.index.updating_batch():
+            self.create_entity("batch4", "Batch1 entity label")
+            with self.index.updating_collection():
+                update_coll_generation(self.testcoll)
+        self.assertEqual(self.index.find("Batch1 entity"), {("testtype", "batch4")})
+        return
+
+    def test_index_not_used_after_other_update_in_batch(self):
+        self.rebuild_indexes()
+        with self.index.updating_batch():
+            self.create_entity("batch4", "Batch2 entity label")
+            # Collection update not recorded in index (e.g. by another process)
+            update_coll_generation(self.testcoll)
+            self.create_entity("batch5", "Batch2 entity label")
+            with self.index.updating_collection():
+                update_coll_generation(self.testcoll)
+        self.assertEqual(self.index.find("Batch2 entity"), None)
+        self.assertEqual(self.search_candidates("Batch2 entity"), None)
+        self.rebuild_indexes()
+        self.assertEqual(
+            self.search_candidates("Batch2 entity"), 
+            {("testtype", "batch4"), ("testtype", "batch5")}
+            )
+        return
+
+    def test_index_batch_committed_in_groups(self):
+        index_locked = self.index_locked
+        self.rebuild_indexes()
+        save_batch_size = searchindex.SEARCH_INDEX_BATCH_SIZE
+        searchindex.SEARCH_INDEX_BATCH_SIZE = 2
+        try:
+            with self.index.updating_batch():
+                self.create_entity("batch4", "Batch3 entity label")
+                self.assertTrue(index_locked())
+                self.create_entity("batch5", "Batch3 entity label")
+                self.assertFalse(index_locked())
+                self.create_entity("batch6", "Batch3 entity label")
+                self.assertTrue(index_locked())
+        finally:
+            searchindex.SEARCH_INDEX_BATCH_SIZE = save_batch_size
+        self.assertFalse(index_locked())
+        self.assertEqual(
+            self.index.find("Batch3 entity"), 
+            {("testtype", "batch4"), ("testtype", "batch5"), ("testtype", "batch6")}
+            )
+        return
+
+    def test_index_includes_inherited_entities(self):
+        self.rebuild_indexes()
+        candidates = self.search_candidates("Default_view")
+        self.assertIn((layout.VIEW_TYPEID, "Default_view"), candidates)
+        return
+
+    def test_short_search_term(self):
+        self.assertEqual(self.search_candidates("e2"), None)
+        self.assertEqual(self.searched_entities("y2"), {("testtype", "entity2")})
+        return
+
+    def test_searched_entities(self):
+        # Entities selected using the search index are the same as those found by
+        # scanning all entities
+        self.rebuild_indexes()
+        for search, type_id in (
+                ("entity2",         None),
+                ("entity2 label",   "testtype"),
+                ("Default",         None),
+                ("annal:Type",      None),
+                ("testcoll",        None),      # In `annal:url` values only
+                ("testcoll",        "testtype"),
+                ("no such text",    None),
+                ):
+            self.assertEqual(
+                self.searched_entities(search, type_id),
+                self.scanned_entities(search, type_id)
+                )
+        return
+
+# End.
@@ -13,10 +13,12 @@ import logging
 log = logging.getLogger(__name__)
 
 import os
+import time
 import unittest
 import traceback
 
 from django.test.client             import Client
+from django.test.utils              import override_settings
 
 from rdflib                         import Graph, URIRef, Literal
 
@@ -41,6 +43,12 @@ from annalist.models.annalistuser   import AnnalistUser
 from annalist.models.recordenum     import RecordEnumFactory
 from annalist.models.entitydata     import EntityData
 from annalist.models.entitytypeinfo import EntityTypeInfo
+from annalist.models.entityindex    import INDEX_MTIME_RESOLUTION
+from annalist.models.sizedcache     import get_sized_cache
+from annalist.models.entitydatacache import EntityDataCache
+from annalist.models.entityresourceaccess import (
+    turtle_resource_file, jsonld_context_resources
+    )
 
 from .AnnalistTestCase import AnnalistTestCase
 from .tests import (
@@ -283,6 +291,25 @@ class TurtleOutputTest(AnnalistTestCase):
         # print "***** get_context_mock_dict: mu: %s, mock_dict: %r"%(mu, mock_dict.keys())
         return mock_dict
 
+    def age_context_file(self):
+        # Set context file modification time so that it is not too recent for
+        # generated Turtle data to be cached.
+        context_path = os.path.join(
+            self.coll_basedir("testcoll"), layout.COLL_CONTEXT_FILE
+            )
+        t = time.time_ns() - 2*INDEX_MTIME_RESOLUTION
+        os.utime(context_path, ns=(t, t))
+        return
+
+    def get_entity1_turtle(self, baseurl, resource_info):
+        testtype_data = RecordTypeData.load(self.testcoll, "testtype")
+        jsondata = EntityData.load(testtype_data, "entity1").get_values()
+        jsondata["@context"] = [ {"@base": "../../"}, "../../"+layout.COLL_CONTEXT_FILE ]
+        jsondata["test:prop"] = "test value"
+        return turtle_resource_file(
+            baseurl+"testtype/entity1/", jsondata, resource_info
+            ).read()
+
     #   -----------------------------------------------------------------------------
     #   Turtle output tests
     #   -----------------------------------------------------------------------------
@@ -575,6 +602,72 @@ class TurtleOutputTest(AnnalistTestCase):
             self.assertIn( (URIRef(s), URIRef(p), o), g)
         return
 
+    def test_turtle_resource_contexts(self):
+        """
+        Generate Turtle data using the collection context held in memory, and check
+        the result is the same as when the context is read by the JSON-LD parser.
+        """
+        self.testcoll.generate_coll_jsonld_context()
+        coll_baseurl  = self.dir_base_url(self.coll_basedir("testcoll"))
+        resource_info = { "resource_contexts": jsonld_context_resources(self.testcoll, coll_baseurl) }
+        self.assertEqual(
+            list(resource_info["resource_contexts"].keys()), 
+            [coll_baseurl+layout.COLL_CONTEXT_FILE]
+            )
+        g_original = Graph().parse(
+            data=self.get_entity1_turtle(coll_baseurl, {}), format="turtle"
+            )
+        g_revised  = Graph().parse(
+            data=self.get_entity1_turtle(coll_baseurl, resource_info), format="turtle"
+            )
+        self.assertEqual(len(g_revised), len(g_original))
+        self.assertEqual(set(g_revised), set(g_original))
+        self.assertIn(
+            ( URIRef(coll_baseurl+"testtype/entity1")
+            , URIRef(ANNAL.URI.id), Literal("entity1") ), 
+            g_revised
+            )
+        return
+
+    @override_settings(TURTLE_DATA_CACHE_SIZE=1000000)
+    def test_turtle_data_cache(self):
+        """
+        Turtle data is saved and re-used, and regenerated when the collection 
+        context is changed.
+        """
+        cache = get_sized_cache("TURTLE_DATA_CACHE_SIZE", EntityDataCache)
+        cache.flush()
+        self.testcoll.generate_coll_jsonld_context()
+        coll_baseurl  = "http://test.example.com/testsite/c/testcoll/d/"
+        resource_info = { "resource_contexts": jsonld_context_resources(self.testcoll, coll_baseurl) }
+        # Not cached when context file recently modified
+        turtle_data = self.get_entity1_turtle(coll_baseurl, resource_info)
+        self.assertEqual(cache.size(), 0)
+        # Cached, and re-used
+        self.age_context_file()
+        resource_info = { "resource_contexts": jsonld_context_resources(self.testcoll, coll_baseurl) }
+        self.assertEqual(self.get_entity1_turtle(coll_baseurl, resource_info), turtle_data)
+        cache_size = cache.size()
+        self.assertGreater(cache_size, len(turtle_data))
+        self.assertEqual(self.get_entity1_turtle(coll_baseurl, resource_info), turtle_data)
+        self.assertEqual(cache.size(), cache_size)
+        # Context change means cached data is not used
+        RecordVocab.create(self.testcoll, "test",
+            { RDFS.CURIE.label:   "Vocabulary test"
+            , ANNAL.CURIE.uri:    "http://example.org/test/#"
+            })
+        self.age_context_file()
+        resource_info = { "resource_contexts": jsonld_context_resources(self.testcoll, coll_baseurl) }
+        turtle_data_changed = self.get_entity1_turtle(coll_baseurl, resource_info)
+        self.assertNotEqual(turtle_data_changed, turtle_data)
+        g = Graph().parse(data=turtle_data_changed, format="turtle")
+        self.assertIn(
+            ( URIRef(coll_baseurl+"testtype/entity1")
+            , URIRef("http://example.org/test/#prop"), Literal("test value") ), 
+            g
+            )
+        return
+
     def test_http_turtle_type_vocab(self):
         """
         Read type data as Turtle, and check resulting RDF triples
@@ -25,6 +25,8 @@ from annalist.layout import Layout
 import annalist.util
 import annalist.views.fields.find_renderers
 import annalist.views.fields.render_placement
+import annalist.views.fileresponse
+import annalist.models.entityresourceaccess
 
 test_layout     = Layout(settings.BASE_DATA_DIR, settings.SITE_DIR_NAME)
 TestBaseDir     = test_layout.SITE_PATH             # e.g. ".../sampledata/data/annalist_site"
@@ -53,6 +55,9 @@ def load_tests(loader, tests, ignore):
         tests.addTests(doctest.DocTestSuite(annalist.views.fields.render_placement))
         tests.addTests(doctest.DocTestSuite(annalist.views.fields.render_text_language))
         tests.addTests(doctest.DocTestSuite(annalist.models.entityfinder))
+        tests.addTests(doctest.DocTestSuite(annalist.models.searchindex))
+        tests.addTests(doctest.DocTestSuite(annalist.views.fileresponse))
+        tests.addTests(doctest.DocTestSuite(annalist.models.entityresourceaccess))
         # For some reason, this won't load in the full test suite
         # tests.addTests(doctest.DocTestSuite(annalist.tests.entity_testutils))
     else:
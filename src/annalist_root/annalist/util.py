@@ -36,6 +36,11 @@ from utils.py3porting       import (
 from annalist               import layout
 from annalist.identifiers   import ANNAL
 
+try:
+    import orjson as fast_json          # Optional accelerated JSON parser
+except ImportError:
+    fast_json = None
+
 def valid_id(id_string, reserved_ok=False):
     """
     Checks the supplied id is valid as an Annalist identifier.
@@ -393,6 +398,30 @@ def strip_comments(f):
     fnc.seek(sof)
     return fnc
 
+COMMENT_LINE_RE = re.compile(br"^\s*//", re.MULTILINE)
+
+def load_json_data(data):
+    """
+    Returns a value parsed from the supplied JSON data bytes, which may contain
+    comment lines (see `strip_comments`).
+
+    Comment lines are rare (e.g. in older hand-edited files), so the data is parsed 
+    directly if none are found, using an accelerated JSON parser if one is installed.
+
+    >>> load_json_data(b'{"a": "http://example.org/"}') == {"a": "http://example.org/"}
+    True
+    >>> load_json_data(b'// comment\\n{"a": 1}\\n') == {"a": 1}
+    True
+    """
+    if not COMMENT_LINE_RE.search(data):
+        if fast_json is None:
+            return json.loads(data)
+        try:
+            return fast_json.loads(data)
+        except ValueError:
+            pass        # e.g. values not accepted by accelerated parser: use standard parser
+    return json.load(strip_comments(io.StringIO(data.decode("utf-8"))))
+
 def renametree_temp(src):
     """
     Rename tree to temporary name, and return that name, or 
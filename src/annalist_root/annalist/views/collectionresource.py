@@ -23,10 +23,12 @@ import annalist.models.entitytypeinfo as entitytypeinfo
 from annalist.models.entityresourceaccess import (
     collection_fixed_json_resources,
     find_entity_resource,
+    jsonld_context_resources,
     get_resource_file
     )
 
 from annalist.views.displayinfo         import DisplayInfo
+from annalist.views.fileresponse        import file_validators
 from annalist.views.generic             import AnnalistGenericView
 
 class CollectionResourceAccess(AnnalistGenericView):
@@ -78,7 +80,17 @@ class CollectionResourceAccess(AnnalistGenericView):
                         }
                     )
                 )
+        # Respond to conditional request without reading resource
+        validators   = self.get_resource_validators(coll, resource_info)
+        not_modified = self.not_modified_response(validators)
+        if not_modified:
+            return not_modified
         coll_baseurl = viewinfo.reqhost + self.get_collection_base_url(coll_id)
+        if "resource_access" in resource_info:
+            # Use collection context held in memory to generate resource data
+            resource_info = dict(resource_info,
+                resource_contexts=jsonld_context_resources(coll, coll_baseurl)
+                )
         resource_file, resource_type = get_resource_file(
             coll, resource_info, coll_baseurl
             )
@@ -93,18 +105,34 @@ class CollectionResourceAccess(AnnalistGenericView):
                 )
         # Return resource
         try:
-            response = self.resource_response(resource_file, resource_info["resource_type"])
+            response = self.resource_file_response(resource_file, resource_info["resource_type"])
+            response = self.add_validators(response, validators)
         except Exception as e:
             log.exception(str(e))
+            resource_file.close()
             response = self.error(
                 dict(self.error500values(),
                     message=str(e)+" - see server log for details"
                     )
                 )
-        finally:
-            resource_file.close()
         return response
 
+    def get_resource_validators(self, coll, resource_info):
+        """
+        Returns validators for the indicated collection resource, or None if the
+        resource is not present.
+        """
+        if "resource_access" in resource_info:
+            # Resource generated from collection metadata
+            data_stat = coll._stat()
+            if data_stat is None:
+                return None
+            return self.generated_validators(data_stat, coll)
+        resource_stat = coll._stat(resource_info["resource_path"])
+        if resource_stat is None:
+            return None
+        return file_validators(resource_stat)
+
     def view_setup(self, coll_id, request_dict):
         """
         Assemble display information for view request handler
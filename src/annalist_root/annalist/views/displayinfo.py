@@ -44,8 +44,6 @@ from annalist.models.entitytypeinfo import (
     )
 from annalist.models.collection     import Collection
 from annalist.models.recordtype     import RecordType
-from annalist.models.recordlist     import RecordList
-from annalist.models.recordview     import RecordView
 from annalist.models.annalistuser   import default_user_id, unknown_user_id
 
 from annalist.views.confirm         import ConfirmView, dict_querydict
@@ -315,6 +313,7 @@ class DisplayInfo(object):
                 self.coll_id    = coll_id
                 #@@TODO: try with altscope="site"?
                 self.collection = Collection.load(self.site, coll_id, altscope="all")
+                self.collection.check_collection_caches()
                 self.orig_coll  = self.collection
                 self.perm_coll  = self.collection
                 ver = self.collection.get(ANNAL.CURIE.software_version, None) or "0.0.0"
@@ -336,9 +335,13 @@ class DisplayInfo(object):
         This is a bit of  a hack to ensure that it is always possible for the user 
         to force caches to be flushed, e.g. when type informatiuon is updated in a 
         different tab or by another user.
+
+        Only caches in the current process are flushed:  this is a read-only 
+        request, so the collection generation is not updated (which would cause 
+        all server processes to discard their cached data for the collection).
         """
         assert (self.collection is not None)
-        self.collection.flush_collection_caches()
+        self.collection._flush_local_caches()
         return
 
     def update_coll_version(self):
@@ -414,7 +417,7 @@ class DisplayInfo(object):
                 msg2 = message.DISPLAY_ALTERNATIVE_LIST%{'id': list_id, 'coll_id': self.coll_id}
                 self.add_error_message(msg2)
             self.list_id    = list_id
-            self.recordlist = RecordList.load(self.collection, list_id, altscope="all")
+            self.recordlist = self.collection.get_list(list_id)
             if "@error" in self.recordlist:
                 self.http_response = self.view.error(
                     dict(self.view.error500values(),
@@ -449,7 +452,7 @@ class DisplayInfo(object):
                 msg2 = message.DISPLAY_ALTERNATIVE_VIEW%{'id': view_id, 'coll_id': self.coll_id}
                 self.add_error_message(msg2)
             self.view_id    = view_id
-            self.recordview = RecordView.load(self.collection, view_id, altscope="all")
+            self.recordview = self.collection.get_view(view_id)
             if "@error" in self.recordview:
                 self.http_response = self.view.error(
                     dict(self.view.error500values(),
@@ -762,7 +765,7 @@ class DisplayInfo(object):
         Check for existence of list definition: 
         if it exists, return the supplied list_id, else None.
         """
-        if list_id and RecordList.exists(self.collection, list_id, altscope="all"):
+        if list_id and self.collection.get_list(list_id):
             return list_id
         return None
 
@@ -825,7 +828,7 @@ class DisplayInfo(object):
         Check for existence of view definition: 
         if it exists, return the supplied view_id, else None.
         """
-        if view_id and RecordView.exists(self.collection, view_id, altscope="all"):
+        if view_id and self.collection.get_view(view_id):
             return view_id
         return None
 
@@ -45,7 +45,7 @@ from annalist.views.responseinfo        import ResponseInfo
 from annalist.views.generic             import AnnalistGenericView
 from annalist.views.entityvaluemap      import EntityValueMap
 from annalist.views.simplevaluemap      import SimpleValueMap, StableValueMap
-from annalist.views.fieldlistvaluemap   import FieldListValueMap
+from annalist.views.fieldlistvaluemap   import get_field_list_value_map
 
 from annalist.views.fields.field_description    import FieldDescription, field_description_from_view_field
 from annalist.views.fields.bound_field          import bound_field, get_entity_values
@@ -148,6 +148,12 @@ class GenericEntityEditView(AnnalistGenericView):
         if viewinfo.check_authorization(action):
             return viewinfo.http_response
 
+        # Respond to conditional request without rendering form
+        validators   = self.get_form_validators(viewinfo, entity)
+        not_modified = self.not_modified_response(validators)
+        if not_modified:
+            return not_modified
+
         # Set up values for rendered form response
         self.help_markdown = viewinfo.recordview.get(RDFS.CURIE.comment, None)
         entityvals  = get_entity_values(
@@ -176,6 +182,7 @@ class GenericEntityEditView(AnnalistGenericView):
                 viewinfo, entity, entityvals, context_extra_values, 
                 add_field #@@TODO: remove param?
                 )
+            response = self.add_validators(response, validators)
         except Exception as e:
             # -- This should be redundant, but...
             log.error("Exception in GenericEntityEditView.get (%r)"%(e))
@@ -189,6 +196,30 @@ class GenericEntityEditView(AnnalistGenericView):
                 )
         return response
 
+    def get_form_validators(self, viewinfo, entity):
+        """
+        Returns validators for a form that displays or edits an existing entity,
+        or None if the form is not based on stored entity data.
+
+        The rendered form depends on the entity data and collection configuration, and
+        also on the requesting user, the CSRF token included in the form, and the 
+        requested content type, so these are used to distinguish the entity tag.
+        No modification time is returned, as a copy of the form obtained by a 
+        different user would have the same modification time.
+        """
+        if viewinfo.action not in ["view", "edit"]:
+            return None
+        data_stat = entity._stat()
+        if data_stat is None:
+            return None
+        variant = " ".join(
+            [ self.request.user.username
+            , self.request.COOKIES.get(settings.CSRF_COOKIE_NAME, "")
+            , self.request.META.get("HTTP_ACCEPT", "")
+            ])
+        etag, mtime = self.generated_validators(data_stat, viewinfo.collection, variant=variant)
+        return (etag, None)
+
     # POST
 
     def post(self, request,
@@ -275,7 +306,10 @@ class GenericEntityEditView(AnnalistGenericView):
         #     RecordTypeData.create(viewinfo.collection, typeinfo.entityparent.get_id(), {})
         # #@@
         try:
-            response = self.form_response(viewinfo, context_extra_values)
+            # Configuration updates (e.g. by tasks that create several views, lists
+            # and fields) regenerate the collection JSON-LD context only once
+            with viewinfo.collection.deferring_jsonld_context():
+                response = self.form_response(viewinfo, context_extra_values)
         except Exception as e:
             # -- This should be redundant, but...
             log.error("Exception in GenericEntityEditView.post (%r)"%(e))
@@ -382,7 +416,7 @@ class GenericEntityEditView(AnnalistGenericView):
         #     viewinfo.recordview.get_values()
         #     )
         view_fields  = viewinfo.recordview.get_values()[ANNAL.CURIE.view_fields]
-        fieldlistmap = FieldListValueMap('fields',
+        fieldlistmap = get_field_list_value_map('fields',
             viewinfo.collection, view_fields,
             {'view': viewinfo.recordview, 'entity': entity_values}
             )
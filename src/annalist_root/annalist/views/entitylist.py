@@ -12,6 +12,8 @@ __license__     = "MIT (http://opensource.org/licenses/MIT)"
 import logging
 log = logging.getLogger(__name__)
 
+import json
+
 from django.conf                        import settings
 from django.http                        import HttpResponse
 from django.http                        import HttpResponseRedirect
@@ -33,14 +35,16 @@ from annalist.models.recordtypedata     import RecordTypeData
 from annalist.models.entitytypeinfo     import EntityTypeInfo, CONFIG_PERMISSIONS
 from annalist.models.entityfinder       import EntityFinder
 
-from annalist.views.uri_builder         import uri_with_params
+from annalist.views.uri_builder         import uri_with_params, continuation_params
 from annalist.views.displayinfo         import DisplayInfo
 from annalist.views.confirm             import ConfirmView, dict_querydict
 from annalist.views.generic             import AnnalistGenericView
 
 from annalist.views.entityvaluemap      import EntityValueMap
 from annalist.views.simplevaluemap      import SimpleValueMap, StableValueMap
-from annalist.views.fieldlistvaluemap   import FieldListValueMap
+from annalist.views.fieldlistvaluemap   import (
+    get_field_list_value_map, get_compiled_value_map
+    )
 from annalist.views.fieldvaluemap       import FieldValueMap
 from annalist.views.repeatvaluesmap     import RepeatValuesMap
 
@@ -66,6 +70,10 @@ listentityvaluemap  = (
         , SimpleValueMap(c='customize_view_enable', e=None, f=None               )
         , SimpleValueMap(c='search_for',            e=None, f='search_for'       )
         , SimpleValueMap(c='scope',                 e=None, f='scope'            )
+        , SimpleValueMap(c='page_size',             e=None, f='page_size'        )
+        , SimpleValueMap(c='cursor',                e=None, f=None               )
+        , SimpleValueMap(c='page_prev_url',         e=None, f=None               )
+        , SimpleValueMap(c='page_next_url',         e=None, f=None               )
         , SimpleValueMap(c='continuation_url',      e=None, f='continuation_url' )
         , SimpleValueMap(c='continuation_param',    e=None, f=None               )
         # Field data is handled separately during processing of the form description
@@ -88,6 +96,7 @@ class EntityGenericListView(AnnalistGenericView):
     def __init__(self):
         super(EntityGenericListView, self).__init__()
         self.help          = "entity-list-help"
+        self.page_cursors  = (None, None)
         return
 
     # Helper functions
@@ -125,7 +134,7 @@ class EntityGenericListView(AnnalistGenericView):
         # NOTE - supplied entity has single field ANNAL.CURIE.entity_list (see 'get' below)
         #        entitylist template uses 'fields' from context to display headings
         list_fields = listinfo.recordlist.get(ANNAL.CURIE.list_fields, [])
-        fieldlistmap = FieldListValueMap('fields', listinfo.collection, list_fields, None)
+        fieldlistmap = get_field_list_value_map('fields', listinfo.collection, list_fields, None)
         entitymap.add_map_entry(fieldlistmap)  # For access to field headings
         repeatrows_field_descr = (
             { ANNAL.CURIE.id:                   "List_rows"
@@ -137,12 +146,17 @@ class EntityGenericListView(AnnalistGenericView):
             , ANNAL.CURIE.field_render_type:    "RepeatListRow"
             , ANNAL.CURIE.property_uri:         ANNAL.CURIE.entity_list
             })
-        repeatrows_descr = FieldDescription(
-            listinfo.collection, 
-            repeatrows_field_descr,
-            field_list=list_fields
+        def make_repeatrows_map():
+            repeatrows_descr = FieldDescription(
+                listinfo.collection, 
+                repeatrows_field_descr,
+                field_list=list_fields
+                )
+            return FieldValueMap(c="List_rows", f=repeatrows_descr)
+        repeatrows_key = ("List_rows", json.dumps(list_fields, sort_keys=True, default=repr))
+        entitymap.add_map_entry(
+            get_compiled_value_map(listinfo.collection, repeatrows_key, None, make_repeatrows_map)
             )
-        entitymap.add_map_entry(FieldValueMap(c="List_rows", f=repeatrows_descr))
         return entitymap
 
     # Helper functions assemble and return data for list of entities
@@ -161,29 +175,88 @@ class EntityGenericListView(AnnalistGenericView):
         entityvals['@id'] = base_url+entityref
         return entityvals
 
-    def assemble_list_data(self, listinfo, scope, search_for):
+    def get_page_size(self, request_dict):
+        """
+        Returns the list page size requested by the supplied request parameters,
+        or None if all entities are to be listed.
+        """
+        try:
+            page_size = int(request_dict.get('page_size', ""))
+        except ValueError:
+            return None
+        return page_size if page_size > 0 else None
+
+    def get_page_url(self, request_dict, cursor):
+        """
+        Returns URL for the list page starting after the supplied cursor value, 
+        based on the current request URL and selection parameters.
+        """
+        return uri_with_params(
+            self.get_request_path(), 
+            continuation_params(request_dict, {'cursor': cursor})
+            )
+
+    def get_page_links(self, request_dict):
+        """
+        Returns HTTP link values for pages of the list adjacent to that 
+        assembled by `assemble_list_data`.
+        """
+        links = []
+        (prev_cursor, next_cursor) = self.page_cursors
+        if prev_cursor is not None:
+            links.append({ "rel": "prev", "ref": self.get_page_url(request_dict, prev_cursor) })
+        if next_cursor is not None:
+            links.append({ "rel": "next", "ref": self.get_page_url(request_dict, next_cursor) })
+        return links
+
+    def assemble_list_data(self, 
+            listinfo, scope, search_for, page_size=None, cursor=None, stream=False
+            ):
         """
         Assemble and return a dict structure of JSON data used to generate
         entity list responses.
+
+        If `page_size` is supplied, only the indicated number of entities following
+        the supplied `cursor` value are included, and cursors for the adjacent pages
+        are saved in `self.page_cursors` (see `EntityFinder.get_entities_page`).
+
+        If `stream` is True, the list of entity values returned is an iterator that 
+        reads each entity as it is used, rather than a list.
         """
         # Prepare list and entity IDs for rendering form
         selector    = listinfo.recordlist.get_values().get(ANNAL.CURIE.list_entity_selector, "")
         user_perms  = self.get_permissions(listinfo.collection)
-        entity_list = (
-            EntityFinder(listinfo.collection, selector=selector)
-                .get_entities_sorted(
-                    user_perms, type_id=listinfo.type_id, altscope=scope,
-                    context={'list': listinfo.recordlist}, search=search_for
-                    )
-            )
+        finder      = EntityFinder(listinfo.collection, selector=selector)
+        query_params = {}
+        if page_size:
+            (entity_list, prev_cursor, next_cursor) = finder.get_entities_page(
+                user_perms, type_id=listinfo.type_id, altscope=scope,
+                context={'list': listinfo.recordlist}, search=search_for,
+                page_size=page_size, cursor=cursor
+                )
+            self.page_cursors = (prev_cursor, next_cursor)
+            query_params      = { 'page_size': str(page_size), 'cursor': cursor }
+        elif stream:
+            entity_list = finder.iter_entities_sorted(
+                user_perms, type_id=listinfo.type_id, altscope=scope,
+                context={'list': listinfo.recordlist}, search=search_for
+                )
+        else:
+            entity_list = finder.get_entities_sorted(
+                user_perms, type_id=listinfo.type_id, altscope=scope,
+                context={'list': listinfo.recordlist}, search=search_for
+                )
         base_url = self.get_collection_base_url(listinfo.coll_id)
         list_url = self.get_list_url(
             listinfo.coll_id, listinfo.list_id,
             type_id=listinfo.type_id,
             scope=scope,
-            search=search_for
+            search=search_for,
+            query_params=query_params
             )
-        entityvallist = [ self.strip_context_values(listinfo, e, base_url) for e in entity_list ]
+        entityvallist = ( self.strip_context_values(listinfo, e, base_url) for e in entity_list )
+        if not stream:
+            entityvallist = list(entityvallist)
         # log.debug("@@ listinfo.list_id %s, coll base_url %s"%(listinfo.list_id, base_url))
         # log.info(
         #     "EntityListDataView.assemble_list_data: list_url %s, base_url %s, context_url %s"%
@@ -208,6 +281,8 @@ class EntityGenericListView(AnnalistGenericView):
         """
         scope      = request.GET.get('scope',  None)
         search_for = request.GET.get('search', "")
+        page_size  = self.get_page_size(request.GET)
+        cursor     = request.GET.get('cursor', None)
         log.info(
             "views.entitylist.get:  coll_id %s, type_id %s, list_id %s, scope %s, search '%s'"%
             (coll_id, type_id, list_id, scope, search_for)
@@ -220,7 +295,10 @@ class EntityGenericListView(AnnalistGenericView):
         log.debug("listinfo.list_id %s"%listinfo.list_id)
         # Prepare list and entity IDs for rendering form
         try:
-            entityvallist = self.assemble_list_data(listinfo, scope, search_for)
+            entityvallist = self.assemble_list_data(
+                listinfo, scope, search_for, page_size=page_size, cursor=cursor
+                )
+            (prev_cursor, next_cursor) = self.page_cursors
             # Set up initial view context
             context_extra_values = (
                 { 'continuation_url':       listinfo.get_continuation_url() or ""
@@ -230,6 +308,12 @@ class EntityGenericListView(AnnalistGenericView):
                 , 'url_type_id':            type_id
                 , 'url_list_id':            list_id
                 , 'search_for':             search_for
+                , 'page_size':              str(page_size) if page_size else ""
+                , 'cursor':                 cursor
+                , 'page_prev_url':          
+                    None if prev_cursor is None else self.get_page_url(request.GET.dict(), prev_cursor)
+                , 'page_next_url':          
+                    None if next_cursor is None else self.get_page_url(request.GET.dict(), next_cursor)
                 , 'list_choices':           self.get_list_choices_field(listinfo)
                 , 'collection_view':        self.collection_view_url
                 , 'default_view_id':        listinfo.recordlist[ANNAL.CURIE.default_view]
@@ -345,7 +429,8 @@ class EntityGenericListView(AnnalistGenericView):
                     )
                 redirect_params = dict(
                     scope="all" if "list_scope_all" in request.POST else None,
-                    search=request.POST['search_for']
+                    search=request.POST['search_for'],
+                    page_size=request.POST.get('page_size', None)
                     )
                 redirect_cont   = listinfo.get_continuation_next()
                 # redirect_cont   = None
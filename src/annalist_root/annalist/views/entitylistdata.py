@@ -26,6 +26,7 @@ from annalist.util                      import make_type_entity_id
 from annalist.models.entityfinder       import EntityFinder
 from annalist.models.entityresourceaccess import (
     find_list_resource,
+    jsonld_context_resources,
     json_resource_file
     )
 
@@ -53,10 +54,17 @@ class EntityListDataView(EntityGenericListView):
         Return a list of entities as a JSON-LD object
 
         NOTE: The current implementation returns a full copy of each of the 
-        selected entities.
+        selected entities.  JSON-LD, N-Triples and newline-delimited JSON-LD list 
+        data is returned as a streamed response, reading each entity as it is 
+        serialized.
+
+        If a `page_size` parameter is supplied, a page of the list is returned, 
+        with links to adjacent pages in an HTTP Link header.
         """
         scope      = request.GET.get('scope',  None)
         search_for = request.GET.get('search', "")
+        page_size  = self.get_page_size(request.GET)
+        cursor     = request.GET.get('cursor', None)
         log.info(
             "views.entitylistdata.get: coll_id %s, type_id %s, list_id %s, list_ref %s, scope %s, search %s"%
             (coll_id, type_id, list_id, list_ref, scope, search_for)
@@ -64,17 +72,6 @@ class EntityListDataView(EntityGenericListView):
         listinfo    = self.list_setup(coll_id, type_id, list_id, request.GET.dict())
         if listinfo.http_response:
             return listinfo.http_response
-        # log.debug("@@ listinfo.list_id %s, coll base_url %s"%(listinfo.list_id, base_url))
-        # Prepare list data for rendering
-        try:
-            jsondata = self.assemble_list_data(listinfo, scope, search_for)
-        except Exception as e:
-            log.exception(str(e))
-            return self.error(
-                dict(self.error500values(),
-                    message=str(e)+" - see server log for details"
-                    )
-                )
         entity_list_info = find_list_resource(type_id, list_id, list_ref)
         if entity_list_info is None:
             return self.error(
@@ -86,12 +83,55 @@ class EntityListDataView(EntityGenericListView):
                         }
                     )
                 )
+        # log.debug("@@ listinfo.list_id %s, coll base_url %s"%(listinfo.list_id, base_url))
+        # Prepare list data for rendering
+        list_stream = entity_list_info.get("resource_stream", None)
+        try:
+            jsondata = self.assemble_list_data(
+                listinfo, scope, search_for, page_size=page_size, cursor=cursor,
+                stream=(list_stream is not None)
+                )
+        except Exception as e:
+            log.exception(str(e))
+            return self.error(
+                dict(self.error500values(),
+                    message=str(e)+" - see server log for details"
+                    )
+                )
 
         coll_baseurl = listinfo.reqhost + self.get_collection_base_url(coll_id)
         list_baseurl = listinfo.reqhost + self.get_list_base_url(coll_id, type_id, list_id)
+        return_type  = entity_list_info["resource_type"]
+        # URL parameter ?type=mime/type overrides specified content type
+        #
+        # @@TODO: this is to allow links to return different content-types:
+        #         is there a cleaner way?
+        if "type" in listinfo.request_dict:
+            return_type = listinfo.request_dict["type"]
+        links=[
+            { "rel": "canonical"
+            , "ref": list_baseurl
+            }]
+        links.extend(self.get_page_links(request.GET.dict()))
+        if list_stream:
+            # Entity data is read as the response is returned, so any subsequent
+            # error is logged but cannot be reported (see `list_stream_data`).
+            # Collection context held in memory is used for RDF conversion.
+            entity_list_info = dict(entity_list_info,
+                resource_contexts=jsonld_context_resources(listinfo.collection, coll_baseurl)
+                )
+            return self.resource_stream_response(
+                self.list_stream_data(list_stream, list_baseurl, jsondata, entity_list_info), 
+                return_type, links=links
+                )
+
         if "resource_access" in entity_list_info:
-            # Use indicated resource access renderer
+            # Use indicated resource access renderer, with collection context 
+            # held in memory
             list_file_access = entity_list_info["resource_access"]
+            entity_list_info = dict(entity_list_info,
+                resource_contexts=jsonld_context_resources(listinfo.collection, coll_baseurl)
+                )
         else:
             list_file_access = json_resource_file
         list_file = list_file_access(list_baseurl, jsondata, entity_list_info)
@@ -108,17 +148,6 @@ class EntityListDataView(EntityGenericListView):
 
         # Construct and return list response
         try:
-            return_type = entity_list_info["resource_type"]
-            # URL parameter ?type=mime/type overrides specified content type
-            #
-            # @@TODO: this is to allow links to return different content-types:
-            #         is there a cleaner way?
-            if "type" in listinfo.request_dict:
-                return_type = listinfo.request_dict["type"]
-            links=[
-                { "rel": "canonical"
-                , "ref": list_baseurl
-                }]
             response = self.resource_response(list_file, return_type, links=links)
         except Exception as e:
             log.exception(str(e))
@@ -132,4 +161,18 @@ class EntityListDataView(EntityGenericListView):
 
         return response
 
+    def list_stream_data(self, list_stream, list_baseurl, jsondata, entity_list_info):
+        """
+        Iterate over strings returned by the supplied list stream generator, 
+        logging any exception raised.  (Once a streamed response has been started,
+        the HTTP status cannot be changed to report an error.)
+        """
+        try:
+            for data in list_stream(list_baseurl, jsondata, entity_list_info):
+                yield data
+        except Exception as e:
+            log.exception(str(e))
+            raise
+        return
+
 # End.
@@ -28,16 +28,22 @@ from django.http                        import HttpResponse
 from annalist                           import message
 from annalist                           import layout
 
+from annalist.util                      import valid_id
+
 from annalist.models.entityresourceaccess import (
+    entity_fixed_json_resources,
+    find_fixed_resource,
     find_entity_resource,
     # entity_resource_file,
     # json_resource_file,
     # turtle_resource_file, 
     # make_turtle_resource_info,
+    jsonld_context_resources,
     get_resource_file
     )
 
 from annalist.views.displayinfo         import DisplayInfo
+from annalist.views.fileresponse        import file_validators
 from annalist.views.generic             import AnnalistGenericView
 
 class EntityResourceAccess(AnnalistGenericView):
@@ -76,6 +82,12 @@ class EntityResourceAccess(AnnalistGenericView):
         if viewinfo.http_response:
             return viewinfo.http_response
 
+        # Respond to conditional request without loading entity
+        validators   = self.get_resource_validators(viewinfo, resource_ref)
+        not_modified = self.not_modified_response(validators)
+        if not_modified:
+            return not_modified
+
         # Load values from entity
         typeinfo     = viewinfo.curr_typeinfo
         entity       = self.get_entity(viewinfo.src_entity_id, typeinfo, "view")
@@ -107,6 +119,12 @@ class EntityResourceAccess(AnnalistGenericView):
                     )
                 )
         entity_baseurl = viewinfo.reqhost + self.get_entity_base_url(coll_id, type_id, entity_id)
+        if "resource_access" in resource_info:
+            # Use collection context held in memory to generate resource data
+            coll_baseurl  = viewinfo.reqhost + self.get_collection_base_url(coll_id)
+            resource_info = dict(resource_info,
+                resource_contexts=jsonld_context_resources(viewinfo.collection, coll_baseurl)
+                )
         resource_file, resource_type = get_resource_file(entity, resource_info, entity_baseurl)
         if resource_file is None:
             msg = (message.RESOURCE_DOES_NOT_EXIST%
@@ -129,18 +147,46 @@ class EntityResourceAccess(AnnalistGenericView):
                 { "rel": "canonical"
                 , "ref": entity_baseurl
                 }]
-            response = self.resource_response(resource_file, return_type, links=links)
+            response = self.resource_file_response(resource_file, return_type, links=links)
+            response = self.add_validators(response, validators)
         except Exception as e:
             log.exception(str(e))
+            resource_file.close()
             response = self.error(
                 dict(self.error500values(),
                     message=str(e)+" - see server log for details"
                     )
                 )
-        finally:
-            resource_file.close()
         return response
 
+    def get_resource_validators(self, viewinfo, resource_ref):
+        """
+        Returns validators for the requested entity resource, based on file status
+        information obtained without loading the entity values, or None if the entity 
+        or resource is not present.
+        """
+        typeinfo  = viewinfo.curr_typeinfo
+        entity_id = viewinfo.src_entity_id
+        if not valid_id(entity_id, reserved_ok=True):
+            return None
+        resource_info = find_fixed_resource(entity_fixed_json_resources, resource_ref)
+        if resource_info and ("resource_access" in resource_info):
+            # Resource generated from entity values
+            data_stat = typeinfo.entityclass.stat(
+                typeinfo.entityparent, entity_id, altscope="all"
+                )
+            if data_stat is None:
+                return None
+            return self.generated_validators(data_stat, viewinfo.collection)
+        # Resource returned from storage
+        resource_path = resource_info["resource_path"] if resource_info else resource_ref
+        resource_stat = typeinfo.entityclass.stat(
+            typeinfo.entityparent, entity_id, resource_ref=resource_path, altscope="all"
+            )
+        if resource_stat is None:
+            return None
+        return file_validators(resource_stat)
+
     def view_setup(self, coll_id, type_id, entity_id, request_dict):
         """
         Assemble display information for entity view request handler
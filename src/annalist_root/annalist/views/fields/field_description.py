@@ -13,6 +13,8 @@ import logging
 log = logging.getLogger(__name__)
 
 import sys
+import copy
+import json
 import traceback
 from collections            import OrderedDict
 
@@ -23,10 +25,12 @@ from annalist.exceptions    import Annalist_Error, EntityNotFound_Error, Unexpec
 from annalist.util          import extract_entity_id
 
 # from annalist.models.recordfield            import RecordField
+from annalist.models.objectcache            import get_cache
+from annalist.models.collectiongeneration   import get_coll_config_generations
 from annalist.models.entitytypeinfo         import EntityTypeInfo
-from annalist.models.entityfinder           import EntityFinder
+from annalist.models.entityfinder           import EntityFinder, EntitySelector
 
-from annalist.views.fields.field_renderer   import FieldRenderer
+from annalist.views.fields.field_renderer   import get_field_renderer
 from annalist.views.fields.find_renderers   import (
     is_repeat_field_render_type,
     get_value_mapper
@@ -116,33 +120,13 @@ class FieldDescription(object):
             , 'group_delete_label':         None
             , 'group_field_list':           None
             , 'group_field_descs':          None
-            , 'field_renderer':             FieldRenderer(field_render_type, field_value_mode)
+            , 'field_renderer':             get_field_renderer(field_render_type, field_value_mode)
             , 'field_value_mapper':         get_value_mapper(field_render_type) # Used by fieldvaluemap.py
             })
         self._field_suffix_index  = 0    # No dup
         self._field_suffix        = ""
         # If field references type, pull in copy of type id and link values
-        type_ref = self._field_desc['field_ref_type']
-        if type_ref:
-            restrict_values = self._field_desc['field_ref_restriction']
-            entity_finder   = EntityFinder(collection, selector=restrict_values)
-            entities        = entity_finder.get_entities_sorted(
-                type_id=type_ref, context=view_context, altscope="select"
-                )
-            # Note: the options list may be used more than once, so the id generator
-            # returned must be materialized as a list
-            # Uses collections.OrderedfDict to preserve entity ordering
-            self._field_desc['field_choices'] = OrderedDict()
-            if field_render_type in ["Enum_optional", "Enum_choice_opt"]:
-                # Add blank choice for optional selections
-                self._field_desc['field_choices'][''] = FieldChoice('', label=field_placeholder)
-            for e in entities:
-                eid = e.get_id()
-                val = e.get_type_entity_id()
-                if eid != layout.INITIAL_VALUES_ID:
-                    self._field_desc['field_choices'][val] = FieldChoice(
-                        val, label=e.get_label(), link=e.get_view_url_path()
-                        )
+        self._set_field_choices(view_context)
         # If field references or contains field list, pull in field details
         if field_list:
             if field_id in field_ids_seen:
@@ -182,9 +166,61 @@ class FieldDescription(object):
         result._field_suffix       = self._field_suffix
         return result
 
+    def __deepcopy__(self, memo):
+        """
+        Copy of self that can be bound to a new view context (see `bind_context`).
+
+        Field descriptions of contained fields are copied, and other values are
+        shared with the original.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result._collection         = self._collection
+        result._field_desc         = self._field_desc.copy()
+        result._field_suffix_index = self._field_suffix_index
+        result._field_suffix       = self._field_suffix
+        for k in ('group_field_descs', 'row_field_descs'):
+            if result._field_desc.get(k, None):
+                result._field_desc[k] = copy.deepcopy(result._field_desc[k], memo)
+        return result
+
     def copy(self):
         return self.__copy__()
 
+    def bind_context(self, collection, view_context):
+        """
+        Bind field description to a collection and view context for rendering,
+        replacing values from the collection and context used when it was created.
+        """
+        if self._collection is not None:
+            self._collection = collection
+        self._set_field_choices(view_context)
+        for f in (self._field_desc['group_field_descs'] or []):
+            f.bind_context(collection, view_context)
+        return
+
+    def _set_field_choices(self, view_context):
+        """
+        If the field references a type, set the field choices to id and link 
+        values of entities of that type that may be referenced.
+        """
+        type_ref = self._field_desc['field_ref_type']
+        if type_ref:
+            restrict_values = self._field_desc['field_ref_restriction']
+            entity_choices  = get_entity_choices(
+                self._collection, type_ref, restrict_values, view_context
+                )
+            # Uses collections.OrderedfDict to preserve entity ordering
+            field_choices = OrderedDict()
+            if self._field_desc['field_render_type'] in ["Enum_optional", "Enum_choice_opt"]:
+                # Add blank choice for optional selections
+                field_choices[''] = FieldChoice('', label=self._field_desc['field_placeholder'])
+            for (val, label, link) in entity_choices:
+                field_choices[val] = FieldChoice(val, label=label, link=link)
+            self._field_desc['field_choices'] = field_choices
+        return
+
     def resolve_duplicates(self, properties):
         """
         Resolve duplicate property URIs that appear in a common context corresponding to
@@ -430,6 +466,59 @@ class FieldDescription(object):
             yield k
         return
 
+def make_entity_choices_cache_key(coll_id):
+    """
+    Returns key for object cache of enumerated value choices for fields that
+    reference entities in a collection (see `get_entity_choices`).
+    """
+    return ("FieldDescription.entity_choices", coll_id)
+
+def get_entity_choices(collection, type_ref, restrict_values, view_context):
+    """
+    Returns a list of (value, label, link) for entities of the referenced type that
+    are selected by a field reference restriction, sorted by type and entity id.
+
+    collection      is a collection from which data is being rendered.
+    type_ref        is the type id of entities that may be referenced.
+    restrict_values is a selector (see `EntitySelector`) that restricts the
+                    entities that may be referenced.
+    view_context    is a dictionary of context values that may be used by the
+                    selector (see `FieldDescription`).
+
+    Values are saved in an object cache, keyed by referenced type, restriction and 
+    the context values used by the restriction, and are re-used until entities of 
+    the referenced type (or a subtype) are saved or removed, or the configuration 
+    of the collection, or a collection from which it inherits, is updated.  
+    Entities of the referenced types are detected using the entity index stamps 
+    for the directories that contain them (see `EntityTypeInfo.enum_entities_stamp`),
+    so that updates to other entities do not invalidate the cached values.
+    """
+    context_values = EntitySelector(restrict_values).context_values(view_context)
+    choices_key    = (
+        type_ref, restrict_values, 
+        json.dumps(context_values, sort_keys=True, default=repr)
+        )
+    entity_finder  = EntityFinder(collection, selector=restrict_values)
+    type_stamps    = tuple(
+        EntityTypeInfo(collection, type_id).enum_entities_stamp(altscope="select")
+        for type_id in entity_finder.get_collection_subtype_ids(type_ref, "all")
+        )
+    validity       = (get_coll_config_generations(collection), type_stamps)
+    choices_cache  = get_cache(make_entity_choices_cache_key(collection.get_id()))
+    cached         = choices_cache.get(choices_key, None)
+    if cached and (None not in type_stamps) and (cached[0] == validity):
+        return cached[1]
+    entities       = entity_finder.get_entities_sorted(
+        type_id=type_ref, context=view_context, altscope="select"
+        )
+    choices = (
+        [ (e.get_type_entity_id(), e.get_label(), e.get_view_url_path())
+          for e in entities if e.get_id() != layout.INITIAL_VALUES_ID
+        ])
+    if None not in type_stamps:
+        choices_cache.set(choices_key, (validity, choices))
+    return choices
+
 def field_description_from_view_field(
     collection, field, view_context=None, field_ids_seen=[]
     ):
@@ -15,19 +15,24 @@ log = logging.getLogger(__name__)
 import traceback
 
 from annalist.views.fields.find_renderers   import (
-    get_label_renderer,
-    get_view_renderer,
-    get_edit_renderer, 
-    get_label_view_renderer,
-    get_label_edit_renderer, 
-    get_col_head_renderer, 
-    get_col_head_view_renderer, 
-    get_col_head_edit_renderer, 
-    get_col_view_renderer,
-    get_col_edit_renderer,
+    get_field_mode_renderers,
     get_value_mapper
     )
 
+_field_renderer_objects = {}    # FieldRenderer objects, keyed by render type and value mode
+
+def get_field_renderer(field_render_type, field_value_mode):
+    """
+    Returns a FieldRenderer object for the supplied render type and value mode.
+
+    FieldRenderer objects are not modified when rendering, so a single object for
+    each combination of render type and value mode is shared by all fields.
+    """
+    key = (field_render_type, field_value_mode)
+    if key not in _field_renderer_objects:
+        _field_renderer_objects[key] = FieldRenderer(field_render_type, field_value_mode)
+    return _field_renderer_objects[key]
+
 class FieldRenderer(object):
     """
     This class represents a value renderer that is bound to a specific field value.
@@ -42,18 +47,8 @@ class FieldRenderer(object):
         self._field_render_type = field_render_type
         self._field_value_mode  = field_value_mode
         self._value_mapper      = get_value_mapper(field_render_type)
-        self._value_renderer    = (
-            { 'label':         get_label_renderer(        field_render_type, field_value_mode)
-            , 'view':          get_view_renderer(         field_render_type, field_value_mode)
-            , 'edit':          get_edit_renderer(         field_render_type, field_value_mode)
-            , 'label_view':    get_label_view_renderer(   field_render_type, field_value_mode)
-            , 'label_edit':    get_label_edit_renderer(   field_render_type, field_value_mode)
-            , 'col_head':      get_col_head_renderer(     field_render_type, field_value_mode)
-            , 'col_head_view': get_col_head_view_renderer(field_render_type, field_value_mode)
-            , 'col_head_edit': get_col_head_edit_renderer(field_render_type, field_value_mode)
-            , 'col_view':      get_col_view_renderer(     field_render_type, field_value_mode)
-            , 'col_edit':      get_col_edit_renderer(     field_render_type, field_value_mode)
-            })
+        self._value_renderer    = get_field_mode_renderers(field_render_type, field_value_mode)
+        self._mode_renderer     = None
         return
 
     def __str__(self):
@@ -158,6 +153,11 @@ class FieldRenderer(object):
         return self.renderer("col_edit")
 
     def mode(self):
+        if self._mode_renderer is None:
+            self._mode_renderer = self._make_mode_renderer()
+        return self._mode_renderer
+
+    def _make_mode_renderer(self):
         class _renderer(object):
             def __init__(modeself):
                 pass
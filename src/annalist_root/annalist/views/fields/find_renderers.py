@@ -13,6 +13,7 @@ import logging
 log = logging.getLogger(__name__)
 
 import re
+import threading
 
 from django.conf                import settings
 
@@ -47,7 +48,9 @@ from .render_ref_multifields    import get_ref_multifield_renderer, RefMultifiel
 
 # Render type mappings to templates and/or renderer access functions
 
-_field_renderers = {}   # renderer cache
+_field_renderers_lock = threading.Lock()    # Interlocks creation of renderers
+_field_renderers      = None    # Base renderers, keyed by render type (see `init_field_renderers`)
+_field_mode_renderers = {}      # Renderers for each mode, keyed by render type and value mode
 
 _field_view_files = (
     { "Text":           "field/annalist_view_text.html"
@@ -147,23 +150,40 @@ def is_repeat_field_render_type(render_type):
         ])
     return render_type in repeat_field_render_types
 
+def init_field_renderers():
+    """
+    Create base renderers for all recognized render types, if not already created,
+    and return a dictionary of renderers keyed by render type.
+
+    The renderers are created once, when first used, and shared by all fields and
+    requests handled by the current process.  Render types that use the same 
+    renderer access function share a single renderer.
+    """
+    global _field_renderers
+    with _field_renderers_lock:
+        if _field_renderers is None:
+            renderers = {}
+            for field_render_type in set(_field_view_files) | set(_field_edit_files):
+                renderers[field_render_type] = RenderFieldValue(
+                    field_render_type,
+                    view_file=_field_view_files.get(field_render_type, None), 
+                    edit_file=_field_edit_files.get(field_render_type, None)
+                    )
+            function_renderers = {}
+            for field_render_type in _field_get_renderer_functions:
+                get_renderer = _field_get_renderer_functions[field_render_type]
+                if get_renderer not in function_renderers:
+                    function_renderers[get_renderer] = get_renderer()
+                renderers[field_render_type] = function_renderers[get_renderer]
+            _field_renderers = renderers
+        renderers = _field_renderers    # Copy value while lock acquired
+    return renderers
+
 def get_field_base_renderer(field_render_type):
     """
     Lookup and return base renderer for given field type.
     """
-    if field_render_type not in _field_renderers:
-        # Create and cache renderer
-        if ( (field_render_type in _field_view_files) or
-             (field_render_type in _field_edit_files) ):
-            viewfile = _field_view_files.get(field_render_type, None)
-            editfile = _field_edit_files.get(field_render_type, None)
-            _field_renderers[field_render_type] = RenderFieldValue(
-                field_render_type,
-                view_file=viewfile, edit_file=editfile
-                )
-        elif field_render_type in _field_get_renderer_functions:
-            _field_renderers[field_render_type] = _field_get_renderer_functions[field_render_type]()
-    return _field_renderers.get(field_render_type, None)
+    return init_field_renderers().get(field_render_type, None)
 
 def get_entityref_edit_renderer(renderer, field_render_type):
     """
@@ -210,12 +230,13 @@ def get_label_renderer(field_render_type, field_value_mode):
     Returns a field label renderer object that can be referenced in a 
     Django template "{% include ... %}" element.
     """
-    class _renderer(object):
-        def __init__(self):
-            pass
-        def render(self, context):
-            return context.get('field_label', "@@no 'field_label'@@")
-    return _renderer()
+    return _label_renderer
+
+class _field_label_renderer(object):
+    def render(self, context):
+        return context.get('field_label', "@@no 'field_label'@@")
+
+_label_renderer = _field_label_renderer()
 
 def get_edit_renderer(field_render_type, field_value_mode):
     """
@@ -336,6 +357,33 @@ def get_col_view_renderer(field_render_type, field_value_mode):
     log.debug("get_col_view_renderer: '%s' not found"%field_render_type)
     return "field/annalist_item_none.html"
 
+def get_field_mode_renderers(field_render_type, field_value_mode):
+    """
+    Returns a dictionary of field renderer objects for the supplied field details, 
+    keyed by render mode (cf. `RenderFieldValue`).
+
+    The dictionary is created when first requested for the supplied render type 
+    and value mode, and is shared by all fields with those details.  It must not be
+    modified by the caller.
+    """
+    mode_renderers = _field_mode_renderers.get((field_render_type, field_value_mode), None)
+    if mode_renderers is None:
+        mode_renderers = (
+            { 'label':         get_label_renderer(        field_render_type, field_value_mode)
+            , 'view':          get_view_renderer(         field_render_type, field_value_mode)
+            , 'edit':          get_edit_renderer(         field_render_type, field_value_mode)
+            , 'label_view':    get_label_view_renderer(   field_render_type, field_value_mode)
+            , 'label_edit':    get_label_edit_renderer(   field_render_type, field_value_mode)
+            , 'col_head':      get_col_head_renderer(     field_render_type, field_value_mode)
+            , 'col_head_view': get_col_head_view_renderer(field_render_type, field_value_mode)
+            , 'col_head_edit': get_col_head_edit_renderer(field_render_type, field_value_mode)
+            , 'col_view':      get_col_view_renderer(     field_render_type, field_value_mode)
+            , 'col_edit':      get_col_edit_renderer(     field_render_type, field_value_mode)
+            })
+        with _field_renderers_lock:
+            _field_mode_renderers[(field_render_type, field_value_mode)] = mode_renderers
+    return mode_renderers
+
 def get_value_mapper(field_render_type):
     """
     Returns a value mapper class instance (with encode and decode methods) 
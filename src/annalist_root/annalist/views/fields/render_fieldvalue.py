@@ -129,6 +129,24 @@ def col_label_value_wrapper_template(tooltip):
 col_label_view_value_wrapper_template = col_label_value_wrapper_template(no_tooltip)
 col_label_edit_value_wrapper_template = col_label_value_wrapper_template(with_tooltip)
 
+# Compiled templates, keyed by template text.  The render-type-independent and 
+# wrapper templates are compiled when this module is loaded, and shared by all
+# field renderers (see `get_compiled_template`).
+
+compiled_templates = dict(
+    (t, Template(t)) for t in
+        ( label_template
+        , label_wrapper_template
+        , view_value_wrapper_template
+        , edit_value_wrapper_template
+        , label_view_value_wrapper_template
+        , label_edit_value_wrapper_template
+        , col_head_wrapper_template
+        , col_label_view_value_wrapper_template
+        , col_label_edit_value_wrapper_template
+        )
+    )
+
 #   ------------------------------------------------------------
 #   Helper classes
 #   ------------------------------------------------------------
@@ -166,7 +184,7 @@ class TemplateWrapValueRenderer(object):
     to `{% include value_renderer %}`
     """
     def __init__(self, wrapper_template, value_renderer):
-        self.compiled_wrapper = Template(wrapper_template)
+        self.compiled_wrapper = get_compiled_template(wrapper_template)
         self.value_renderer   = WrapValueRenderer(value_renderer)
         return
     def render(self, context):
@@ -272,12 +290,12 @@ class RenderFieldValue(object):
         super(RenderFieldValue, self).__init__()
         self._render_type = render_type
         # Save label renderer
-        self._label_renderer = Template(label_template)
+        self._label_renderer = get_compiled_template(label_template)
         # Save view renderer
         if view_renderer is not None:
             self._view_renderer = view_renderer
         elif view_template is not None:
-            self._view_renderer = Template(view_template)
+            self._view_renderer = get_compiled_template(view_template)
         elif view_file is not None:
             self._view_renderer = get_field_template(view_file)
         else:
@@ -286,7 +304,7 @@ class RenderFieldValue(object):
         if edit_renderer is not None:
             self._edit_renderer = edit_renderer
         elif edit_template is not None:
-            self._edit_renderer = Template(edit_template)
+            self._edit_renderer = get_compiled_template(edit_template)
         elif edit_file is not None:
             self._edit_renderer = get_field_template(edit_file)
         else:
@@ -461,6 +479,19 @@ class RenderFieldValue(object):
                 )
         return self._render_col_edit
 
+# Helper function to get a compiled template from template text.
+
+def get_compiled_template(template_text):
+    """
+    Returns a compiled template for the supplied template text, which is 
+    compiled only when first used with any renderer.
+    """
+    template = compiled_templates.get(template_text, None)
+    if template is None:
+        template = Template(template_text)
+        compiled_templates[template_text] = template
+    return template
+
 # Helper function for caller to get template content.
 # This uses the configured Django template loader.
 
@@ -19,6 +19,11 @@ from django.template        import Template, Context
 
 from annalist.exceptions    import Annalist_Error
 
+from annalist.models.collectiongeneration   import get_coll_generation_inherited
+
+from annalist.views.displayinfo import context_authorization_map
+from annalist.views.rendercache import get_listrow_cache, listrow_values_key
+
 from .bound_field           import bound_field
 from .render_fieldvalue     import (
     RenderFieldValue,
@@ -311,9 +316,14 @@ class RenderRepeatGroup(object):
     Render class for repeated field group
     """
 
-    def __init__(self, templates=None):
+    def __init__(self, templates=None, row_cache=False):
         """
         Creates a renderer object for a repeating group field
+
+        If `row_cache` is True, rendered rows are saved in the list row cache
+        (see `annalist.views.rendercache`), and re-used when the same values are 
+        rendered in the same context.  This is intended for use when displaying 
+        lists of entities, whose rows do not depend on their position in the list.
         """
         # Later, may introduce a template_file= option to read from templates directory
         # log.info("RenderRepeatGroup: __init__ %r"%(templates))
@@ -325,6 +335,7 @@ class RenderRepeatGroup(object):
         self._template_empty = self._template_head
         if "head_empty" in templates:
             self._template_empty = Template(templates["head_empty"])
+        self._row_cache = row_cache
         return
 
     def __str__(self):
@@ -366,22 +377,32 @@ class RenderRepeatGroup(object):
                     response_parts = [self._template_head.render(context)]
                     repeat_index = 0
                     extras       = context["field"]["context_extra_values"]
+                    (row_cache, row_context_key) = self._get_row_cache(context)
                     for g in value_list:
                         # log.debug("RenderRepeatGroup.render field_val: %r"%(g))
-                        r = [ bound_field(f, g, context_extra_values=extras) 
-                              for f in group_field_descs 
-                              ]
-                        repeat_id = context.get("repeat_prefix", "") + group_id
-                        repeat_dict = (
-                            { "repeat_id":            repeat_id
-                            , "repeat_index":         str(repeat_index)
-                            , "repeat_prefix":        repeat_id+("__%d__"%repeat_index)
-                            , "repeat_bound_fields":  r
-                            , "repeat_entity":        g
-                            })
-                        # log.info("RenderRepeatGroup.render repeat_dict: %r"%(repeat_dict))
-                        with context.push(repeat_dict):
-                            response_parts.append(self._template_body.render(context))
+                        row_key  = None
+                        row_html = None
+                        if row_cache is not None:
+                            row_key  = (row_context_key, listrow_values_key(g))
+                            row_html = row_cache.get(row_key)
+                        if row_html is None:
+                            r = [ bound_field(f, g, context_extra_values=extras) 
+                                  for f in group_field_descs 
+                                  ]
+                            repeat_id = context.get("repeat_prefix", "") + group_id
+                            repeat_dict = (
+                                { "repeat_id":            repeat_id
+                                , "repeat_index":         str(repeat_index)
+                                , "repeat_prefix":        repeat_id+("__%d__"%repeat_index)
+                                , "repeat_bound_fields":  r
+                                , "repeat_entity":        g
+                                })
+                            # log.info("RenderRepeatGroup.render repeat_dict: %r"%(repeat_dict))
+                            with context.push(repeat_dict):
+                                row_html = self._template_body.render(context)
+                            if row_cache is not None:
+                                row_cache.set(row_key, row_html)
+                        response_parts.append(row_html)
                         repeat_index += 1
                     response_parts.append(self._template_tail.render(context))
                 else:
@@ -401,6 +422,34 @@ class RenderRepeatGroup(object):
             del tb
         return "".join(response_parts)
 
+    def _get_row_cache(self, context):
+        """
+        Returns a pair of the list row cache and a key for the values in the 
+        supplied rendering context on which rendered rows depend, or `(None, None)`
+        if rendered rows are not to be cached.
+
+        In addition to the values for each row, the rendered rows depend on the 
+        list definition and the configuration and data of the collection (via 
+        field definitions and referenced entities), the user's permissions and
+        the request URI (via continuation links in the rendered values).
+        """
+        row_cache = get_listrow_cache() if self._row_cache else None
+        coll      = context.get("collection", None)
+        list_id   = context.get("list_id", None)
+        if (row_cache is None) or (coll is None) or (not list_id):
+            return (None, None)
+        row_context_key = (
+            ( coll.get_id()
+            , list_id
+            , context.get("type_id", None)
+            , get_coll_generation_inherited(coll)
+            , context.get("render_mode", None)
+            , tuple( bool(context.get(k, False)) for k in sorted(context_authorization_map) )
+            , context.get("HOST", None)
+            , context["field"].get_continuation_param()
+            ))
+        return (row_cache, row_context_key)
+
 
 #   ------------------------------------------------------------
 #   Repeat group renderer factory class and functions
@@ -486,7 +535,7 @@ def get_repeatlistrow_renderer():
     Return field renderer object for RepeatGroup as list (col header labels)
     """
     return RenderGroupFieldValue("repeatlistrow",
-        view_renderer=RenderRepeatGroup(view_listrow),
+        view_renderer=RenderRepeatGroup(view_listrow, row_cache=True),
         edit_renderer=Template("@@repeatlistrow_renderer cannot be used for editing@@")
         )
 
@@ -12,9 +12,8 @@ __license__     = "MIT (http://opensource.org/licenses/MIT)"
 import logging
 log = logging.getLogger(__name__)
 
-import markdown
-
 from annalist.views.displayinfo                 import apply_substitutions
+from annalist.views.rendercache                 import render_markdown
 
 from annalist.views.fields.render_base          import RenderBase
 from annalist.views.fields.render_fieldvalue    import (
@@ -57,7 +56,7 @@ class text_markdown_view_renderer(object):
         """
         textval = TextMarkdownValueMapper.encode(get_field_view_value(context, None))
         textval = apply_substitutions(context, textval)
-        htmlval = markdown.markdown(textval)
+        htmlval = render_markdown(textval)
         return """<span class="markdown">%s</span>"""%htmlval
 
 class text_markdown_edit_renderer(object):
@@ -0,0 +1,203 @@
+"""
+This module contains functions used to construct HTTP responses that return
+the content of resource files held in Annalist storage (e.g. uploaded images
+and audio).
+
+Responses include validators (ETag and Last-Modified) based on the file
+modification time and size, and single byte ranges (HTTP "Range" requests)
+are supported so that clients can seek within large media resources.  Larger
+files are returned as a stream of blocks read from the file, rather than being
+read into memory.  Optionally, sending of the file can be delegated to a
+front-end web server (see settings RESOURCE_SENDFILE and RESOURCE_SENDFILE_PREFIX).
+"""
+
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import os.path
+import re
+
+from django.conf                    import settings
+from django.http                    import HttpResponse
+from django.http                    import StreamingHttpResponse
+from django.utils.http              import http_date
+
+from utils.py3porting               import is_string
+
+#   Size of blocks read from a file for a streamed response
+FILE_BLOCK_SIZE = 64*1024
+
+#   -------------------------------------------------------------------
+#   Helper functions
+#   -------------------------------------------------------------------
+
+def file_path_name(resource_file):
+    """
+    Returns the filesystem path of the file read by the supplied file object,
+    or None if the file object does not read a file in the filesystem (e.g.
+    an in-memory file containing generated data).
+    """
+    file_path = getattr(resource_file, "name", None)
+    if is_string(file_path) and os.path.isfile(file_path):
+        return file_path
+    return None
+
+def file_etag(file_stat):
+    """
+    Returns a strong entity tag value for a file, based on the file modification
+    time and size returned by `os.stat`.
+    """
+    return '"%x-%x"'%(file_stat.st_mtime_ns, file_stat.st_size)
+
+def file_validators(file_stat):
+    """
+    Returns validators for the content of a file, as a pair of values: an entity
+    tag and a modification time (in whole seconds since the epoch).
+    """
+    return (file_etag(file_stat), int(file_stat.st_mtime))
+
+def parse_range_header(range_header, size):
+    """
+    Parse the value of an HTTP Range header for a resource of the indicated size.
+
+    Returns None if the header is not supplied or is not a single byte range,
+    otherwise a pair (first, last) of byte positions, which indicates a range that
+    cannot be satisfied if `first` is not less than the resource size.
+
+    >>> parse_range_header("bytes=0-499", 1000)
+    (0, 499)
+    >>> parse_range_header("bytes=500-", 1000)
+    (500, 999)
+    >>> parse_range_header("bytes=900-1999", 1000)
+    (900, 999)
+    >>> parse_range_header("bytes=-100", 1000)
+    (900, 999)
+    >>> parse_range_header("bytes=-2000", 1000)
+    (0, 999)
+    >>> parse_range_header("bytes=1000-", 1000)
+    (1000, 999)
+    >>> parse_range_header("bytes=-0", 1000)
+    (1000, 999)
+    >>> parse_range_header("bytes=500-400", 1000) is None
+    True
+    >>> parse_range_header("bytes=0-10,20-30", 1000) is None
+    True
+    >>> parse_range_header("items=0-10", 1000) is None
+    True
+    >>> parse_range_header(None, 1000) is None
+    True
+    """
+    if not range_header:
+        return None
+    m = re.match(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", range_header)
+    if not m or not (m.group(1) or m.group(2)):
+        return None
+    if m.group(1):
+        first = int(m.group(1))
+        last  = int(m.group(2)) if m.group(2) else None
+        if (last is not None) and (last < first):
+            return None
+        if (last is None) or (last >= size):
+            last = size-1
+        return (first, last)
+    suffix = int(m.group(2))
+    return (max(size-suffix, 0), size-1)
+
+def file_block_iter(resource_file, first, length, block_size=FILE_BLOCK_SIZE):
+    """
+    Generator returns content of the indicated part of a file as a sequence
+    of blocks.  The file is closed when the generator is exhausted or closed.
+    """
+    try:
+        resource_file.seek(first)
+        while length > 0:
+            data = resource_file.read(min(block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+    finally:
+        resource_file.close()
+    return
+
+def sendfile_header_value(file_path):
+    """
+    Returns the value of a header used to delegate sending of the indicated
+    file to a front-end server, according to the RESOURCE_SENDFILE setting.
+    """
+    sendfile  = settings.RESOURCE_SENDFILE
+    file_path = os.path.normpath(file_path)
+    if sendfile.lower() == "x-accel-redirect":
+        file_ref = os.path.relpath(file_path, settings.BASE_SITE_DIR)
+        return settings.RESOURCE_SENDFILE_PREFIX + file_ref.replace(os.sep, "/")
+    return file_path
+
+#   -------------------------------------------------------------------
+#   Response construction
+#   -------------------------------------------------------------------
+
+def file_response(request, resource_file, resource_type):
+    """
+    Construct response containing content of a resource file, or a part of
+    the file requested by an HTTP Range header.
+
+    request         is the HTTP request for which a response is constructed.
+    resource_file   is a file object that reads the resource from a file in
+                    the filesystem (see `file_path_name`).  The response takes
+                    responsibility for closing the file.
+    resource_type   is the content type of the resource.
+
+    Returns an HTTP response object.
+    """
+    file_path = file_path_name(resource_file)
+    file_stat = os.fstat(resource_file.fileno())
+    size      = file_stat.st_size
+    (etag, mtime) = file_validators(file_stat)
+    last_mod  = http_date(mtime)
+    sendfile  = getattr(settings, "RESOURCE_SENDFILE", None)
+    if sendfile:
+        # Front-end server sends the file (and handles any range request)
+        resource_file.close()
+        response = HttpResponse(content_type=resource_type)
+        response[sendfile] = sendfile_header_value(file_path)
+    else:
+        first, last = 0, size-1
+        status      = 200
+        byte_range  = parse_range_header(request.META.get("HTTP_RANGE", None), size)
+        if_range    = request.META.get("HTTP_IF_RANGE", None)
+        if byte_range and if_range and if_range not in (etag, last_mod):
+            byte_range = None       # Resource changed: return all of it
+        if byte_range:
+            first, last = byte_range
+            if first >= size:
+                resource_file.close()
+                response = HttpResponse(status=416, content_type=resource_type)
+                response["Content-Range"] = "bytes */%d"%(size,)
+                return response
+            status = 206
+        length = last+1-first
+        if length > getattr(settings, "RESOURCE_STREAM_MIN_SIZE", 0):
+            response = StreamingHttpResponse(
+                file_block_iter(resource_file, first, length),
+                status=status, content_type=resource_type
+                )
+        else:
+            data = b"".join(file_block_iter(resource_file, first, length))
+            response = HttpResponse(data, status=status, content_type=resource_type)
+        response["Content-Length"] = str(length)
+        if status == 206:
+            response["Content-Range"] = "bytes %d-%d/%d"%(first, last, size)
+        response["Accept-Ranges"] = "bytes"
+    response["ETag"]          = etag
+    response["Last-Modified"] = last_mod
+    return response
+
+# End.
@@ -17,11 +17,16 @@ import logging
 log = logging.getLogger(__name__)
 
 # import collections
+import copy
+import json
+import threading
 
 from django.conf                        import settings
 
 from annalist.identifiers               import RDFS, ANNAL
 
+from annalist.models.collectiongeneration       import get_coll_config_generations
+
 from annalist.views.fields.field_description    import FieldDescription, field_description_from_view_field
 from annalist.views.form_utils.fieldrowvaluemap import FieldRowValueMap
 from annalist.views.form_utils.fieldvaluemap    import FieldValueMap
@@ -264,6 +269,18 @@ class FieldListValueMap(object):
             "FieldListValueMap.fm: %r\n"%(self.fm)
             )
 
+    def bind_context(self, coll, view_context):
+        """
+        Bind field descriptions to collection and view context used for rendering.
+
+        This is used with a copy of a compiled field list value map (see 
+        `get_field_list_value_map`) to replace values that depend on the view 
+        context, such as enumerated value choices.
+        """
+        for f in self.fm:
+            f.bind_context(coll, view_context)
+        return
+
     def map_entity_to_context(self, entityvals, context_extra_values=None):
         listcontext = []
         for f in self.fm:
@@ -306,4 +323,66 @@ class FieldListValueMap(object):
     def get_field_description(self):
         return None
 
+#   ----------------------------------------------------------------------------
+#
+#   Compiled value maps
+#
+#   ----------------------------------------------------------------------------
+
+compiledmaplock = threading.Lock()  # Interlocks access to compiled value maps
+compiledmaps    = {}                # Compiled value maps for each collection id:
+                                    # each entry is (config generations, {key: map})
+
+def get_compiled_value_map(coll, map_key, view_context, make_map):
+    """
+    Returns an entity value map entry bound to the supplied view context, using a
+    compiled value map saved in a cache for the current process where possible.
+
+    coll            is a collection from which data is being rendered.
+    map_key         is a key that identifies the value map in the collection, 
+                    which must determine the value map returned by `make_map`.
+    view_context    is a dictionary of additional values used when rendering the
+                    value map (see `FieldListValueMap`).
+    make_map        is a function that is called with no arguments to construct
+                    a value map, which must provide a `bind_context` method.
+
+    Compiled value maps, whose construction involves reading field definitions and 
+    building field descriptions and renderers for each field, are re-used until the
+    configuration of the collection, or a collection from which it inherits 
+    definitions, is updated.  A copy of the compiled value map is bound to the view
+    context supplied for each use.
+    """
+    coll_id     = coll.get_id()
+    generations = get_coll_config_generations(coll)
+    compiled    = None
+    with compiledmaplock:
+        cached = compiledmaps.get(coll_id, None)
+        if cached and any(generations) and (cached[0] == generations):
+            compiled = cached[1].get(map_key, None)
+    if compiled:
+        valuemap = copy.deepcopy(compiled)
+        valuemap.bind_context(coll, view_context)
+        return valuemap
+    valuemap = make_map()
+    if any(generations):
+        compiled = copy.deepcopy(valuemap)
+        with compiledmaplock:
+            cached = compiledmaps.get(coll_id, None)
+            if not (cached and (cached[0] == generations)):
+                cached = (generations, {})
+                compiledmaps[coll_id] = cached
+            cached[1][map_key] = compiled
+    return valuemap
+
+def get_field_list_value_map(c, coll, fields, view_context):
+    """
+    Returns a FieldListValueMap for a list of fields from a view or list description,
+    bound to the supplied view context (see `FieldListValueMap` for parameters),
+    using a compiled value map where possible (see `get_compiled_value_map`).
+    """
+    map_key = ("FieldListValueMap", c, json.dumps(fields, sort_keys=True, default=repr))
+    return get_compiled_value_map(coll, map_key, view_context,
+        lambda: FieldListValueMap(c, coll, fields, view_context)
+        )
+
 # End.
@@ -88,6 +88,16 @@ class FieldRowValueMap(object):
             "FieldRowValueMap.fd: %r\n"%(self.fd)
             )
 
+    def bind_context(self, coll, view_context):
+        """
+        Bind row and field descriptions to collection and view context used 
+        for rendering.
+        """
+        self.rd.bind_context(coll, view_context)
+        for f in self.fm:
+            f.bind_context(coll, view_context)
+        return
+
     def map_entity_to_context(self, entityvals, context_extra_values=None):
         """
         Add row of fields to display context.
@@ -60,6 +60,13 @@ class FieldValueMap(object):
             "FieldValueMap.i: %s\n"%(self.i)
             )
 
+    def bind_context(self, coll, view_context):
+        """
+        Bind field description to collection and view context used for rendering.
+        """
+        self.f.bind_context(coll, view_context)
+        return
+
     def map_entity_to_context(self, entityvals, context_extra_values=None):
         """
         Returns a bound_field, which is a dictionary-like of values to be added 
@@ -53,6 +53,15 @@ class RepeatValuesMap(FieldValueMap):
             "RepeatValuesMap.fieldlist: %r\n"%(self.fieldlist)
             )
 
+    def bind_context(self, coll, view_context):
+        """
+        Bind repeated field and field list descriptions to collection and view
+        context used for rendering (cf. FieldListValueMap).
+        """
+        super(RepeatValuesMap, self).bind_context(coll, view_context)
+        self.fieldlist.bind_context(coll, dict(view_context, group=self.f._field_desc))
+        return
+
     def map_form_to_entity(self, formvals, entityvals):
         # log.info(repr(formvals))
         prefix_template  = self.i+"__%d__"
@@ -15,15 +15,18 @@ log = logging.getLogger(__name__)
 import os
 import os.path
 import json
-import markdown
+import hashlib
 import traceback
 
 from django.http                    import HttpResponse
 from django.http                    import HttpResponseRedirect
+from django.http                    import StreamingHttpResponse
 from django.template                import loader
 from django.views                   import generic
 from django.views.decorators.csrf   import csrf_exempt
 from django.urls                    import resolve, reverse
+from django.utils.cache             import get_conditional_response
+from django.utils.http              import http_date
 from django.conf                    import settings
 
 import login.login_views
@@ -37,6 +40,7 @@ from annalist                       import layout
 from annalist                       import util
 from annalist.identifiers           import RDF, RDFS, ANNAL
 from annalist.models.site           import Site
+from annalist.models.collectiongeneration import get_coll_generation_inherited
 from annalist.models.annalistuser   import (
     AnnalistUser, 
     site_default_user_id, site_default_user_uri, 
@@ -45,6 +49,8 @@ from annalist.models.annalistuser   import (
     )
 
 from annalist.views.uri_builder     import uri_with_params, continuation_params, uri_params
+from annalist.views.fileresponse    import file_path_name, file_response
+from annalist.views.rendercache     import render_markdown, get_help_text
 
 #   -------------------------------------------------------------------------------------------
 #
@@ -189,6 +195,94 @@ class AnnalistGenericView(ContentNegotiationView):
         response.write(resource_file.read())
         return response
 
+    def resource_stream_response(self, resource_stream, resource_type, links={}):
+        """
+        Construct response containing body of referenced resource (or list),
+        returned incrementally from the supplied iterator over strings,
+        with supplied resource_type as its content_type
+        """
+        response = StreamingHttpResponse(resource_stream, content_type=resource_type)
+        response = self.add_link_header(response, links)
+        return response
+
+    def resource_file_response(self, resource_file, resource_type, links={}):
+        """
+        Construct response containing body of referenced resource, with supplied 
+        resource_type as its content_type.
+
+        If the resource is read from a file in the filesystem, the response supports
+        HTTP range requests and validators, and may be streamed from the file (see 
+        module `fileresponse`).  Otherwise, this is the same as `resource_response`.
+
+        The response takes responsibility for closing the supplied file object.
+        """
+        if file_path_name(resource_file) is None:
+            try:
+                response = self.resource_response(resource_file, resource_type, links=links)
+            finally:
+                resource_file.close()
+            return response
+        response = file_response(self.request, resource_file, resource_type)
+        response = self.add_link_header(response, links)
+        return response
+
+    # Conditional request support
+
+    def generated_validators(self, data_stat, coll, variant=None):
+        """
+        Returns validators for data that is generated from entity values and 
+        collection configuration (e.g. Turtle data or a rendered entity view), 
+        as a pair of values: a (weak) entity tag and a modification time in 
+        whole seconds since the epoch.
+
+        data_stat   is file status information (as returned by `os.stat`) for the 
+                    data file from which entity values are loaded.
+        coll        is the collection whose configuration is used to generate the data.
+        variant     if supplied, is a string that distinguishes different forms of
+                    the generated data (e.g. for different users).
+
+        The software version is also used to distinguish the entity tag, as this 
+        may affect how the data is generated.
+        """
+        generation = get_coll_generation_inherited(coll)
+        variant    = annalist.__version__ + " " + (variant or "")
+        etag_val   = "%x-%x-%x-%s"%(
+            data_stat.st_mtime_ns, data_stat.st_size, generation, 
+            hashlib.sha1(variant.encode("utf-8")).hexdigest()[:16]
+            )
+        mtime = max(data_stat.st_mtime_ns, generation) // (1000*1000*1000)
+        return ('W/"%s"'%(etag_val,), mtime)
+
+    def not_modified_response(self, validators):
+        """
+        Returns a "304 Not Modified" response if the conditional request headers 
+        (If-None-Match or If-Modified-Since) indicate that the client has a current 
+        copy of a resource with the supplied validators, otherwise None.
+
+        validators  is a pair of values: an entity tag and a modification time (or 
+                    None), or None if no validators are available.
+        """
+        if validators is None:
+            return None
+        etag, mtime = validators
+        response = get_conditional_response(self.request, etag=etag, last_modified=mtime)
+        if (response is None) or (response.status_code != 304):
+            return None
+        response["ETag"] = etag
+        return response
+
+    def add_validators(self, response, validators):
+        """
+        Add validator headers (ETag and Last-Modified) to a successful response, 
+        unless already present.
+        """
+        if validators and (response.status_code == 200) and not response.has_header("ETag"):
+            etag, mtime = validators
+            response["ETag"] = etag
+            if mtime is not None:
+                response["Last-Modified"] = http_date(mtime)
+        return response
+
     def continuation_next(self, request_dict={}, default_cont=None):
         """
         Returns a continuation URL to be used when returning from the current view,
@@ -509,15 +603,11 @@ class AnnalistGenericView(ContentNegotiationView):
         uri_param_val("error_message",   None)
         resultdata["annalist_version"] = annalist.__version__
         if 'help_filename' in resultdata:
-            help_filepath = os.path.join(
-                settings.SITE_SRC_ROOT, 
-                "annalist/views/help/%s.html"%resultdata['help_filename']
-                )
-            if os.path.isfile(help_filepath):
-                with open(help_filepath, "r") as helpfile:
-                    resultdata['help_text'] = helpfile.read()
+            help_text = get_help_text(resultdata['help_filename'])
+            if help_text is not None:
+                resultdata['help_text'] = help_text
         if 'help_markdown' in resultdata:
-            resultdata['help_text'] = markdown.markdown(resultdata['help_markdown'])
+            resultdata['help_text'] = render_markdown(resultdata['help_markdown'])
         template = loader.get_template(template_name)
         context  = resultdata
         # log.debug("render_html - data: %r"%(resultdata))
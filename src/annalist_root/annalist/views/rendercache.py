@@ -0,0 +1,139 @@
+from __future__ import unicode_literals
+from __future__ import absolute_import, division, print_function
+
+"""
+This module provides in-memory caches of rendered text used when displaying
+Annalist pages, so that the same content is not re-rendered for every request:
+
+-   HTML generated from Markdown text (e.g. Markdown fields and collection,
+    view and list descriptions used as help text).  HTML is saved using a key
+    that is a hash of the Markdown text, and when the cache size limit is
+    exceeded, the least recently used values are discarded.  The cache is not
+    used unless enabled by setting `MARKDOWN_CACHE_SIZE` to the maximum number
+    of characters to be saved.
+-   HTML for rows of entity lists (see `annalist.views.fields.render_repeatgroup`),
+    saved using a key that combines a hash of the entity values displayed with 
+    values that identify the list, the collection configuration and data, and
+    the request details that affect the HTML generated.  The cache is not used
+    unless enabled by setting `LIST_ROW_CACHE_SIZE` to the maximum number of
+    characters to be saved.
+-   Help text HTML files, which are read when the application starts (see
+    `annalist.apps`) and kept for the life of the server process.
+
+Rendered text caches are created using `annalist.models.sizedcache`.
+"""
+
+__author__      = "Graham Klyne (GK@ACM.ORG)"
+__copyright__   = "Copyright 2026, G. Klyne"
+__license__     = "MIT (http://opensource.org/licenses/MIT)"
+
+import logging
+log = logging.getLogger(__name__)
+
+import os
+import json
+import hashlib
+import threading
+
+import markdown
+
+from django.conf                        import settings
+
+from annalist.models.sizedcache         import SizedCache, get_sized_cache
+
+#   ===================================================================
+#
+#   Markdown rendering
+#
+#   ===================================================================
+
+def get_markdown_cache():
+    """
+    Returns the rendered Markdown cache, or None if cacheing of rendered
+    Markdown is not enabled.
+    """
+    return get_sized_cache("MARKDOWN_CACHE_SIZE", SizedCache)
+
+def render_markdown(textval):
+    """
+    Returns HTML generated from the supplied Markdown text, using a previously
+    rendered value if available.
+    """
+    cache = get_markdown_cache()
+    if cache is None:
+        return markdown.markdown(textval)
+    key     = hashlib.sha256(textval.encode("utf-8")).hexdigest()
+    htmlval = cache.get(key)
+    if htmlval is None:
+        htmlval = markdown.markdown(textval)
+        cache.set(key, htmlval)
+    return htmlval
+
+#   ===================================================================
+#
+#   List row rendering
+#
+#   ===================================================================
+
+def get_listrow_cache():
+    """
+    Returns the rendered list row cache, or None if cacheing of rendered list
+    rows is not enabled.
+    """
+    return get_sized_cache("LIST_ROW_CACHE_SIZE", SizedCache)
+
+def flush_listrow_cache():
+    """
+    Remove all values from the rendered list row cache.
+
+    Cached list rows depend on collection generation values, so this is needed 
+    only if these may be reset (e.g. when site data is replaced).
+    """
+    cache = get_listrow_cache()
+    if cache is not None:
+        cache.flush()
+    return
+
+def listrow_values_key(entityvals):
+    """
+    Returns a hash of the supplied entity values, for use in a rendered list row 
+    cache key.
+    """
+    entityjson = json.dumps(entityvals, sort_keys=True, default=repr)
+    return hashlib.sha256(entityjson.encode("utf-8")).hexdigest()
+
+#   ===================================================================
+#
+#   Help text files
+#
+#   ===================================================================
+
+helptextlock    = threading.Lock()  # Interlocks loading of help text files
+help_texts      = None              # Help text, keyed by help file name
+
+def load_help_texts():
+    """
+    Read help text HTML files, if not already loaded, and return a dictionary
+    of their contents keyed by help file name (without the ".html" extension).
+    """
+    global help_texts
+    with helptextlock:
+        if help_texts is None:
+            help_dir = os.path.join(settings.SITE_SRC_ROOT, "annalist/views/help")
+            texts    = {}
+            for fname in os.listdir(help_dir):
+                if fname.endswith(".html"):
+                    with open(os.path.join(help_dir, fname), "r") as helpfile:
+                        texts[fname[:-5]] = helpfile.read()
+            help_texts = texts
+        texts = help_texts      # Copy value while lock acquired
+    return texts
+
+def get_help_text(help_filename):
+    """
+    Returns help text HTML for the indicated help file name, or None if there
+    is no such help file.
+    """
+    return load_help_texts().get(help_filename, None)
+
+# End.
@@ -26,6 +26,7 @@ from annalist.models.entityresourceaccess import (
     )
 
 from annalist.views.displayinfo         import DisplayInfo
+from annalist.views.fileresponse        import file_validators
 from annalist.views.generic             import AnnalistGenericView
 
 class SiteResourceAccess(AnnalistGenericView):
@@ -67,6 +68,11 @@ class SiteResourceAccess(AnnalistGenericView):
                         }
                     )
                 )
+        # Respond to conditional request without reading resource
+        validators   = self.get_resource_validators(viewinfo.site, resource_info)
+        not_modified = self.not_modified_response(validators)
+        if not_modified:
+            return not_modified
         site_baseurl  = viewinfo.reqhost + self.get_site_base_url()
         resource_file, resource_type = get_resource_file(
             viewinfo.site, resource_info, site_baseurl
@@ -81,18 +87,34 @@ class SiteResourceAccess(AnnalistGenericView):
                 )
         # Return resource
         try:
-            response = self.resource_response(resource_file, resource_type)
+            response = self.resource_file_response(resource_file, resource_type)
+            response = self.add_validators(response, validators)
         except Exception as e:
             log.exception(str(e))
+            resource_file.close()
             response = self.error(
                 dict(self.error500values(),
                     message=str(e)+" - see server log for details"
                     )
                 )
-        finally:
-            resource_file.close()
         return response
 
+    def get_resource_validators(self, site, resource_info):
+        """
+        Returns validators for the indicated site resource, or None if the
+        resource is not present.
+        """
+        if "resource_access" in resource_info:
+            # Resource generated from site metadata
+            data_stat = site._stat()
+            if data_stat is None:
+                return None
+            return self.generated_validators(data_stat, site.site_data_collection())
+        resource_stat = site._stat(resource_info["resource_path"])
+        if resource_stat is None:
+            return None
+        return file_validators(resource_stat)
+
     def view_setup(self, request_dict):
         """
         Assemble display information for view request handler
@@ -101,6 +101,8 @@ def scope_params(*param_dicts, **param_dict):
     Preserves the following query params from original request:
         scope
         search
+        page_size
+        cursor
 
     Query parameters not preserved (among others):
         continuation_url
@@ -116,6 +118,8 @@ def scope_params(*param_dicts, **param_dict):
         { 'search':           uri_param_dict.get('search_for')       or 
                               uri_param_dict.get('search')           or None
         , 'scope':            uri_param_dict.get('scope')            or None
+        , 'page_size':        uri_param_dict.get('page_size')        or None
+        , 'cursor':           uri_param_dict.get('cursor')           or None
         })
 
 def _unused_scope_params_url(base_url, type=None):
@@ -139,6 +143,8 @@ def continuation_params(*param_dicts, **param_dict):
         , 'search':           uri_param_dict.get('search_for')       or 
                               uri_param_dict.get('search')           or None
         , 'scope':            uri_param_dict.get('scope')            or None
+        , 'page_size':        uri_param_dict.get('page_size')        or None
+        , 'cursor':           uri_param_dict.get('cursor')           or None
         })
 
 def continuation_params_url(base_url):
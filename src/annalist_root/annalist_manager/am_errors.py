@@ -51,5 +51,8 @@ AM_COPYENTITYFAIL   = 18        # Failed to copy entity
 AM_NOSERVERPIDFILE  = 19        # Could not find server PID file
 AM_PIDNOTFOUND      = 20        # Could not find process with PID
 AM_SERVERALREADYRUN = 21        # Server already run (saved PID found)
+AM_SEARCHINDEXFAIL  = 22        # Failed to rebuild collection search index
+AM_IMPORTFAIL       = 23        # Failed to import some or all entity data
+AM_EXPORTFAIL       = 24        # Failed to export entity data
 
 # End.
\ No newline at end of file
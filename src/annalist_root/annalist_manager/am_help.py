@@ -41,6 +41,9 @@ command_summary_help = ("\n"+
     "  %(prog)s migrationreport old_coll_id new_coll_id [ CONFIG ]\n"+
     "  %(prog)s migratecollection coll_id [ CONFIG ]\n"+
     "  %(prog)s migrateallcollections [ CONFIG ]\n"+
+    "  %(prog)s rebuildsearchindex [ coll_id ] [ CONFIG ]\n"+
+    "  %(prog)s importentities coll_id data_file [ CONFIG ]\n"+
+    "  %(prog)s exportcollection coll_id data_file [ base_url ] [ CONFIG ]\n"+
     "  %(prog)s runserver [ CONFIG ]\n"+
     "  %(prog)s stopserver [ CONFIG ]\n"+
     "  %(prog)s pidserver [ CONFIG ]\n"+
@@ -373,6 +376,51 @@ def am_help(options, progname):
             config_options_help+
             "\n"+
             "")
+    elif options.args[0].startswith("rebuilds"):
+        help_text = ("\n"+
+            "  %(prog)s rebuildsearchindex [ coll_id ] [ CONFIG ]\n"+
+            "\n"+
+            "This command rebuilds the full-text index used for list searches in\n"+
+            "collection 'coll_id', or in all collections if no collection is specified.\n"+
+            "The index is maintained as entities are updated, and is rebuilt when needed\n"+
+            "after a collection has been updated by other software.  This command should\n"+
+            "be used after collection data files have been edited or copied directly.\n"+
+            "\n"+
+            config_options_help+
+            "\n"+
+            "")
+    elif options.args[0].startswith("importe"):
+        help_text = ("\n"+
+            "  %(prog)s importentities coll_id data_file [ CONFIG ]\n"+
+            "\n"+
+            "This command creates or updates entities in collection 'coll_id' using\n"+
+            "entity descriptions read from 'data_file', which contains a JSON-LD array of\n"+
+            "entity descriptions, or newline-delimited JSON with one entity description\n"+
+            "per line.  Each entity description must include 'annal:type_id' and\n"+
+            "'annal:id' values.  The collection JSON-LD context is regenerated once, after\n"+
+            "all entities have been saved.\n"+
+            "\n"+
+            config_options_help+
+            "\n"+
+            "")
+    elif options.args[0].startswith("exportc"):
+        help_text = ("\n"+
+            "  %(prog)s exportcollection coll_id data_file [ base_url ] [ CONFIG ]\n"+
+            "\n"+
+            "This command writes data for all entities stored in collection 'coll_id' to\n"+
+            "'data_file', as N-Triples if the file name ends with '.nt', or as\n"+
+            "newline-delimited JSON-LD if the file name ends with '.ndjson' or '.jsonl'.\n"+
+            "Entities are read and written one at a time, so large collections can be\n"+
+            "exported.  Entity URLs are based on 'base_url', which is the URL of the\n"+
+            "Annalist site (default 'http://localhost:8000/annalist/').\n"+
+            "\n"+
+            "The same data can be obtained from a running Annalist server using the\n"+
+            "collection data URLs 'c/coll_id/d/entity_list.nt' and\n"+
+            "'c/coll_id/d/entity_list.ndjson'.\n"+
+            "\n"+
+            config_options_help+
+            "\n"+
+            "")
     elif options.args[0].startswith("runs"):
         help_text = ("\n"+
             "  %(prog)s runserver [ CONFIG ]\n"+
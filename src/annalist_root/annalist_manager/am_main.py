@@ -45,7 +45,8 @@ from .am_createuser         import (
     )
 from .am_managecollections  import (
     am_installcollection, am_copycollection,
-    am_migrationreport, am_migratecollection, am_migrateallcollections
+    am_migrationreport, am_migratecollection, am_migrateallcollections,
+    am_rebuildsearchindex, am_importentities, am_exportcollection
     )
 from .am_help               import am_help, command_summary_help
 
@@ -159,6 +160,12 @@ def run(userhome, userconfig, options, progname):
         return am_migratecollection(annroot, userhome, options)
     if options.command.startswith("migratea"):              # migrateallcollections
         return am_migrateallcollections(annroot, userhome, options)
+    if options.command.startswith("rebuilds"):              # rebuildsearchindex
+        return am_rebuildsearchindex(annroot, userhome, options)
+    if options.command.startswith("importe"):               # importentities
+        return am_importentities(annroot, userhome, options)
+    if options.command.startswith("exportc"):               # exportcollection
+        return am_exportcollection(annroot, userhome, options)
     if options.command.startswith("runs"):                  # runserver
         return am_runserver(annroot, userhome, options)
     if options.command.startswith("stop"):                  # stopserver
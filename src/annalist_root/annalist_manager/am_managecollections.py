@@ -16,6 +16,7 @@ import sys
 import logging
 import subprocess
 import importlib
+import io
 import shutil
 import datetime
 
@@ -33,7 +34,14 @@ from annalist.models.recordview     import RecordView
 from annalist.models.recordlist     import RecordList
 from annalist.models.recordfield    import RecordField
 from annalist.models.recordgroup    import RecordGroup
-from annalist.models.collectiondata import initialize_coll_data, copy_coll_data, migrate_coll_data
+from annalist.models.collectiondata import (
+    initialize_coll_data, copy_coll_data, migrate_coll_data,
+    read_entity_values, import_coll_entities, export_coll_entities
+    )
+from annalist.models.entityfinder   import EntityFinder
+from annalist.models.entityresourceaccess import (
+    ntriples_resource_stream, ndjson_resource_stream
+    )
 
 from .                              import am_errors
 from .am_settings                   import (
@@ -638,4 +646,161 @@ def am_migrateallcollections(annroot, userhome, options):
     print("Data migrations complete.")
     return status
 
+def am_rebuildsearchindex(annroot, userhome, options):
+    """
+    Rebuild full-text search index for a specified collection, or all collections
+
+        annalist_manager rebuildsearchindex [ coll_id ]
+
+    Reads every entity in a collection and records its values in the collection
+    search index used for list searches.  If no collection is specified, the search
+    indexes for all collections (including site data) are rebuilt.
+
+    annroot     is the root directory for the Annalist software installation.
+    userhome    is the home directory for the host system user issuing the command.
+    options     contains options parsed from the command line.
+
+    returns     0 if all is well, or a non-zero status code.
+                This value is intended to be used as an exit status code
+                for the calling program.
+    """
+    status, settings, site = get_settings_site(annroot, userhome, options)
+    if status != am_errors.AM_SUCCESS:
+        return status
+    coll_id = getarg(options.args, 0)
+    if coll_id:
+        coll  = Collection.load(site, coll_id)
+        if not (coll and coll.get_values()):
+            print("Collection not found: %s"%(coll_id), file=sys.stderr)
+            return am_errors.AM_NOCOLLECTION
+        colls = [coll]
+    else:
+        colls = site.collections()
+    for coll in colls:
+        print("Rebuild search index for collection '%s'"%(coll.get_id(),))
+        if not EntityFinder(coll).rebuild_search_index():
+            print("Failed to rebuild search index for collection '%s'"%(coll.get_id(),))
+            status = am_errors.AM_SEARCHINDEXFAIL
+    return status
+
+def am_importentities(annroot, userhome, options):
+    """
+    Import entity data into a specified collection
+
+        annalist_manager importentities coll_id data_file
+
+    Creates or updates collection entities described in a file containing a JSON-LD
+    array of entity descriptions, or newline-delimited JSON with one entity 
+    description per line.  Each entity description must include `annal:type_id`
+    and `annal:id` values.  Collection caches and the collection JSON-LD context 
+    are updated once, after all entities have been saved.
+
+    annroot     is the root directory for the Annalist software installation.
+    userhome    is the home directory for the host system user issuing the command.
+    options     contains options parsed from the command line.
+
+    returns     0 if all is well, or a non-zero status code.
+                This value is intended to be used as an exit status code
+                for the calling program.
+    """
+    status, settings, site = get_settings_site(annroot, userhome, options)
+    if status != am_errors.AM_SUCCESS:
+        return status
+    if len(options.args) > 2:
+        print(
+            "Unexpected arguments for %s: (%s)"%
+              (options.command, " ".join(options.args)), 
+            file=sys.stderr
+            )
+        return am_errors.AM_UNEXPECTEDARGS
+    coll_id   = getargvalue(getarg(options.args, 0), "Collection Id to import into: ")
+    coll      = Collection.load(site, coll_id)
+    if not (coll and coll.get_values()):
+        print("Collection not found: %s"%(coll_id), file=sys.stderr)
+        return am_errors.AM_NOCOLLECTION
+    data_file = getargvalue(getarg(options.args, 1), "Entity data file to import: ")
+    print("Importing entities to collection '%s' from '%s'"%(coll_id, data_file))
+    try:
+        with io.open(data_file, "rt", encoding="utf-8") as data_io:
+            count, errs = import_coll_entities(coll, read_entity_values(data_io))
+    except (IOError, OSError, ValueError) as e:
+        print("Failed to read entity data from %s (%s)"%(data_file, e), file=sys.stderr)
+        return am_errors.AM_IMPORTFAIL
+    for msg in errs:
+        print(msg)
+    print("Imported %d entities to collection '%s'"%(count, coll_id))
+    if errs:
+        status = am_errors.AM_IMPORTFAIL
+    return status
+
+# Export data formats, keyed by data file extension
+export_coll_streams = (
+    { ".nt":        ntriples_resource_stream
+    , ".ndjson":    ndjson_resource_stream
+    , ".jsonl":     ndjson_resource_stream
+    })
+
+def am_exportcollection(annroot, userhome, options):
+    """
+    Export entity data from a specified collection
+
+        annalist_manager exportcollection coll_id data_file [ base_url ]
+
+    Writes data for all entities stored in the collection to a file as N-Triples 
+    (if the file name ends with ".nt") or newline-delimited JSON-LD (if the file 
+    name ends with ".ndjson" or ".jsonl").  Entity data is read and written one 
+    entity at a time, so the complete collection data is not held in memory.
+    Entity URLs are based on 'base_url', which is the URL of the Annalist site.
+
+    annroot     is the root directory for the Annalist software installation.
+    userhome    is the home directory for the host system user issuing the command.
+    options     contains options parsed from the command line.
+
+    returns     0 if all is well, or a non-zero status code.
+                This value is intended to be used as an exit status code
+                for the calling program.
+    """
+    status, settings, site = get_settings_site(annroot, userhome, options)
+    if status != am_errors.AM_SUCCESS:
+        return status
+    if len(options.args) > 3:
+        print(
+            "Unexpected arguments for %s: (%s)"%
+              (options.command, " ".join(options.args)), 
+            file=sys.stderr
+            )
+        return am_errors.AM_UNEXPECTEDARGS
+    coll_id   = getargvalue(getarg(options.args, 0), "Collection Id to export: ")
+    coll      = Collection.load(site, coll_id)
+    if not (coll and coll.get_values()):
+        print("Collection not found: %s"%(coll_id), file=sys.stderr)
+        return am_errors.AM_NOCOLLECTION
+    data_file = getargvalue(getarg(options.args, 1), "Entity data file to export: ")
+    export_stream = export_coll_streams.get(os.path.splitext(data_file)[1], None)
+    if export_stream is None:
+        print(
+            "Export data file name must end with one of: %s"%
+              (", ".join(sorted(export_coll_streams)),), 
+            file=sys.stderr
+            )
+        return am_errors.AM_EXPORTFAIL
+    sitesettings = importlib.import_module(settings.modulename)
+    base_url  = (
+        getarg(options.args, 2) or 
+        "http://localhost:8000/%s/"%(sitesettings.ANNALIST_SITE_SEG,)
+        )
+    coll_baseurl = (
+        base_url.rstrip("/") + "/" + 
+        layout.SITE_COLL_VIEW%{ "id": coll_id } + layout.COLL_BASE_REF
+        )
+    print("Exporting entities from collection '%s' to '%s'"%(coll_id, data_file))
+    try:
+        with io.open(data_file, "wt", encoding="utf-8") as data_io:
+            for data in export_coll_entities(coll, coll_baseurl, export_stream):
+                data_io.write(data)
+    except (IOError, OSError) as e:
+        print("Failed to write entity data to %s (%s)"%(data_file, e), file=sys.stderr)
+        return am_errors.AM_EXPORTFAIL
+    return status
+
 # End.
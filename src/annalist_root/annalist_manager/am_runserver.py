@@ -76,7 +76,8 @@ def am_runserver(annroot, userhome, options):
     status = am_errors.AM_SUCCESS
     with ChangeCurrentDir(annroot):
         gunicorn_command = (
-            "gunicorn --workers=1 --threads=%d "%(sitesettings.SERVER_THREADS)+
+            "gunicorn --workers=%d "%(getattr(sitesettings, "SERVER_WORKERS", 1),)+
+            "    --threads=%d "%(sitesettings.SERVER_THREADS)+
             "    --bind=0.0.0.0:8000 "+
             "    --env DJANGO_SETTINGS_MODULE=%s "%(settings.modulename,)+
             "    --env ANNALIST_KEY=%s "%(sitesettings.SECRET_KEY,)+
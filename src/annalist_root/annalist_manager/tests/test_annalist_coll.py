@@ -15,15 +15,21 @@ log = logging.getLogger(__name__)
 import sys
 import os
 import io
+import json
+
+from rdflib                     import Graph, URIRef, Literal
 
 from utils.StdoutContext import SwitchStdout, SwitchStderr
 
 import annalist
+import annalist.layout
+from annalist.identifiers       import RDF, RDFS, ANNAL
 from annalist.util              import replacetree, removetree
 
 from annalist_manager.tests     import get_source_root
 from annalist_manager.tests     import test_annalist_base
 from annalist_manager.am_main   import runCommand
+from annalist_manager           import am_errors
 
 #   -----------------------------------------------------------------------------
 #
@@ -199,4 +205,127 @@ class AnnalistManagerCollTest(test_annalist_base.AnnalistManagerTestBase):
             )
         return
 
+    def test_rebuildsearchindex(self):
+        coll_id = "Resource_defs"
+        # Create source
+        self.installcoll(coll_id)
+        collexists = os.path.isdir(self.colldir(coll_id))
+        self.assertTrue(collexists, "%s created?"%coll_id)
+        # Now rebuild index
+        stdoutbuf  = io.StringIO()
+        with SwitchStdout(stdoutbuf):
+            status = runCommand(self.userhome, self.userconfig, 
+                [ "annalist-manager", "rebuildsearchindex"
+                , coll_id
+                , "--config=runtests"
+                ])
+        self.assertEqual(status, 0)
+        stdoutbuf.seek(0)
+        stdoutlines = stdoutbuf.read().split("\n")
+        self.assertEqual(
+            stdoutlines[0], 
+            "Rebuild search index for collection '%s'"%(coll_id,)
+            )
+        index_path = os.path.join(self.colldir(coll_id), annalist.layout.COLL_SEARCH_INDEX_FILE)
+        self.assertTrue(os.path.isfile(index_path), "%s search index created?"%coll_id)
+        return
+
+    def test_importentities(self):
+        coll_id = "Resource_defs"
+        self.installcoll(coll_id)
+        data_file = os.path.join(self.testhome, "importentities.ndjson")
+        with io.open(data_file, "wt", encoding="utf-8") as data_io:
+            for values in (
+                    { "annal:type_id": "_type",    "annal:id": "imptype", "rdfs:label": "Type" },
+                    { "annal:type_id": "imptype",  "annal:id": "imp1",    "rdfs:label": "Entity" },
+                    { "annal:type_id": "notype",   "annal:id": "imp2",    "rdfs:label": "Entity" }
+                    ):
+                data_io.write(json.dumps(values)+"\n")
+        stdoutbuf  = io.StringIO()
+        with SwitchStdout(stdoutbuf):
+            status = runCommand(self.userhome, self.userconfig, 
+                [ "annalist-manager", "importentities"
+                , coll_id, data_file
+                , "--config=runtests"
+                ])
+        os.remove(data_file)
+        self.assertEqual(status, am_errors.AM_IMPORTFAIL)   # Type 'notype' not defined
+        stdoutbuf.seek(0)
+        stdoutlines = stdoutbuf.read().split("\n")
+        self.assertEqual(
+            stdoutlines[0], 
+            "Importing entities to collection '%s' from '%s'"%(coll_id, data_file)
+            )
+        self.assertIn("type notype is not defined", stdoutlines[1])
+        self.assertEqual(
+            stdoutlines[2], 
+            "Imported 2 entities to collection '%s'"%(coll_id,)
+            )
+        entity_path = os.path.join(
+            self.colldir(coll_id), "d/imptype/imp1", annalist.layout.ENTITY_DATA_FILE
+            )
+        self.assertTrue(os.path.isfile(entity_path), "imptype/imp1 created?")
+        return
+
+    def exportcoll(self, coll_id, data_file, *args):
+        stdoutbuf  = io.StringIO()
+        stderrbuf  = io.StringIO()
+        with SwitchStdout(stdoutbuf), SwitchStderr(stderrbuf):
+            status = runCommand(self.userhome, self.userconfig, 
+                [ "annalist-manager", "exportcollection"
+                , coll_id, data_file
+                ] + list(args) +
+                [ "--config=runtests"
+                ])
+        return (status, stdoutbuf.getvalue(), stderrbuf.getvalue())
+
+    def test_exportcollection(self):
+        coll_id = "Resource_defs"
+        self.installcoll(coll_id)
+        coll_baseurl = "http://example.org/annalist/c/%s/d/"%(coll_id,)
+        field_uri    = URIRef(coll_baseurl+"_field/Linked_image")
+        # Export as N-Triples
+        data_file = os.path.join(self.testhome, "exportcollection.nt")
+        status, stdout, stderr = self.exportcoll(
+            coll_id, data_file, "http://example.org/annalist/"
+            )
+        self.assertEqual(status, am_errors.AM_SUCCESS)
+        self.assertEqual(
+            stdout, 
+            "Exporting entities from collection '%s' to '%s'\n"%(coll_id, data_file)
+            )
+        g = Graph()
+        g.parse(data_file, format="nt")
+        os.remove(data_file)
+        self.assertIn((field_uri, URIRef(RDF.URI.type), URIRef(ANNAL.URI.Field)), g)
+        self.assertIn((field_uri, URIRef(ANNAL.URI.id), Literal("Linked_image")), g)
+        self.assertNotIn(
+            (URIRef(coll_baseurl+"_field/Entity_id"), None, None), g
+            )   # Site data is not exported
+        # Export as newline-delimited JSON-LD
+        data_file = os.path.join(self.testhome, "exportcollection.ndjson")
+        status, stdout, stderr = self.exportcoll(
+            coll_id, data_file, "http://example.org/annalist/"
+            )
+        self.assertEqual(status, am_errors.AM_SUCCESS)
+        with io.open(data_file, "rt", encoding="utf-8") as data_io:
+            entities = [ json.loads(line) for line in data_io ]
+        os.remove(data_file)
+        self.assertEqual(
+            len(entities), len(set(g.subjects(URIRef(ANNAL.URI.id), None)))
+            )
+        field_values = [ e for e in entities if e["@id"] == "_field/Linked_image" ][0]
+        self.assertEqual(
+            field_values["@context"], 
+            [ { "@base": coll_baseurl }, coll_baseurl+annalist.layout.COLL_CONTEXT_FILE ]
+            )
+        self.assertEqual(field_values[ANNAL.CURIE.id], "Linked_image")
+        # Unrecognized export format
+        status, stdout, stderr = self.exportcoll(
+            coll_id, os.path.join(self.testhome, "exportcollection.txt")
+            )
+        self.assertEqual(status, am_errors.AM_EXPORTFAIL)
+        self.assertIn("Export data file name must end with one of", stderr)
+        return
+
 # End.
@@ -42,6 +42,52 @@ ERROR_LOG_FILE    = "annalist-wsgi-error.log"
 # This can be overridden by specific configuration settings files.
 SERVER_THREADS    = 2
 
+# Number of gunicorn server worker processes to use.
+# Per-process caches are kept consistent by checking collection configuration
+# generation files (see annalist.models.collectiongeneration).
+SERVER_WORKERS    = 1
+
+# Maximum memory (bytes) used to cache entity data values loaded from storage.
+# Zero disables the cache.  See annalist.models.entitydatacache.
+ENTITY_DATA_CACHE_SIZE = 0
+
+# Maximum memory (bytes) used to cache Turtle data generated from entity and 
+# list data.  Zero disables the cache.  See annalist.models.entityresourceaccess.
+TURTLE_DATA_CACHE_SIZE = 16*1024*1024
+
+# Maximum size (characters) of HTML generated from Markdown text that is cached
+# for re-use.  Zero disables the cache.  See annalist.views.rendercache.
+MARKDOWN_CACHE_SIZE = 4*1024*1024
+
+# Maximum size (characters) of HTML for entity list rows that is cached for 
+# re-use.  Zero disables the cache.  See annalist.views.rendercache.
+LIST_ROW_CACHE_SIZE = 8*1024*1024
+
+# Class used for per-collection caches of type, field and vocabulary data.
+# The default keeps cached values in memory in each server process.
+# "annalist.models.sqliteobjectcache.SqliteObjectCache" keeps cached values in
+# a database file (OBJECT_CACHE_PATH, default "objectcache.sqlite3" in the site
+# directory) that is shared by server processes and retained across restarts.
+OBJECT_CACHE_BACKEND = "annalist.models.objectcache.ObjectCache"
+OBJECT_CACHE_PATH    = None
+
+# If True, collection search indexes that are not up to date when a list search
+# is performed are rebuilt by a background thread;  the search itself scans the
+# collection entities.  See annalist.models.searchindex.
+SEARCH_INDEX_BACKGROUND_REBUILD = True
+
+# Resource files (e.g. uploaded images and audio) larger than this size (bytes) 
+# are streamed from the file rather than being read into memory.
+RESOURCE_STREAM_MIN_SIZE = 256*1024
+
+# Header used to delegate sending of resource files to a front-end web server,
+# or None to send files from Annalist.  "X-Sendfile" (e.g. Apache mod_xsendfile)
+# is given the file path.  "X-Accel-Redirect" (nginx) is given a URL path formed 
+# from RESOURCE_SENDFILE_PREFIX and the file path relative to BASE_SITE_DIR, 
+# which the front-end server must map to an internal location for the site data.
+RESOURCE_SENDFILE        = None
+RESOURCE_SENDFILE_PREFIX = "/annalist_site_data/"
+
 class RotatingNewFileHandler(logging.handlers.RotatingFileHandler):
     """
     Define a rotating file logging handler that additionally forces a new file 
@@ -55,6 +55,10 @@ TEST_BASE_URI       = TEST_HOST_URI+"/"+TEST_BASE_PATH
 # test, when trying to understand how values end up in a form.
 TRACE_FIELD_VALUE   = logging.DEBUG
 
+# Search indexes are rebuilt explicitly by tests, so that background threads 
+# do not access test data while it is being reset.
+SEARCH_INDEX_BACKGROUND_REBUILD = False
+
 # Override root URI configuration for tests
 ROOT_URLCONF    = 'annalist_site.runtests_urls'
 